@@ -0,0 +1,69 @@
+"""
+Measure the cost of importing hermes and check that heavy dependencies stay unloaded.
+
+Usage:
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --module hermes.cli --budget-ms 300 --runs 5
+
+Each run imports the module in a fresh interpreter with ``-X importtime``. The best
+run is reported together with the slowest imports. The script exits with status 1
+if the import takes longer than --budget-ms (default: 300 ms) or if any of the heavy modules
+(litellm, yt_dlp, sounddevice, ...) was imported eagerly.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ["litellm", "yt_dlp", "sounddevice", "pyperclip", "ffmpeg", "pydub", "numpy", "requests", "httpx"]
+
+def measure(module: str):
+    env = {**os.environ, "PYTHONPATH": ROOT}
+    # Config validation needs API keys; dummy values are enough for an import
+    env.setdefault("GROQ_API_KEY", "benchmark")
+    env.setdefault("OPENAI_API_KEY", "benchmark")
+    code = f"import sys, {module}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, env=env, cwd=ROOT, check=True,
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            imports.append((int(cumulative), name.rstrip()))
+    total = next((us for us, name in imports if name.strip() == module), 0)
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return total, imports, loaded
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="hermes", help="Module to import (default: hermes)")
+    parser.add_argument("--runs", type=int, default=3, help="Number of runs (the best run is reported)")
+    parser.add_argument("--budget-ms", type=float, default=300.0, help="Fail if the import takes longer than this (default: 300)")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to show")
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(args.runs)]
+    total, imports, loaded = min(runs, key=lambda run: run[0])
+
+    print(f"import {args.module}: {total / 1000:.1f} ms (best of {args.runs})")
+    print(f"{'cumulative ms':>13}  module")
+    for us, name in sorted(imports, reverse=True)[:args.top]:
+        print(f"{us / 1000:>13.1f}  {name}")
+
+    failed = False
+    if loaded:
+        print(f"Heavy modules imported eagerly: {', '.join(loaded)}")
+        failed = True
+    if total / 1000 > args.budget_ms:
+        print(f"Import time exceeds the budget of {args.budget_ms:.0f} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compare CPU time per minute of audio for the old MP3 round-trip source paths and the direct path.
+
+Usage:
+    python benchmarks/bench_source_decode.py path/to/media.webm
+    python benchmarks/bench_source_decode.py https://www.youtube.com/watch?v=PNulbFECY-I --runs 3
+
+A YouTube URL is downloaded once (native bestaudio, not timed); a local file stands in
+for a web or clipboard download. Each path is then timed from the downloaded media to
+the WAV handed to the provider's upload encoder, counting the CPU time of this process
+and of the ffmpeg processes it spawns:
+
+    youtube (old)  yt-dlp MP3 192k transcode -> pydub decode -> MP3 export -> decode for upload
+    web (old)      pydub MP3 decode -> MP3 export -> decode for upload
+    direct (new)   one ffmpeg decode of the native stream to 16 kHz mono WAV
+"""
+import argparse
+import io
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hermes.utils.audio import decode_to_wav, convert_to_wav, estimate_audio_duration, fetch_youtube_audio, ffmpeg, pydub
+from hermes.strategies.source.auto import AutoSourceStrategy
+
+def cpu_time() -> float:
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+def youtube_old(path: str) -> bytes:
+    mp3_path = path + ".mp3"
+    ffmpeg.input(path).output(mp3_path, acodec="libmp3lame", audio_bitrate="192k").global_args("-loglevel", "error", "-y").run()
+    try:
+        return web_old(mp3_path)
+    finally:
+        os.remove(mp3_path)
+
+def web_old(path: str) -> bytes:
+    audio = pydub.AudioSegment.from_file(path)
+    mp3 = audio.export(format="mp3").read()
+    return convert_to_wav(pydub.AudioSegment.from_file(io.BytesIO(mp3), format="mp3"))
+
+def direct(path: str) -> bytes:
+    return decode_to_wav(path)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="Local media file or YouTube URL")
+    parser.add_argument("--runs", type=int, default=1, help="Number of runs per path (the best run is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="hermes-bench-") as directory:
+        if AutoSourceStrategy.is_youtube_url(args.source):
+            path = fetch_youtube_audio(args.source, directory)
+            paths = [("youtube (old)", youtube_old), ("direct (new)", direct)]
+        else:
+            path = args.source
+            paths = [("web (old)", web_old), ("direct (new)", direct)]
+
+        minutes = estimate_audio_duration(direct(path)) / 60
+        print(f"Media: {os.path.basename(path)}, {minutes:.1f} min of audio")
+        print(f"{'path':<14} {'cpu s':>8} {'wall s':>8} {'cpu s/min':>10}")
+        for name, run in paths:
+            best_cpu = best_wall = None
+            for _ in range(args.runs):
+                cpu_start, wall_start = cpu_time(), time.perf_counter()
+                run(path)
+                cpu, wall = cpu_time() - cpu_start, time.perf_counter() - wall_start
+                best_cpu = cpu if best_cpu is None else min(best_cpu, cpu)
+                best_wall = wall if best_wall is None else min(best_wall, wall)
+            print(f"{name:<14} {best_cpu:>8.2f} {best_wall:>8.2f} {best_cpu / minutes:>10.2f}")
+
+if __name__ == "__main__":
+    main()
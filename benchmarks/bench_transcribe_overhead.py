@@ -0,0 +1,64 @@
+"""
+Measure the per-call overhead of the transcribe() convenience function.
+
+Usage:
+    python benchmarks/bench_transcribe_overhead.py
+    python benchmarks/bench_transcribe_overhead.py --calls 2000 --provider openai
+
+Every call is a cache hit, so no audio is fetched and nothing is sent to a provider;
+what is left is the cost of building the configuration, the Hermes instance (strategies,
+HTTP session, cache handle) and the cache lookup. "fresh" builds a new instance per call,
+as transcribe() used to; "reused" goes through transcribe(), which now reuses the
+instance created for the same effective configuration.
+
+The benchmark runs against a temporary home directory with dummy API keys.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=500, help="Number of calls per variant")
+    parser.add_argument("-p", "--provider", default="groq", choices=["groq", "openai"], help="Provider to configure")
+    parser.add_argument("--backend", default="file", choices=["file", "sqlite"], help="Cache backend")
+    args = parser.parse_args()
+
+    home = tempfile.mkdtemp(prefix="hermes-bench-")
+    os.environ["HOME"] = home
+    os.makedirs(os.path.join(home, ".hermes"))
+    with open(os.path.join(home, ".hermes", "config.yml"), "w") as f:
+        f.write(f"cache:\n  backend: {args.backend}\n")
+    os.environ.setdefault("GROQ_API_KEY", "benchmark")
+    os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+    from hermes.core import Hermes, build_config, transcribe
+
+    source = "https://example.com/benchmark.mp3"
+    config = build_config(args.provider)
+    hermes = Hermes(config)
+    params = {'response_format': 'text', **config['transcription']}
+    cache_key, _, _ = hermes._resolve_cache_key(source, params, fetch=False)
+    hermes.cache.set(cache_key, {"source": source, "provider": "benchmark", "transcription": "cached"})
+
+    def fresh():
+        return Hermes.from_config(build_config(args.provider)).transcribe(source, response_format="text")
+
+    def reused():
+        return transcribe(source, provider=args.provider)
+
+    print(f"{'variant':<8} {'calls':>6} {'per call us':>12}")
+    for name, call in [("fresh", fresh), ("reused", reused)]:
+        assert call()["transcription"] == "cached"
+        start = time.perf_counter()
+        for _ in range(args.calls):
+            call()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<8} {args.calls:>6} {elapsed / args.calls * 1e6:>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Compare upload codecs: bytes sent to the provider and end-to-end latency vs. WAV.
+
+Usage:
+    python benchmarks/bench_upload_codecs.py path/to/media.mp4
+    python benchmarks/bench_upload_codecs.py path/to/media.mp4 --provider groq --runs 3
+
+Without --provider only the encoding step is measured (no network, no API key needed).
+With --provider every codec is also uploaded and transcribed, and the reported latency
+covers encode + upload + transcription.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hermes.utils.audio import decode_to_wav, encode_for_upload, estimate_audio_duration, UPLOAD_CODECS
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="Local audio or video file")
+    parser.add_argument("-p", "--provider", choices=["groq", "openai"], help="Also upload to this provider and time the transcription")
+    parser.add_argument("-m", "--model", help="Model to use for transcription")
+    parser.add_argument("--runs", type=int, default=1, help="Number of runs per codec (the best run is reported)")
+    args = parser.parse_args()
+
+    wav = decode_to_wav(args.source)
+    duration = estimate_audio_duration(wav)
+    print(f"Audio duration: {duration:.1f} s")
+
+    provider = None
+    if args.provider:
+        from hermes.strategies.provider import ProviderStrategy
+        provider = ProviderStrategy.get_strategy(args.provider)
+    params = {"model": args.model} if args.model else {}
+
+    print(f"{'codec':<6} {'bytes':>12} {'vs wav':>7} {'MB/min':>7} {'encode s':>9} {'total s':>8}")
+    for codec in ["wav", *UPLOAD_CODECS]:
+        best_encode = best_total = None
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            encoded = encode_for_upload(wav, codec)
+            encode_time = time.perf_counter() - start
+            if provider:
+                provider.transcribe(encoded, params)
+            total_time = time.perf_counter() - start
+            best_encode = encode_time if best_encode is None else min(best_encode, encode_time)
+            best_total = total_time if best_total is None else min(best_total, total_time)
+
+        total = f"{best_total:8.2f}" if provider else f"{'-':>8}"
+        print(f"{codec:<6} {len(encoded):>12,} {len(encoded) / len(wav):>6.0%} "
+              f"{len(encoded) / 1e6 / (duration / 60):>7.2f} {best_encode:>9.2f} {total}")
+
+if __name__ == "__main__":
+    main()
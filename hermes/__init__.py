@@ -1,13 +1,19 @@
-from .core import Hermes, transcribe
-from .config import CONFIG
-from .strategies.source import SourceStrategy
-from .strategies.provider import ProviderStrategy
-from .utils.cache import Cache
-from .utils.llm import LLMProcessor
-from .cli import main as cli_main
+import importlib
 
 __version__ = "0.1.0"
 
+# Public names and the modules they live in. They are resolved on first access so
+# that `import hermes` does not pull in providers, audio tooling or LLM clients.
+_EXPORTS = {
+    "Hermes": "hermes.core",
+    "transcribe": "hermes.core",
+    "CONFIG": "hermes.config",
+    "SourceStrategy": "hermes.strategies.source",
+    "ProviderStrategy": "hermes.strategies.provider",
+    "Cache": "hermes.utils.cache",
+    "LLMProcessor": "hermes.utils.llm",
+}
+
 __all__ = [
     "Hermes",
     "transcribe",
@@ -17,3 +23,16 @@ __all__ = [
     "Cache",
     "LLMProcessor",
 ]
+
+def __getattr__(name):
+    if name == "cli_main":
+        from .cli import main as cli_main
+        return cli_main
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module 'hermes' has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS) + ["cli_main"])
@@ -1,17 +1,29 @@
 import argparse
+import json
+import os
 import sys
 from typing import List
-from hermes.core import Hermes, transcribe
+from hermes.config import get_config
+from hermes.core import Hermes, transcribe, build_config
+from hermes.utils.audio import convert_to_wav, load_audio_bytes
+from hermes.utils.realtime import AudioCapture, MicrophoneCapture, SyntheticCapture
+from hermes.utils.transcript import Segment, format_timestamp
+from hermes.worker import get_queue, run_workers
 
 def parse_args(args: List[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Hermes Video Transcription Tool")
     parser.add_argument("source", help="Source file, URL, or 'mic' for microphone input")
-    parser.add_argument("-p", "--provider", choices=["groq", "openai", "mlx"], default="groq", help="Transcription provider")
+    parser.add_argument("-p", "--provider", choices=["groq", "openai", "mlx", "local"], default="groq", help="Transcription provider")
     parser.add_argument("-m", "--model", help="Model to use for transcription")
     parser.add_argument("-o", "--output", help="Output file path")
     parser.add_argument("-f", "--force", action="store_true", help="Force transcription even if cached")
     parser.add_argument("--response_format", choices=["json", "text", "srt", "verbose_json", "vtt"], default="text", help="Response format")
     parser.add_argument("--llm_prompt", help="Prompt for LLM processing of transcription")
+    parser.add_argument("--chunk_length", type=float, help="Split audio into chunks of this many seconds and transcribe them in parallel")
+    parser.add_argument("--max_workers", type=int, help="Maximum number of chunks transcribed concurrently")
+    parser.add_argument("--stream", action="store_true", help="Print segments as soon as each chunk is transcribed")
+    parser.add_argument("--live", action="store_true", help="Transcribe while recording from the microphone ('mic'), or replay another source in real time; stop with Ctrl-C")
+    parser.add_argument("--cache_stats", action="store_true", help="Print cache hit/miss counters to stderr when done")
     
     # Parse known args first
     known_args, unknown_args = parser.parse_known_args(args)
@@ -26,8 +38,239 @@ def parse_args(args: List[str]) -> argparse.Namespace:
     
     return known_args, extra_args
 
+def parse_batch_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="hermes batch", description="Transcribe every file in a directory or every source listed in a file")
+    parser.add_argument("sources", help="Directory of media files, or a text file with one path or URL per line")
+    parser.add_argument("-p", "--provider", choices=["groq", "openai", "mlx", "local"], default="groq", help="Transcription provider")
+    parser.add_argument("-m", "--model", help="Model to use for transcription")
+    parser.add_argument("-o", "--output", help="Output JSONL file path (default: stdout)")
+    parser.add_argument("-f", "--force", action="store_true", help="Force transcription even if cached")
+    parser.add_argument("--response_format", choices=["json", "text", "srt", "verbose_json", "vtt"], default="text", help="Response format")
+    parser.add_argument("--max_workers", type=int, default=4, help="Number of concurrent downloads/decodes and uploads")
+    return parser.parse_args(args)
+
+def collect_sources(path: str) -> List[str]:
+    """
+    Expand a batch argument into a list of sources.
+
+    :param path: A directory (all files below it, sorted) or a list file (one source per line, '#' comments allowed)
+    :return: List of sources
+    """
+    if os.path.isdir(path):
+        return sorted(
+            os.path.join(root, name)
+            for root, _, names in os.walk(path)
+            for name in names
+            if not name.startswith('.')
+        )
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+
+def batch_main(args: List[str]):
+    batch_args = parse_batch_args(args)
+
+    try:
+        sources = collect_sources(batch_args.sources)
+        hermes = Hermes.from_config(build_config(batch_args.provider, batch_args.model))
+        output = open(batch_args.output, 'w') if batch_args.output else sys.stdout
+        failures = 0
+        try:
+            for result in hermes.transcribe_batch(sources, max_workers=batch_args.max_workers, force=batch_args.force, response_format=batch_args.response_format):
+                failures += 'error' in result
+                output.write(json.dumps(result, default=str) + "\n")
+                output.flush()
+        finally:
+            if output is not sys.stdout:
+                output.close()
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Transcribed {len(sources) - failures}/{len(sources)} sources", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+def parse_worker_args(args: List[str]) -> argparse.Namespace:
+    worker = get_config().get('worker') or {}
+    parser = argparse.ArgumentParser(prog="hermes worker", description="Process transcription jobs from the job queue")
+    parser.add_argument("--queue", default=worker.get('queue'), help="Path to the job queue database")
+    parser.add_argument("--processes", type=int, default=worker.get('processes', 1), help="Number of worker processes")
+    parser.add_argument("--threads", type=int, default=worker.get('threads', 4), help="Number of jobs processed concurrently by each process")
+    parser.add_argument("--lease_seconds", type=float, default=worker.get('lease_seconds', 300), help="How long a claimed job is reserved before another worker may take it over")
+    parser.add_argument("--poll_interval", type=float, default=worker.get('poll_interval', 1.0), help="Seconds between polls of an empty queue")
+    parser.add_argument("--burst", action="store_true", help="Exit once no job is queued, waiting for a retry or running")
+    return parser.parse_args(args)
+
+def parse_enqueue_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="hermes enqueue", description="Add transcription jobs to the job queue")
+    parser.add_argument("sources", nargs="+", help="Sources to transcribe; a directory or a list file (with --list) adds every source in it")
+    parser.add_argument("--list", action="store_true", help="Treat each argument as a directory or a file with one source per line")
+    parser.add_argument("--queue", help="Path to the job queue database (default: worker.queue)")
+    parser.add_argument("-p", "--provider", choices=["groq", "openai", "mlx", "local"], help="Transcription provider")
+    parser.add_argument("-m", "--model", help="Model to use for transcription")
+    parser.add_argument("-f", "--force", action="store_true", help="Force transcription even if cached")
+    parser.add_argument("--response_format", choices=["json", "text", "srt", "verbose_json", "vtt"], help="Response format")
+    parser.add_argument("--llm_prompt", help="Prompt for LLM processing of transcription")
+    parser.add_argument("--chunk_length", type=float, help="Split audio into chunks of this many seconds and transcribe them in parallel")
+    parser.add_argument("--max_attempts", type=int, help="Number of attempts before a job fails")
+    return parser.parse_args(args)
+
+def parse_jobs_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="hermes jobs", description="Show jobs of the job queue as JSON lines")
+    parser.add_argument("ids", nargs="*", type=int, help="Job ids (default: the most recent jobs)")
+    parser.add_argument("--queue", help="Path to the job queue database (default: worker.queue)")
+    parser.add_argument("--status", choices=["queued", "running", "done", "failed"], help="Only show jobs with this status")
+    parser.add_argument("--limit", type=int, default=100, help="Maximum number of jobs to show")
+    return parser.parse_args(args)
+
+def open_queue(path: str = None):
+    config = get_config({'worker': {'queue': os.path.expanduser(path)}}) if path else get_config()
+    return get_queue(config)
+
+def worker_main(args: List[str]):
+    worker_args = parse_worker_args(args)
+    try:
+        run_workers(
+            worker_args.queue,
+            processes=worker_args.processes,
+            threads=worker_args.threads,
+            lease_seconds=worker_args.lease_seconds,
+            poll_interval=worker_args.poll_interval,
+            burst=worker_args.burst,
+        )
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+def enqueue_main(args: List[str]):
+    enqueue_args = parse_enqueue_args(args)
+    options = {
+        name: getattr(enqueue_args, name)
+        for name in ("provider", "model", "response_format", "llm_prompt", "chunk_length")
+        if getattr(enqueue_args, name) is not None
+    }
+    if enqueue_args.force:
+        options['force'] = True
+
+    try:
+        queue = open_queue(enqueue_args.queue)
+        sources = enqueue_args.sources
+        if enqueue_args.list:
+            sources = [source for path in sources for source in collect_sources(path)]
+        for source in sources:
+            job_id = queue.enqueue(source, options, max_attempts=enqueue_args.max_attempts)
+            print(json.dumps({"id": job_id, "source": source}))
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+def jobs_main(args: List[str]):
+    jobs_args = parse_jobs_args(args)
+    try:
+        queue = open_queue(jobs_args.queue)
+        jobs = [queue.get(job_id) for job_id in jobs_args.ids] if jobs_args.ids else queue.list(jobs_args.status, jobs_args.limit)
+        for job in jobs:
+            if job is not None:
+                print(json.dumps(job, default=str))
+        print(json.dumps(queue.stats()), file=sys.stderr)
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+def chunking_args(known_args: argparse.Namespace) -> dict:
+    args = {}
+    if known_args.chunk_length:
+        args['chunk_length'] = known_args.chunk_length
+    if known_args.max_workers:
+        args['max_workers'] = known_args.max_workers
+    return args
+
+def format_segment(segment: Segment, response_format: str, index: int) -> str:
+    """
+    Format one streamed segment for incremental output.
+
+    :param segment: The segment to format
+    :param response_format: srt and vtt print cues, json and verbose_json print one JSON object per line, text prints timestamped lines
+    :param index: 1-based position of the segment in the stream
+    :return: The formatted segment, including its trailing newline(s)
+    """
+    if response_format == "srt":
+        return f"{index}\n{format_timestamp(segment.start)} --> {format_timestamp(segment.end)}\n{segment.text}\n\n"
+    if response_format == "vtt":
+        header = "WEBVTT\n\n" if index == 1 else ""
+        return f"{header}{format_timestamp(segment.start, '.')} --> {format_timestamp(segment.end, '.')}\n{segment.text}\n\n"
+    if response_format in ("json", "verbose_json"):
+        return json.dumps(segment.to_dict()) + "\n"
+    return f"[{format_timestamp(segment.start, '.')} --> {format_timestamp(segment.end, '.')}] {segment.text}\n"
+
+def live_capture(hermes: Hermes, source: str) -> AudioCapture:
+    if source in ("mic", "microphone"):
+        return MicrophoneCapture()
+    audio_data = hermes.source_strategy.get_audio(source)
+    if audio_data[:4] != b"RIFF":
+        audio_data = convert_to_wav(load_audio_bytes(audio_data))
+    return SyntheticCapture.from_wav(audio_data, realtime=True)
+
+def stream_main(known_args: argparse.Namespace, extra_args: dict):
+    hermes = Hermes.from_config(build_config(known_args.provider, known_args.model), reuse=True)
+    output = open(known_args.output, 'w') if known_args.output else sys.stdout
+    job = hermes.llm_processor.map_reduce(known_args.llm_prompt) if known_args.llm_prompt else None
+    segments = None
+    try:
+        if known_args.live:
+            segments = hermes.transcribe_live(live_capture(hermes, known_args.source), max_workers=known_args.max_workers, **extra_args)
+        else:
+            segments = hermes.transcribe_stream(
+                known_args.source,
+                force=known_args.force,
+                chunk_length=known_args.chunk_length,
+                max_workers=known_args.max_workers,
+                **extra_args
+            )
+        for index, segment in enumerate(segments, start=1):
+            output.write(format_segment(segment, known_args.response_format, index))
+            output.flush()
+            if job is not None:
+                # Chunks of text are sent to the LLM while the rest is transcribed
+                job.feed(segment.text)
+    except KeyboardInterrupt:
+        # Ctrl-C ends a live session; keep what was transcribed so far
+        if segments is not None:
+            segments.close()
+    except BaseException:
+        if job is not None:
+            job.close()
+        raise
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    if known_args.output:
+        print(f"Transcription saved to {known_args.output}")
+    if job is not None:
+        print("\nLLM Processed Result:")
+        print(job.result())
+    if known_args.cache_stats:
+        print(json.dumps(hermes.cache_stats()), file=sys.stderr)
+
 def main():
+    if sys.argv[1:2] == ["batch"]:
+        return batch_main(sys.argv[2:])
+    if sys.argv[1:2] == ["worker"]:
+        return worker_main(sys.argv[2:])
+    if sys.argv[1:2] == ["enqueue"]:
+        return enqueue_main(sys.argv[2:])
+    if sys.argv[1:2] == ["jobs"]:
+        return jobs_main(sys.argv[2:])
+
     known_args, extra_args = parse_args(sys.argv[1:])
+
+    if known_args.stream or known_args.live:
+        try:
+            return stream_main(known_args, extra_args)
+        except Exception as e:
+            print(f"Error: {str(e)}", file=sys.stderr)
+            sys.exit(1)
     
     try:
         result = transcribe(
@@ -37,6 +280,7 @@ def main():
             llm_prompt=known_args.llm_prompt,
             model=known_args.model,
             response_format=known_args.response_format,
+            **chunking_args(known_args),
             **extra_args
         )
         
@@ -50,6 +294,11 @@ def main():
         if 'llm_processed' in result:
             print("\nLLM Processed Result:")
             print(result['llm_processed'])
+
+        if known_args.cache_stats:
+            # transcribe() reuses the instance registered for this configuration
+            hermes = Hermes.from_config(build_config(known_args.provider, known_args.model, **chunking_args(known_args)), reuse=True)
+            print(json.dumps(hermes.cache_stats()), file=sys.stderr)
     
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
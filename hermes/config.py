@@ -1,12 +1,18 @@
 import os
+import copy
+import threading
 import yaml
-from typing import Dict, Any
+from collections.abc import Mapping
+from typing import Dict, Any, Iterator, Optional
 
 DEFAULT_CONFIG = {
     'llm': {
         'provider': 'groq',
         'model': 'llama-3.1-8b-instant',
         'api_key': None,
+        'chunk_tokens': 6000,
+        'max_workers': 4,
+        'batch_size': 16,
     },
     'transcription': {
         'provider': 'groq',
@@ -16,38 +22,202 @@ DEFAULT_CONFIG = {
     'cache': {
         'enabled': True,
         'directory': '~/.hermes/cache',
+        'key_mode': 'source',
+        'backend': 'file',
+        'max_entries': None,
+        'max_bytes': None,
+        'ttl': None,
+        'touch_interval': 60,
+        'memory': {
+            'enabled': False,
+            'max_entries': 1024,
+            'max_bytes': 64 * 1024 * 1024,
+        },
+    },
+    'media_cache': {
+        'enabled': True,
+        'directory': '~/.hermes/media',
+        'max_bytes': 2 * 1024 * 1024 * 1024,
+    },
+    'chunking': {
+        'enabled': False,
+        'chunk_length': 600,
+        'max_workers': 4,
+        'min_silence_len': 500,
+        'silence_thresh': None,
+    },
+    'streaming': {
+        'chunk_length': 30,
+        'max_workers': 4,
+    },
+    'live': {
+        'frame_ms': 30,
+        'energy_threshold': None,
+        'min_silence_ms': 500,
+        'min_window': 2.0,
+        'max_window': 15.0,
+        'padding_ms': 200,
+        'max_workers': 2,
+    },
+    'vad': {
+        'enabled': False,
+        'frame_ms': 30,
+        'energy_threshold': None,
+        'min_silence_ms': 1000,
+        'padding_ms': 200,
+    },
+    'upload_codecs': {
+        'groq': 'flac',
+        'openai': 'flac',
+        'mlx': 'wav',
+        'local': 'wav',
+    },
+    'rate_limits': {
+        'groq': {'requests_per_minute': None, 'audio_seconds_per_hour': None},
+        'openai': {'requests_per_minute': None, 'audio_seconds_per_hour': None},
+        'groq_llm': {'requests_per_minute': None},
+        'openai_llm': {'requests_per_minute': None},
+    },
+    'retry': {
+        'max_retries': 5,
+        'base_delay': 1.0,
+        'max_delay': 60.0,
+    },
+    'download': {
+        'chunk_size': 1048576,
+        'segments': 1,
+        'min_parallel_size': 33554432,
+        'timeout': 60,
+    },
+    'worker': {
+        'queue': '~/.hermes/queue.sqlite3',
+        'processes': 1,
+        'threads': 4,
+        'lease_seconds': 300,
+        'poll_interval': 1.0,
+        'max_attempts': 3,
+    },
+    'mlx': {
+        'mode': 'auto',
+    },
+    'local': {
+        'device': 'cpu',
+        'compute_type': 'int8',
+        'cpu_threads': None,
+        'num_workers': 1,
+        'beam_size': 5,
+        'download_root': None,
     },
     'source_type': 'auto',
 }
 
-def load_config() -> Dict[str, Any]:
+def merge_config(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Recursively merge ``overrides`` into a copy of ``base``.
+
+    :param base: The configuration to start from (left unchanged)
+    :param overrides: Values to apply on top; nested dictionaries are merged key by key
+    :return: The merged configuration
+    """
+    merged = copy.deepcopy(base)
+    for key, value in (overrides or {}).items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_config(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+def load_config(overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Build the configuration from the defaults, ~/.hermes/config.yml and ``overrides``.
+
+    API keys missing from the file are taken from the environment, but nothing is
+    validated here; see ``require_api_key``.
+
+    :param overrides: Values applied on top of the user configuration
+    :return: The configuration dictionary
+    """
     config_path = os.path.expanduser('~/.hermes/config.yml')
     if os.path.exists(config_path):
         with open(config_path, 'r') as f:
-            user_config = yaml.safe_load(f)
+            user_config = yaml.safe_load(f) or {}
     else:
         user_config = {}
 
     # Merge user config with default config
-    config = {**DEFAULT_CONFIG, **user_config}
+    config = merge_config(merge_config(DEFAULT_CONFIG, user_config), overrides)
 
-    # Handle API keys
+    # If API key is not in config, try to get it from environment
     for service in ['llm', 'transcription']:
-        provider = config[service]['provider']
-        env_var = f"{provider.upper()}_API_KEY"
-        
-        # If API key is not in config, try to get it from environment
-        if not config[service]['api_key']:
-            config[service]['api_key'] = os.getenv(env_var)
-        
-        # If still no API key, raise an error
-        if not config[service]['api_key']:
-            raise ValueError(f"No API key found for {provider} in config or environment variable {env_var}. "
-                             f"Please set it in your config file or as an environment variable.")
-
-    # Expand user directory for cache
+        if not config[service].get('api_key'):
+            config[service]['api_key'] = os.getenv(f"{config[service]['provider'].upper()}_API_KEY")
+
+    # Expand user directories for the caches and the job queue
     config['cache']['directory'] = os.path.expanduser(config['cache']['directory'])
+    config['media_cache']['directory'] = os.path.expanduser(config['media_cache']['directory'])
+    config['worker']['queue'] = os.path.expanduser(config['worker']['queue'])
 
     return config
 
-CONFIG = load_config()
\ No newline at end of file
+def require_api_key(config: Dict[str, Any], service: str) -> str:
+    """
+    Get the API key of a subsystem, failing if none is configured.
+
+    :param config: The configuration dictionary
+    :param service: The subsystem, 'llm' or 'transcription'
+    :return: The API key
+    """
+    provider = config[service]['provider']
+    api_key = config[service].get('api_key')
+    if not api_key:
+        env_var = f"{provider.upper()}_API_KEY"
+        raise ValueError(f"No API key found for {provider} in config or environment variable {env_var}. "
+                         f"Please set it in your config file or as an environment variable.")
+    return api_key
+
+_config: Optional[Dict[str, Any]] = None
+_config_lock = threading.Lock()
+
+def get_config(overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Get the process-wide configuration, loading it on first use.
+
+    :param overrides: Values applied on top of the shared configuration; the result
+        is a new dictionary and the shared configuration is left unchanged
+    :return: The configuration dictionary
+    """
+    global _config
+    if _config is None:
+        with _config_lock:
+            if _config is None:
+                _config = load_config()
+    if overrides:
+        return merge_config(_config, overrides)
+    return _config
+
+def reset_config():
+    """
+    Forget the loaded configuration so the next access reads it again.
+    """
+    global _config
+    with _config_lock:
+        _config = None
+
+class LazyConfig(Mapping):
+    """
+    Read-only view of ``get_config()`` that loads the configuration on first access.
+    """
+
+    def __getitem__(self, key: str) -> Any:
+        return get_config()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(get_config())
+
+    def __len__(self) -> int:
+        return len(get_config())
+
+    def __repr__(self) -> str:
+        return repr(get_config()) if _config is not None else '<LazyConfig (not loaded)>'
+
+CONFIG = LazyConfig()
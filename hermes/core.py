@@ -1,18 +1,37 @@
 import os
-from typing import Optional, Dict, Any
+import json
+import queue
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple, Iterable, Iterator
 from .strategies.source import SourceStrategy
 from .strategies.provider import ProviderStrategy
-from .utils.cache import Cache
+from .utils.audio import load_audio_bytes, split_on_silence_boundaries, convert_to_wav, encode_for_upload, strip_silence, estimate_audio_duration, pcm_to_wav, OffsetMap
+from .utils.cache import Cache, MemoryCache, hash_bytes, content_cache_key, llm_cache_key
 from .utils.llm import LLMProcessor
-from .config import CONFIG
+from .utils.realtime import AudioCapture, SpeechWindower
+from .utils.transcript import segments_from_transcription, Segment, Transcript
+from .config import get_config
 
 class Hermes:
     def __init__(self, config: Dict[str, Any] = None):
-        self.config = config or CONFIG
-        self.source_strategy = SourceStrategy.get_strategy(self.config['source_type'])
-        self.provider_strategy = ProviderStrategy.get_strategy(self.config['transcription']['provider'])
-        self.cache = Cache(self.config['cache'])
-        self.llm_processor = LLMProcessor()
+        self.config = config or get_config()
+        self.source_strategy = SourceStrategy.get_strategy(self.config['source_type'], self.config)
+        self.provider_strategy = ProviderStrategy.get_strategy(self.config['transcription']['provider'], self.config)
+        self.cache = Cache.get_cache(self.config['cache'])
+        self._llm_processor = None
+        self._llm_stats = {'hits': 0, 'misses': 0}
+        self._stats_lock = threading.Lock()
+
+    @property
+    def llm_processor(self) -> LLMProcessor:
+        """
+        The LLM processor, created (and its API key validated) on first use.
+        """
+        if self._llm_processor is None:
+            self._llm_processor = LLMProcessor(self.config)
+        return self._llm_processor
 
     def transcribe(self, source: str, force: bool = False, **kwargs) -> Dict[str, Any]:
         """
@@ -23,49 +42,779 @@ class Hermes:
         :param kwargs: Additional arguments for the provider
         :return: A dictionary containing the transcription and metadata
         """
-        cache_key = f"{self.source_strategy.__class__.__name__}_{self.provider_strategy.__class__.__name__}_{self.config['transcription']['provider']}_{self.config['transcription']['model']}_{kwargs.get('response_format', 'text')}_{source.replace('/', '_')}"
+        params, response_format = self._transcription_params(kwargs)
+        cache_key, audio_data, content_addressed = self._resolve_cache_key(source, params)
         
         if not force:
             cached_result = self.cache.get(cache_key)
             if cached_result:
-                return cached_result
+                # The same content may have been cached under another path or URL
+                return self._render(cached_result, response_format, source if content_addressed else None)
 
-        audio_data = self.source_strategy.get_audio(source)
-        transcription = self.provider_strategy.transcribe(audio_data, params={**kwargs, **self.config['transcription']})
+        if audio_data is None:
+            audio_data = self.source_strategy.get_audio(source)
         
         result = {
             "source": source,
             "provider": self.provider_strategy.__class__.__name__,
-            "transcription": transcription
+            **self._transcribe_audio(audio_data, params)
         }
         
         self.cache.set(cache_key, result)
+        return self._render(result, response_format)
+
+    async def atranscribe(self, source: str, force: bool = False, **kwargs) -> Dict[str, Any]:
+        """
+        Transcribe audio from the given source without blocking the event loop.
+
+        Source decoding and cache access run in worker threads, while the upload goes
+        through the provider's pooled async HTTP client.
+
+        :param source: The source of the audio (file path, URL, etc.)
+        :param force: If True, ignore cache and force new transcription
+        :param kwargs: Additional arguments for the provider
+        :return: A dictionary containing the transcription and metadata
+        """
+        params, response_format = self._transcription_params(kwargs)
+        cache_key, audio_data, content_addressed = await asyncio.to_thread(self._resolve_cache_key, source, params)
+
+        if not force:
+            cached_result = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached_result:
+                return self._render(cached_result, response_format, source if content_addressed else None)
+
+        if audio_data is None:
+            audio_data = await asyncio.to_thread(self.source_strategy.get_audio, source)
+
+        result = {
+            "source": source,
+            "provider": self.provider_strategy.__class__.__name__,
+            **await self._atranscribe_audio(audio_data, params)
+        }
+
+        await asyncio.to_thread(self.cache.set, cache_key, result)
+        return self._render(result, response_format)
+
+    async def transcribe_many_async(self, sources: Iterable[str], max_concurrency: int = 16, force: bool = False, return_exceptions: bool = False, **kwargs) -> List[Any]:
+        """
+        Transcribe many sources concurrently on the running event loop.
+
+        :param sources: The sources of the audio (file paths, URLs, etc.)
+        :param max_concurrency: Maximum number of transcriptions in flight at once
+        :param force: If True, ignore cache and force new transcriptions
+        :param return_exceptions: If True, failed sources yield their exception instead of raising
+        :param kwargs: Additional arguments for the provider
+        :return: A list of results, in the same order as the sources
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(source):
+            async with semaphore:
+                return await self.atranscribe(source, force=force, **kwargs)
+
+        return await asyncio.gather(*(run(source) for source in sources), return_exceptions=return_exceptions)
+
+    def transcribe_batch(self, sources: Iterable[str], max_workers: int = 4, force: bool = False, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Transcribe many sources, yielding results as they finish.
+
+        Cached sources are yielded first, before any audio is fetched. The remaining
+        sources go through a two-stage pipeline: one pool fetches and decodes audio while
+        another uploads it, so downloads overlap with transcriptions. At most
+        ``2 * max_workers`` sources are in flight, which bounds the decoded audio held in
+        memory. A failing source yields ``{"source": ..., "error": ...}`` instead of
+        aborting the batch.
+
+        :param sources: The sources of the audio (file paths, URLs, etc.)
+        :param max_workers: Number of workers in each pipeline stage
+        :param force: If True, ignore cache and force new transcriptions
+        :param kwargs: Additional arguments for the provider
+        :return: Iterator over result dictionaries, in completion order
+        """
+        params, response_format = self._transcription_params(kwargs)
+
+        pending = []
+        for source in sources:
+            if not force:
+                cache_key, _, content_addressed = self._resolve_cache_key(source, params, fetch=False)
+                cached_result = self.cache.get(cache_key) if cache_key else None
+                if cached_result:
+                    yield self._render(cached_result, response_format, source if content_addressed else None)
+                    continue
+            pending.append(source)
+
+        completed = queue.Queue()
+        decode_pool = ThreadPoolExecutor(max_workers=max_workers)
+        upload_pool = ThreadPoolExecutor(max_workers=max_workers)
+
+        def prepare(source):
+            cache_key, audio_data, content_addressed = self._resolve_cache_key(source, params)
+            if not force and content_addressed and audio_data is not None:
+                # Remote content-addressed sources only get their key once fetched
+                cached_result = self.cache.get(cache_key)
+                if cached_result:
+                    return cache_key, None, self._render(cached_result, response_format, source)
+            if audio_data is None:
+                audio_data = self.source_strategy.get_audio(source)
+            return cache_key, audio_data, None
+
+        def upload(source, cache_key, audio_data):
+            result = {
+                "source": source,
+                "provider": self.provider_strategy.__class__.__name__,
+                **self._transcribe_audio(audio_data, params)
+            }
+            self.cache.set(cache_key, result)
+            return self._render(result, response_format)
+
+        def on_prepared(source, future):
+            try:
+                cache_key, audio_data, cached_result = future.result()
+            except Exception as e:
+                completed.put({"source": source, "error": str(e)})
+                return
+            if cached_result is not None:
+                completed.put(cached_result)
+                return
+            upload_pool.submit(upload, source, cache_key, audio_data).add_done_callback(
+                lambda upload_future: completed.put(_result_or_error(source, upload_future))
+            )
+
+        try:
+            in_flight = 0
+            next_index = 0
+            while next_index < len(pending) or in_flight:
+                while next_index < len(pending) and in_flight < 2 * max_workers:
+                    source = pending[next_index]
+                    decode_pool.submit(prepare, source).add_done_callback(
+                        lambda future, source=source: on_prepared(source, future)
+                    )
+                    next_index += 1
+                    in_flight += 1
+                yield completed.get()
+                in_flight -= 1
+        finally:
+            decode_pool.shutdown(wait=False, cancel_futures=True)
+            upload_pool.shutdown(wait=False, cancel_futures=True)
+
+    def transcribe_stream(self, source: str, force: bool = False, chunk_length: Optional[float] = None, max_workers: Optional[int] = None, **kwargs) -> Iterator[Segment]:
+        """
+        Transcribe audio from the given source, yielding segments as soon as each chunk is done.
+
+        The audio is split at silence boundaries into short chunks that are transcribed
+        concurrently (as verbose_json, to get timestamps); segments are yielded in order,
+        so the first text arrives after the first chunk rather than after the whole media.
+        The merged transcript is cached under the same key as ``transcribe`` uses, and a
+        cached transcript is streamed back directly.
+
+        :param source: The source of the audio (file path, URL, etc.)
+        :param force: If True, ignore cache and force new transcription
+        :param chunk_length: Length of the chunks in seconds (default: streaming.chunk_length)
+        :param max_workers: Maximum number of chunks transcribed concurrently (default: streaming.max_workers)
+        :param kwargs: Additional arguments for the provider
+        :return: Iterator over Segment objects, with timestamps relative to the full audio
+        """
+        params, _ = self._transcription_params(kwargs)
+        cache_key, audio_data, _ = self._resolve_cache_key(source, params)
+
+        if not force:
+            cached_result = self.cache.get(cache_key)
+            if cached_result:
+                yield from self._cached_transcript(cached_result)
+                return
+
+        yield from self._stream_transcript(source, params, cache_key, audio_data, chunk_length, max_workers)
+
+    def _stream_transcript(self, source: str, params: Dict[str, Any], cache_key: str, audio_data: Optional[bytes], chunk_length: Optional[float], max_workers: Optional[int]) -> Iterator[Segment]:
+        """
+        Transcribe audio in concurrent chunks, yielding segments in order, and cache the transcript.
+
+        :param source: The source of the audio
+        :param params: Parameters for the provider
+        :param cache_key: The key to cache the transcript under
+        :param audio_data: The audio, if it was already fetched
+        :param chunk_length: Length of the chunks in seconds (default: streaming.chunk_length)
+        :param max_workers: Maximum number of chunks transcribed concurrently (default: streaming.max_workers)
+        :return: Iterator over Segment objects, with timestamps relative to the full audio
+        """
+        streaming = self.config.get('streaming') or {}
+        if audio_data is None:
+            audio_data = self.source_strategy.get_audio(source)
+        audio_data, offset_map, vad_report = self._apply_vad(audio_data)
+        chunking = {
+            **(self.config.get('chunking') or {}),
+            'chunk_length': chunk_length or streaming.get('chunk_length', 30),
+        }
+        chunks = self._split_chunks(audio_data, chunking)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers or streaming.get('max_workers', 4))
+        try:
+            futures = [executor.submit(self._upload, chunk_data, params) for _, chunk_data in chunks]
+            parts = []
+            for chunk_id, ((offset, chunk_data), future) in enumerate(zip(chunks, futures)):
+                part = Transcript.from_transcription(future.result(), estimate_audio_duration(chunk_data))
+                parts.append((offset, part))
+                for segment in part:
+                    segment.start += offset
+                    segment.end += offset
+                    segment.chunk_id = chunk_id
+                    if offset_map is not None:
+                        segment.start = offset_map.to_original(segment.start)
+                        segment.end = offset_map.to_original(segment.end)
+                    yield segment
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        result = {
+            "source": source,
+            "provider": self.provider_strategy.__class__.__name__,
+            **self._vad_result(Transcript.concatenate(parts), offset_map, vad_report)
+        }
+        self.cache.set(cache_key, result)
+
+    def transcribe_live(self, capture: AudioCapture, max_workers: Optional[int] = None, **kwargs) -> Iterator[Segment]:
+        """
+        Transcribe a live audio stream (e.g. a microphone) while it is being captured.
+
+        Captured audio is cut into windows at pauses in speech (see the live section of
+        the configuration), and each window is uploaded as soon as it is cut while
+        capture continues. Segments are yielded in order, with timestamps relative to
+        the start of the capture. Windows are at most ``live.max_window`` seconds long,
+        which bounds the delay between speech and its transcript. Stopping the capture,
+        or closing the iterator, ends the stream.
+
+        :param capture: The audio source, e.g. MicrophoneCapture() or SyntheticCapture(samples)
+        :param max_workers: Maximum number of windows transcribed concurrently (default: live.max_workers)
+        :param kwargs: Additional arguments for the provider
+        :return: Iterator over Segment objects
+        """
+        live = dict(self.config.get('live') or {})
+        default_workers = live.pop('max_workers', 2)
+        max_workers = max_workers or default_workers
+        windower = SpeechWindower(sample_rate=capture.sample_rate, **live)
+        params = {**kwargs, **self.config['transcription'], 'response_format': 'verbose_json'}
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        windows = queue.Queue()
+
+        def transcribe_window(samples):
+            return self._upload(pcm_to_wav(samples, capture.sample_rate), params)
+
+        def produce():
+            try:
+                for block in capture:
+                    for window in windower.feed(block):
+                        windows.put((window, executor.submit(transcribe_window, window[1])))
+                for window in windower.flush():
+                    windows.put((window, executor.submit(transcribe_window, window[1])))
+            except Exception as e:
+                windows.put(e)
+            finally:
+                windows.put(None)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        try:
+            chunk_id = 0
+            while True:
+                item = windows.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                (start, samples), future = item
+                duration = len(samples) / float(capture.sample_rate)
+                yield from segments_from_transcription(future.result(), start, chunk_id, duration)
+                chunk_id += 1
+        finally:
+            capture.stop()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _resolve_cache_key(self, source: str, params: Dict[str, Any], fetch: bool = True) -> Tuple[Optional[str], Optional[bytes], bool]:
+        """
+        Build the cache key for a transcription request.
+
+        The key doesn't depend on the response format: a single transcript is cached
+        per source and rendered in whatever format is asked for.
+
+        :param source: The source of the audio
+        :param params: Parameters for the provider
+        :param fetch: If False, return no key instead of fetching audio when the key depends on it
+        :return: The cache key, the audio data if it had to be fetched to compute the key, and whether the key is content-addressed
+        """
+        if self.config['cache'].get('key_mode', 'source') != 'content':
+            cache_key = f"{self.source_strategy.__class__.__name__}_{self.provider_strategy.__class__.__name__}_{self.config['transcription']['provider']}_{self.config['transcription']['model']}_transcript_{source.replace('/', '_')}"
+            return cache_key, None, False
+
+        # Key on what is being transcribed rather than where it came from. Local
+        # files are hashed as-is (memoized on size/mtime); anything else has to be
+        # fetched first, but a hit still saves the upload and the transcription.
+        audio_data = None
+        if os.path.isfile(source):
+            content_hash = self.cache.file_digest(source)
+        elif not fetch:
+            return None, None, True
+        else:
+            audio_data = self.source_strategy.get_audio(source)
+            content_hash = hash_bytes(audio_data)
+        cache_key = content_cache_key(content_hash, self.provider_strategy.__class__.__name__, {**params, 'response_format': 'transcript'})
+        return cache_key, audio_data, True
+
+    def _transcribe_audio(self, audio_data: bytes, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Transcribe audio data with the provider, removing silence first if VAD is
+        enabled and in chunks if chunking is enabled.
+
+        :param audio_data: Audio data as returned by the source strategy
+        :param params: Parameters for the provider
+        :return: A dictionary with the encoded transcript and, with VAD, a report of the removed audio
+        """
+        audio_data, offset_map, vad_report = self._apply_vad(audio_data)
+        chunking = self.config.get('chunking', {})
+        if chunking.get('enabled'):
+            transcript = self._transcribe_chunked(audio_data, params, chunking)
+        else:
+            transcript = Transcript.from_transcription(self._upload(audio_data, params), estimate_audio_duration(audio_data))
+        return self._vad_result(transcript, offset_map, vad_report)
+
+    async def _atranscribe_audio(self, audio_data: bytes, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async counterpart of ``_transcribe_audio``.
+
+        :param audio_data: Audio data as returned by the source strategy
+        :param params: Parameters for the provider
+        :return: A dictionary with the encoded transcript and, with VAD, a report of the removed audio
+        """
+        audio_data, offset_map, vad_report = await asyncio.to_thread(self._apply_vad, audio_data)
+        chunking = self.config.get('chunking', {})
+        if chunking.get('enabled'):
+            transcript = await self._atranscribe_chunked(audio_data, params, chunking)
+        else:
+            transcript = Transcript.from_transcription(await self._aupload(audio_data, params), estimate_audio_duration(audio_data))
+        return self._vad_result(transcript, offset_map, vad_report)
+
+    def _apply_vad(self, audio_data: bytes) -> Tuple[bytes, Optional[OffsetMap], Optional[Dict[str, float]]]:
+        """
+        Strip silence from the audio if the vad section of the configuration enables it.
+
+        :param audio_data: Audio data as returned by the source strategy
+        :return: The audio to transcribe, an OffsetMap (or None without VAD) and a report of the removed audio
+        """
+        vad = dict(self.config.get('vad') or {})
+        if not vad.pop('enabled', False):
+            return audio_data, None, None
+        return strip_silence(audio_data, **vad)
+
+    def _vad_result(self, transcript: Transcript, offset_map: Optional[OffsetMap], vad_report: Optional[Dict[str, float]]) -> Dict[str, Any]:
+        """
+        Build the transcript part of a cache entry, mapping timestamps back to the original audio.
+
+        :param transcript: The transcript of the (possibly stripped) audio
+        :param offset_map: The OffsetMap returned by ``_apply_vad``, if any
+        :param vad_report: The report returned by ``_apply_vad``, if any
+        :return: A dictionary with the encoded transcript and, with VAD, the report
+        """
+        if offset_map is None:
+            return {"transcript": transcript.to_dict()}
+        # Timestamps refer to the audio without silence; move them back onto the original media
+        return {"transcript": transcript.remap(offset_map.to_original).to_dict(), "vad": vad_report}
+
+    def _transcription_params(self, kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+        """
+        Split the requested response format from the parameters sent to the provider.
+
+        Providers are always asked for verbose_json, the richest format, and the
+        requested format is rendered locally from the resulting transcript.
+
+        :param kwargs: Additional arguments for the provider
+        :return: The provider parameters and the requested response format
+        """
+        params = {**kwargs, **self.config['transcription']}
+        return {**params, 'response_format': 'verbose_json'}, params.get('response_format', 'text')
+
+    def _render(self, entry: Dict[str, Any], response_format: str, source: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Turn a cache entry into a result, rendering its transcript in the requested format.
+
+        :param entry: The cache entry
+        :param response_format: The response format to render
+        :param source: Source to report instead of the cached one (content-addressed hits)
+        :return: A dictionary containing the transcription and metadata
+        """
+        result = {}
+        for key, value in entry.items():
+            if key == 'transcript':
+                result['transcription'] = Transcript.from_dict(value).render(response_format)
+            else:
+                # Entries cached before transcripts were stored hold a rendered transcription
+                result[key] = value
+        if source is not None:
+            result['source'] = source
         return result
 
-    def process_with_llm(self, transcription: str, prompt: str) -> str:
+    @staticmethod
+    def _cached_transcript(entry: Dict[str, Any]) -> Transcript:
+        if 'transcript' in entry:
+            return Transcript.from_dict(entry['transcript'])
+        # Entries cached before transcripts were stored hold a rendered transcription
+        return Transcript(segments_from_transcription(entry['transcription']))
+
+    def _upload(self, audio_data: bytes, params: Dict[str, Any]) -> Any:
+        """
+        Encode audio with the provider's upload codec and transcribe it.
+
+        :param audio_data: Audio data as bytes
+        :param params: Parameters for the provider
+        :return: The transcription
+        """
+        # Read the duration from the WAV: the encoded upload has no header to read it from
+        duration = estimate_audio_duration(audio_data)
+        return self.provider_strategy.transcribe(self._encode_for_upload(audio_data), params=params, duration=duration)
+
+    async def _aupload(self, audio_data: bytes, params: Dict[str, Any]) -> Any:
+        """
+        Async counterpart of ``_upload``.
+
+        :param audio_data: Audio data as bytes
+        :param params: Parameters for the provider
+        :return: The transcription
+        """
+        duration = estimate_audio_duration(audio_data)
+        audio_data = await asyncio.to_thread(self._encode_for_upload, audio_data)
+        return await self.provider_strategy.atranscribe(audio_data, params=params, duration=duration)
+
+    def _encode_for_upload(self, audio_data: bytes) -> bytes:
+        codecs = self.config.get('upload_codecs') or {}
+        return encode_for_upload(audio_data, codecs.get(self.config['transcription']['provider']))
+
+    def _transcribe_chunked(self, audio_data: bytes, params: Dict[str, Any], chunking: Dict[str, Any]) -> Any:
+        """
+        Split audio at silence boundaries and transcribe the chunks concurrently.
+
+        :param audio_data: Audio data as returned by the source strategy
+        :param params: Parameters for the provider
+        :param chunking: The chunking section of the configuration
+        :return: The merged transcript, with timestamps relative to the full audio
+        """
+        def transcribe_chunk(chunk):
+            offset, chunk_data = chunk
+            return offset, Transcript.from_transcription(self._upload(chunk_data, params), estimate_audio_duration(chunk_data))
+
+        with ThreadPoolExecutor(max_workers=chunking.get('max_workers', 4)) as executor:
+            parts = list(executor.map(transcribe_chunk, self._split_chunks(audio_data, chunking)))
+
+        return Transcript.concatenate(parts)
+
+    async def _atranscribe_chunked(self, audio_data: bytes, params: Dict[str, Any], chunking: Dict[str, Any]) -> Any:
+        """
+        Async counterpart of ``_transcribe_chunked``.
+
+        :param audio_data: Audio data as returned by the source strategy
+        :param params: Parameters for the provider
+        :param chunking: The chunking section of the configuration
+        :return: The merged transcript, with timestamps relative to the full audio
+        """
+        chunks = await asyncio.to_thread(self._split_chunks, audio_data, chunking)
+        semaphore = asyncio.Semaphore(chunking.get('max_workers', 4))
+
+        async def transcribe_chunk(offset, chunk_data):
+            async with semaphore:
+                transcription = await self._aupload(chunk_data, params)
+            return offset, Transcript.from_transcription(transcription, estimate_audio_duration(chunk_data))
+
+        parts = await asyncio.gather(*(transcribe_chunk(offset, chunk_data) for offset, chunk_data in chunks))
+        return Transcript.concatenate(list(parts))
+
+    def _split_chunks(self, audio_data: bytes, chunking: Dict[str, Any]) -> List[Tuple[float, bytes]]:
+        """
+        Split audio at silence boundaries into WAV chunks.
+
+        :param audio_data: Audio data as returned by the source strategy
+        :param chunking: The chunking section of the configuration
+        :return: List of (offset in seconds, WAV bytes) tuples
+        """
+        chunks = split_on_silence_boundaries(
+            load_audio_bytes(audio_data),
+            chunk_length=chunking.get('chunk_length', 600),
+            min_silence_len=chunking.get('min_silence_len', 500),
+            silence_thresh=chunking.get('silence_thresh'),
+        )
+        return [(offset, convert_to_wav(segment)) for offset, segment in chunks]
+
+    def process_with_llm(self, transcription: str, prompt: str, force: bool = False, **kwargs) -> str:
         """
         Process the transcription with a language model.
 
+        Results are cached, keyed on the transcription, prompt, model and arguments, so
+        running the same prompt over the same transcription again costs no LLM call.
+        Transcriptions longer than ``llm.chunk_tokens`` are processed with map-reduce.
+
         :param transcription: The transcription text to process
         :param prompt: The prompt to send to the language model
+        :param force: If True, ignore cache and call the language model
+        :param kwargs: Additional arguments for the LLM API call
         :return: The processed result from the language model
         """
-        return self.llm_processor.process(transcription, prompt)
+        cache_key = self._llm_cache_key(transcription, prompt, kwargs)
+        if not force:
+            cached_result = self.cache.get(cache_key)
+            if cached_result is not None:
+                self._count_llm('hits')
+                return cached_result
+
+        self._count_llm('misses')
+        result = self.llm_processor.process(transcription, prompt, **kwargs)
+        self.cache.set(cache_key, result)
+        return result
+
+    async def aprocess_with_llm(self, transcription: str, prompt: str, force: bool = False, **kwargs) -> str:
+        """
+        Async counterpart of ``process_with_llm``.
+
+        :param transcription: The transcription text to process
+        :param prompt: The prompt to send to the language model
+        :param force: If True, ignore cache and call the language model
+        :param kwargs: Additional arguments for the LLM API call
+        :return: The processed result from the language model
+        """
+        cache_key = self._llm_cache_key(transcription, prompt, kwargs)
+        if not force:
+            cached_result = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached_result is not None:
+                self._count_llm('hits')
+                return cached_result
+
+        self._count_llm('misses')
+        result = await self.llm_processor.aprocess(transcription, prompt, **kwargs)
+        await asyncio.to_thread(self.cache.set, cache_key, result)
+        return result
+
+    def process_many_with_llm(self, transcriptions: Iterable[str], prompt: str, batch: bool = False, force: bool = False, max_concurrency: Optional[int] = None, **kwargs) -> List[str]:
+        """
+        Process many transcriptions with the same prompt.
+
+        Cached results are reused; the others are processed concurrently, or with
+        several transcriptions per LLM call if ``batch`` is True (see
+        ``LLMProcessor.process_batch``), and cached.
+
+        :param transcriptions: The transcription texts to process
+        :param prompt: The prompt to send to the language model
+        :param batch: If True, pack short transcriptions into shared LLM calls
+        :param force: If True, ignore cache and call the language model
+        :param max_concurrency: Maximum number of LLM calls in flight at once (default: llm.max_workers)
+        :param kwargs: Additional arguments for the LLM API calls
+        :return: The results, in the same order as the transcriptions
+        """
+        transcriptions = list(transcriptions)
+        keys = [self._llm_cache_key(transcription, prompt, kwargs) for transcription in transcriptions]
+        # A text packed with others may get a different answer than on its own, so batch
+        # results are stored under their own keys; single-text results are reused either way
+        batch_keys = [self._llm_cache_key(transcription, prompt, {**kwargs, '_batch': True}) for transcription in transcriptions] if batch else keys
+        results = [None] * len(transcriptions)
+        if not force:
+            for index, key in enumerate(keys):
+                results[index] = self.cache.get(key)
+                if results[index] is None and batch:
+                    results[index] = self.cache.get(batch_keys[index])
+        missing = [index for index, result in enumerate(results) if result is None]
+        self._count_llm('hits', len(transcriptions) - len(missing))
+        self._count_llm('misses', len(missing))
+
+        texts = [transcriptions[index] for index in missing]
+        if not texts:
+            return results
+        if batch:
+            processed = self.llm_processor.process_batch(texts, prompt, **kwargs)
+        else:
+            processed = self.llm_processor.process_many(texts, prompt, max_concurrency=max_concurrency, **kwargs)
+        for index, result in zip(missing, processed):
+            results[index] = result
+            self.cache.set(batch_keys[index], result)
+        return results
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters for this instance.
+
+        :return: A dictionary with LLM cache hits and misses under 'llm', and the
+            counters of the in-memory tier under 'memory' when it is enabled
+        """
+        with self._stats_lock:
+            stats = {'llm': dict(self._llm_stats)}
+        if isinstance(self.cache, MemoryCache):
+            stats['memory'] = self.cache.stats()
+        return stats
+
+    def _count_llm(self, outcome: str, count: int = 1):
+        with self._stats_lock:
+            self._llm_stats[outcome] += count
+
+    def _llm_cache_key(self, text: str, prompt: str, kwargs: Dict[str, Any]) -> str:
+        llm = self.config['llm']
+        # The chunk size changes how long texts are split, and therefore the result
+        params = {**kwargs, 'chunk_tokens': llm.get('chunk_tokens')}
+        return llm_cache_key(text, prompt, f"{llm['provider']}/{llm['model']}", params)
+
+    def transcribe_and_process(self, source: str, prompt: str, force: bool = False, chunk_length: Optional[float] = None, max_workers: Optional[int] = None, **kwargs) -> Dict[str, Any]:
+        """
+        Transcribe audio and process the transcription with a language model, overlapping the two.
+
+        A cached transcription is processed directly. Otherwise the audio is transcribed
+        like ``transcribe_stream`` does and its segments are fed to a map-reduce LLM job as
+        they arrive, so the LLM calls on the first chunks of text run while later audio
+        is still being transcribed. The LLM always gets the plain text of the transcript,
+        whatever the response format, so results are shared with ``process_with_llm``.
+
+        :param source: The source of the audio (file path, URL, etc.)
+        :param prompt: The prompt to send to the language model
+        :param force: If True, ignore cache and force new transcription
+        :param chunk_length: Length of the audio chunks in seconds (default: streaming.chunk_length)
+        :param max_workers: Maximum number of chunks transcribed concurrently (default: streaming.max_workers)
+        :param kwargs: Additional arguments for the provider
+        :return: A dictionary containing the transcription, metadata and the LLM result under 'llm_processed'
+        """
+        params, response_format = self._transcription_params(kwargs)
+        cache_key, audio_data, content_addressed = self._resolve_cache_key(source, params)
+
+        # Every path sends the plain text of the transcript to the LLM, and caches the
+        # result under the key process_with_llm computes for that text
+        if not force:
+            cached_result = self.cache.get(cache_key)
+            if cached_result:
+                result = self._render(cached_result, response_format, source if content_addressed else None)
+                result['llm_processed'] = self.process_with_llm(self._cached_transcript(cached_result).render('text'), prompt)
+                return result
+
+        job = self.llm_processor.map_reduce(prompt)
+        segments = []
+        try:
+            for segment in self._stream_transcript(source, params, cache_key, audio_data, chunk_length, max_workers):
+                segments.append(segment)
+                job.feed(segment.text)
+        except BaseException:
+            job.close()
+            raise
+        transcript = Transcript(segments)
+        llm_key = self._llm_cache_key(transcript.render('text'), prompt, {})
+        # A fresh transcript may still match text processed before (e.g. the same media elsewhere)
+        llm_processed = None if force else self.cache.get(llm_key)
+        if llm_processed is not None:
+            job.close()
+            self._count_llm('hits')
+        else:
+            llm_processed = job.result()
+            self._count_llm('misses')
+            self.cache.set(llm_key, llm_processed)
+
+        # _stream_transcript has cached the transcript already
+        return {
+            "source": source,
+            "provider": self.provider_strategy.__class__.__name__,
+            "transcription": transcript.render(response_format),
+            "llm_processed": llm_processed,
+        }
 
     @classmethod
-    def from_config(cls, config: Dict[str, Any]) -> 'Hermes':
+    def from_config(cls, config: Dict[str, Any], reuse: bool = False) -> 'Hermes':
         """
         Create a Hermes instance from a configuration dictionary.
         
         :param config: A dictionary containing configuration options
+        :param reuse: If True, return the instance previously created for an equal
+            configuration (with its warm strategies, HTTP sessions and cache handles)
         :return: A configured Hermes instance
         """
-        source_strategy = SourceStrategy.get_strategy(config['source_type'])
-        provider_strategy = ProviderStrategy.get_strategy(config['transcription']['provider'])
-        
-        return cls(config)
+        if not reuse:
+            return cls(config)
+
+        key = _config_key(config)
+        with _instances_lock:
+            instance = _instances.get(key)
+            if instance is None:
+                instance = cls(config)
+                _instances[key] = instance
+            return instance
+
+_instances: Dict[str, Hermes] = {}
+_instances_lock = threading.Lock()
+# Configurations returned by build_config, by arguments, with their keys; built
+# configurations are shared and must not be modified
+_built_configs: Dict[Tuple, Tuple[Dict[str, Any], Dict[str, Any], str]] = {}
+_built_keys: Dict[int, Tuple[Dict[str, Any], str]] = {}
 
-def transcribe(source: str, provider: Optional[str] = None, force: bool = False, llm_prompt: Optional[str] = None, model: Optional[str] = None, response_format: str = "text", **kwargs) -> Dict[str, Any]:
+def config_key(config: Dict[str, Any]) -> str:
+    """
+    Compute a stable key identifying an effective configuration.
+
+    :param config: A configuration dictionary
+    :return: Hex digest of the canonical JSON encoding of the configuration
+    """
+    return hash_bytes(json.dumps(config, sort_keys=True, default=str).encode())
+
+def _config_key(config: Dict[str, Any]) -> str:
+    known = _built_keys.get(id(config))
+    if known is not None and known[0] is config:
+        return known[1]
+    return config_key(config)
+
+def clear_instances():
+    """
+    Drop every Hermes instance kept by ``Hermes.from_config(..., reuse=True)``.
+    """
+    with _instances_lock:
+        _instances.clear()
+        _built_configs.clear()
+        _built_keys.clear()
+
+def _result_or_error(source: str, future) -> Dict[str, Any]:
+    try:
+        return future.result()
+    except Exception as e:
+        return {"source": source, "error": str(e)}
+
+def build_config(provider: Optional[str] = None, model: Optional[str] = None, chunk_length: Optional[float] = None, max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Build a configuration dictionary from the global configuration and overrides.
+
+    The result is memoized per arguments (until the global configuration is reloaded)
+    together with its key, so repeated calls followed by ``Hermes.from_config(config,
+    reuse=True)`` find the warm instance without copying and hashing the configuration.
+    The returned dictionary is shared and must not be modified.
+
+    :param provider: The name of the provider to use (default: None, will use the default provider)
+    :param model: The model to use for transcription
+    :param chunk_length: If provided, enable chunking with chunks of this many seconds
+    :param max_workers: If provided, enable chunking with this many concurrent chunks
+    :return: A configuration dictionary for Hermes
+    """
+    base = get_config()
+    args = (provider, model, chunk_length, max_workers)
+    built = _built_configs.get(args)
+    if built is not None and built[0] is base:
+        return built[1]
+
+    overrides = {'source_type': 'auto', 'transcription': {}}
+    if provider:
+        overrides['transcription']['provider'] = provider
+    if model:
+        overrides['transcription']['model'] = model
+    if chunk_length or max_workers:
+        overrides['chunking'] = {'enabled': True}
+        if chunk_length:
+            overrides['chunking']['chunk_length'] = chunk_length
+        if max_workers:
+            overrides['chunking']['max_workers'] = max_workers
+    config = get_config(overrides)
+    key = config_key(config)
+    with _instances_lock:
+        stale = _built_configs.get(args)
+        if stale is not None:
+            _built_keys.pop(id(stale[1]), None)
+        _built_configs[args] = (base, config, key)
+        _built_keys[id(config)] = (config, key)
+    return config
+
+def transcribe(source: str, provider: Optional[str] = None, force: bool = False, llm_prompt: Optional[str] = None, model: Optional[str] = None, response_format: str = "text", chunk_length: Optional[float] = None, max_workers: Optional[int] = None, **kwargs) -> Dict[str, Any]:
     """
     Convenience function to transcribe audio and optionally process with LLM.
 
@@ -75,21 +824,46 @@ def transcribe(source: str, provider: Optional[str] = None, force: bool = False,
     :param llm_prompt: If provided, process the transcription with this prompt using an LLM
     :param model: The model to use for transcription
     :param response_format: The desired response format (default: "text")
+    :param chunk_length: If provided, split the audio into chunks of this many seconds and transcribe them in parallel
+    :param max_workers: Maximum number of chunks transcribed concurrently
     :param kwargs: Additional arguments for the provider
     :return: A dictionary containing the transcription, metadata, and optional LLM processing result
     """
-    config = {
-        **CONFIG,
-        'source_type': 'auto',
-        'transcription': {
-            'provider': provider or CONFIG['transcription']['provider'],
-            'model': model or CONFIG['transcription']['model'],
-        }
-    }
-    hermes = Hermes.from_config(config)
+    config = build_config(provider, model, chunk_length, max_workers)
+    hermes = Hermes.from_config(config, reuse=True)
+    chunking = config.get('chunking') or {}
+    if llm_prompt and chunking.get('enabled'):
+        # The LLM starts on the first chunks of text while the rest is still being transcribed
+        return hermes.transcribe_and_process(
+            source, llm_prompt, force=force,
+            chunk_length=chunking.get('chunk_length'), max_workers=chunking.get('max_workers'),
+            response_format=response_format, **kwargs,
+        )
     result = hermes.transcribe(source, force=force, response_format=response_format, **kwargs)
-
     if llm_prompt:
-        result['llm_processed'] = hermes.process_with_llm(result['transcription'], llm_prompt)
+        # The LLM gets the plain text whatever the format; rendering it again is a cache hit
+        text = result['transcription'] if response_format == 'text' else hermes.transcribe(source, response_format='text', **kwargs)['transcription']
+        result['llm_processed'] = hermes.process_with_llm(text, llm_prompt, force=force)
+    return result
 
-    return result
\ No newline at end of file
+async def transcribe_many_async(sources: Iterable[str], provider: Optional[str] = None, force: bool = False, model: Optional[str] = None, response_format: str = "text", max_concurrency: int = 16, **kwargs) -> List[Dict[str, Any]]:
+    """
+    Convenience coroutine to transcribe many sources concurrently with one Hermes instance.
+
+    :param sources: The sources of the audio (file paths, URLs, etc.)
+    :param provider: The name of the provider to use (default: None, will use the default provider)
+    :param force: If True, ignore cache and force new transcriptions
+    :param model: The model to use for transcription
+    :param response_format: The desired response format (default: "text")
+    :param max_concurrency: Maximum number of transcriptions in flight at once
+    :param kwargs: Additional arguments for the provider
+    :return: A list of result dictionaries, in the same order as the sources
+    """
+    # Imported here so that importing hermes doesn't load httpx
+    from .utils.http import aclose_async_clients
+    hermes = Hermes.from_config(build_config(provider, model), reuse=True)
+    try:
+        return await hermes.transcribe_many_async(sources, max_concurrency=max_concurrency, force=force, response_format=response_format, **kwargs)
+    finally:
+        # The clients are bound to this event loop, which usually ends with this call
+        await aclose_async_clients()
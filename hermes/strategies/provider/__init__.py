@@ -1,14 +1,31 @@
 from .base import ProviderStrategy
 
-def get_provider_strategy(provider_name: str) -> ProviderStrategy:
+# Concrete strategies are imported on first access; each pulls in its own HTTP or ML stack
+_STRATEGIES = {
+    'GroqProviderStrategy': '.groq',
+    'OpenAIProviderStrategy': '.openai',
+    'MLXProviderStrategy': '.mlx',
+    'LocalProviderStrategy': '.local',
+}
+
+def __getattr__(name):
+    if name in _STRATEGIES:
+        import importlib
+        return getattr(importlib.import_module(_STRATEGIES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def get_provider_strategy(provider_name: str, config=None) -> ProviderStrategy:
     if provider_name == 'groq':
         from .groq import GroqProviderStrategy
-        return GroqProviderStrategy()
+        return GroqProviderStrategy(config)
     elif provider_name == 'openai':
         from .openai import OpenAIProviderStrategy
-        return OpenAIProviderStrategy()
+        return OpenAIProviderStrategy(config)
     elif provider_name == 'mlx':
         from .mlx import MLXProviderStrategy
-        return MLXProviderStrategy()
+        return MLXProviderStrategy(config)
+    elif provider_name == 'local':
+        from .local import LocalProviderStrategy
+        return LocalProviderStrategy(config)
     else:
         raise ValueError(f"Unknown provider: {provider_name}")
\ No newline at end of file
@@ -1,21 +1,112 @@
+import os
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Optional, Tuple, Type
+from ...config import CONFIG, require_api_key
+from ...utils.ratelimit import get_rate_limiter, send_with_retries, asend_with_retries
 
 class ProviderStrategy(ABC):
+    name = None
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        :param config: The configuration (default: the process-wide configuration)
+        """
+        self.config = config if config is not None else CONFIG
+
     @abstractmethod
-    def transcribe(self, audio_data: bytes, params: Dict[str, Any] = None) -> str:
+    def transcribe(self, audio_data: bytes, params: Dict[str, Any] = None, duration: Optional[float] = None) -> str:
         pass
 
+    async def atranscribe(self, audio_data: bytes, params: Dict[str, Any] = None, duration: Optional[float] = None) -> str:
+        """
+        Transcribe audio without blocking the event loop.
+
+        Providers with a native async client override this; the default runs the
+        synchronous ``transcribe`` in a worker thread.
+
+        :param audio_data: Audio data as bytes
+        :param params: Parameters for the provider
+        :param duration: Duration of the audio in seconds, if known before encoding
+        :return: The transcription
+        """
+        return await asyncio.to_thread(self.transcribe, audio_data, params, duration)
+
+    def _send_with_retries(
+        self,
+        send: Callable[[], Any],
+        audio_data: bytes,
+        retry_exceptions: Tuple[Type[BaseException], ...] = (),
+        duration: Optional[float] = None,
+    ) -> Any:
+        """
+        Send a request through the provider's shared rate limiter, retrying on 429/5xx.
+
+        :param send: Function performing the request and returning the response
+        :param audio_data: The audio sent with the request
+        :param retry_exceptions: Transport exceptions that should be retried
+        :param duration: Duration of the audio in seconds, charged to audio-seconds quotas
+            (default: estimated from the audio, exact only for WAV)
+        :return: The last response
+        """
+        return send_with_retries(send, self._rate_limiter(), self._duration(audio_data, duration), self.config.get('retry'), retry_exceptions)
+
+    async def _asend_with_retries(
+        self,
+        send: Callable[[], Any],
+        audio_data: bytes,
+        retry_exceptions: Tuple[Type[BaseException], ...] = (),
+        duration: Optional[float] = None,
+    ) -> Any:
+        """
+        Async counterpart of ``_send_with_retries``.
+
+        :param send: Coroutine function performing the request and returning the response
+        :param audio_data: The audio sent with the request
+        :param retry_exceptions: Transport exceptions that should be retried
+        :param duration: Duration of the audio in seconds, charged to audio-seconds quotas
+        :return: The last response
+        """
+        return await asend_with_retries(send, self._rate_limiter(), self._duration(audio_data, duration), self.config.get('retry'), retry_exceptions)
+
+    @staticmethod
+    def _duration(audio_data: bytes, duration: Optional[float]) -> float:
+        if duration is not None:
+            return duration
+        from ...utils.audio import estimate_audio_duration
+        return estimate_audio_duration(audio_data)
+
+    def _api_key(self) -> str:
+        """
+        Get the API key of the provider, failing if none is configured.
+
+        Checked when a request is made rather than when the strategy is created, so
+        configurations that never transcribe with this provider don't need its key.
+
+        :return: The ``transcription.api_key`` of the configuration if it is for this
+            provider, otherwise the provider's environment variable
+        """
+        section = self.config.get('transcription') or {}
+        api_key = section.get('api_key') if section.get('provider') == self.name else None
+        api_key = api_key or os.getenv(f"{self.name.upper()}_API_KEY")
+        return require_api_key({'transcription': {'provider': self.name, 'api_key': api_key}}, 'transcription')
+
+    def _rate_limiter(self):
+        return get_rate_limiter(self.name, self.config.get('rate_limits') or {})
+
     @classmethod
-    def get_strategy(cls, provider_type: str) -> 'ProviderStrategy':
+    def get_strategy(cls, provider_type: str, config: Optional[Dict[str, Any]] = None) -> 'ProviderStrategy':
         if provider_type == 'groq':
             from .groq import GroqProviderStrategy
-            return GroqProviderStrategy()
+            return GroqProviderStrategy(config)
         elif provider_type == 'openai':
             from .openai import OpenAIProviderStrategy
-            return OpenAIProviderStrategy()
+            return OpenAIProviderStrategy(config)
         elif provider_type == 'mlx':
             from .mlx import MLXProviderStrategy
-            return MLXProviderStrategy()
+            return MLXProviderStrategy(config)
+        elif provider_type == 'local':
+            from .local import LocalProviderStrategy
+            return LocalProviderStrategy(config)
         else:
-            raise ValueError(f"Unknown provider type: {provider_type}")
\ No newline at end of file
+            raise ValueError(f"Unknown provider type: {provider_type}")
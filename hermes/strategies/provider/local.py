@@ -0,0 +1,102 @@
+import os
+import threading
+from typing import Dict, Any, Optional, Tuple
+from .base import ProviderStrategy
+from ...utils.audio import decode_to_float32
+from ...utils.transcript import render_segments
+
+# Remote model names mapped to the equivalent faster-whisper checkpoints, so switching
+# the provider to 'local' works without also changing the model
+MODEL_ALIASES = {
+    'distil-whisper-large-v3-en': 'distil-large-v3',
+    'whisper-large-v3': 'large-v3',
+    'whisper-large-v3-turbo': 'large-v3-turbo',
+    'whisper-1': 'large-v2',
+}
+
+_models: Dict[Tuple[Any, ...], Any] = {}
+_models_lock = threading.Lock()
+
+def load_model(model: str, device: str = 'cpu', compute_type: str = 'int8', cpu_threads: int = 0, num_workers: int = 1, download_root: str = None) -> Any:
+    """
+    Load a faster-whisper model, or return the one already resident in this process.
+
+    :param model: Model size or path (e.g. "distil-large-v3")
+    :param device: Device to run on ("cpu" or "cuda")
+    :param compute_type: Quantization of the weights (e.g. "int8", "int8_float32", "float32")
+    :param cpu_threads: Number of threads per transcription, 0 for the library default
+    :param num_workers: Number of transcriptions that can run in parallel on the model
+    :param download_root: Directory where models are downloaded
+    :return: The WhisperModel, shared by every LocalProviderStrategy with the same settings
+    """
+    key = (model, device, compute_type, cpu_threads, num_workers, download_root)
+    with _models_lock:
+        instance = _models.get(key)
+        if instance is None:
+            try:
+                from faster_whisper import WhisperModel
+            except ImportError:
+                raise ImportError("The local provider requires faster-whisper. Install it with `pip install hermes[local]`.")
+            instance = WhisperModel(
+                model,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                num_workers=num_workers,
+                download_root=download_root,
+            )
+            _models[key] = instance
+        return instance
+
+class LocalProviderStrategy(ProviderStrategy):
+    """
+    Transcribe in-process on CPU with faster-whisper (CTranslate2, int8 by default).
+
+    The model is loaded on the first transcription and stays resident for the
+    lifetime of the process.
+    """
+
+    name = "local"
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__(config)
+        self.options = {**(self.config.get('local') or {})}
+        if not self.options.get('cpu_threads'):
+            self.options['cpu_threads'] = os.cpu_count() or 0
+
+    def get_model(self, model: str) -> Any:
+        return load_model(
+            MODEL_ALIASES.get(model, model),
+            device=self.options.get('device', 'cpu'),
+            compute_type=self.options.get('compute_type', 'int8'),
+            cpu_threads=self.options['cpu_threads'],
+            num_workers=self.options.get('num_workers', 1),
+            download_root=self.options.get('download_root'),
+        )
+
+    def transcribe(self, audio_data: bytes, params: Dict[str, Any] = None, duration: Optional[float] = None) -> str:
+        params = params or {}
+        model = self.get_model(params.get("model", "distil-large-v3"))
+        response_format = params.get("response_format", "text")
+
+        segments, info = model.transcribe(
+            decode_to_float32(audio_data),
+            language=params.get("language"),
+            initial_prompt=params.get("prompt"),
+            temperature=params.get("temperature", 0),
+            beam_size=self.options.get('beam_size', 5),
+            word_timestamps=response_format == "verbose_json" and params.get("word_timestamps", False),
+        )
+        # Segments are generated lazily as the model decodes
+        segments = [
+            {
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text,
+                "avg_logprob": segment.avg_logprob,
+                "no_speech_prob": segment.no_speech_prob,
+                "words": [{"word": word.word, "start": word.start, "end": word.end} for word in segment.words or []],
+            }
+            for segment in segments
+        ]
+        return render_segments(segments, response_format, info.language, info.duration)
@@ -1,32 +1,119 @@
+import os
+import glob
 import tempfile
+import threading
 import subprocess
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .base import ProviderStrategy
+from ...utils.audio import decode_to_float32
+from ...utils.transcript import render_segments
+
+_backend = None
+_backend_lock = threading.Lock()
+# MLX evaluates on a single device stream; transcriptions are serialized on it
+_transcribe_lock = threading.Lock()
+
+def load_backend() -> Optional[Any]:
+    """
+    Import the mlx_whisper Python API once per process.
+
+    mlx_whisper keeps the most recently used model loaded, so as long as calls go
+    through the same process the weights stay resident between transcriptions.
+
+    :return: The mlx_whisper module, or None if it is not installed
+    """
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            try:
+                import mlx_whisper
+                _backend = mlx_whisper
+            except ImportError:
+                # Remember the failure so the subprocess fallback doesn't retry the import on every call
+                _backend = False
+        return _backend or None
 
 class MLXProviderStrategy(ProviderStrategy):
-    def transcribe(self, audio_data: bytes, params: Dict[str, Any] = None) -> str:
+    """
+    Transcribe on Apple silicon with MLX Whisper.
+
+    In the default 'auto' mode the model runs in-process when the mlx_whisper
+    package can be imported, and the ``mlx_whisper`` command is used otherwise.
+    The mode can be forced with the ``mlx.mode`` config option ('inprocess' or 'subprocess').
+    """
+
+    name = "mlx"
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__(config)
+        self.mode = (self.config.get('mlx') or {}).get('mode', 'auto')
+
+    def transcribe(self, audio_data: bytes, params: Dict[str, Any] = None, duration: Optional[float] = None) -> str:
         params = params or {}
+        if self.mode != 'subprocess':
+            backend = load_backend()
+            if backend is not None:
+                return self._transcribe_in_process(backend, audio_data, params)
+            if self.mode == 'inprocess':
+                raise ImportError("In-process MLX transcription requires mlx-whisper. Install it with `pip install hermes[mlx]`.")
+        return self._transcribe_subprocess(audio_data, params)
+
+    def _transcribe_in_process(self, backend: Any, audio_data: bytes, params: Dict[str, Any]) -> str:
         model = params.get("model", "mlx-community/distil-whisper-large-v3")
-        output_dir = params.get("output_dir", ".")
+        response_format = params.get("response_format", "text")
+        options = {"path_or_hf_repo": model, "word_timestamps": response_format == "verbose_json" and params.get("word_timestamps", False)}
+        if params.get("language"):
+            options["language"] = params["language"]
+        if params.get("prompt"):
+            options["initial_prompt"] = params["prompt"]
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_audio:
-            temp_audio.write(audio_data)
-            temp_audio_path = temp_audio.name
+        audio = decode_to_float32(audio_data)
+        with _transcribe_lock:
+            result = backend.transcribe(audio, **options)
 
-        command = [
-            "mlx_whisper",
-            temp_audio_path,
-            "--model", model,
-            "--output-dir", output_dir,
+        segments = [
+            {
+                "start": segment["start"],
+                "end": segment["end"],
+                "text": segment["text"],
+                "words": [
+                    {"word": word["word"], "start": word["start"], "end": word["end"]}
+                    for word in segment.get("words") or []
+                ],
+            }
+            for segment in result.get("segments", [])
         ]
+        if response_format == "text" or not segments:
+            return result.get("text", "").strip()
+        return render_segments(segments, response_format, result.get("language"), len(audio) / 16000.0)
+
+    def _transcribe_subprocess(self, audio_data: bytes, params: Dict[str, Any]) -> str:
+        model = params.get("model", "mlx-community/distil-whisper-large-v3")
+
+        with tempfile.TemporaryDirectory(prefix="hermes-mlx-") as temp_dir:
+            stem = os.path.basename(temp_dir)
+            temp_audio_path = os.path.join(temp_dir, f"{stem}.wav")
+            with open(temp_audio_path, "wb") as temp_audio:
+                temp_audio.write(audio_data)
+            # Outputs go to the temporary directory unless the caller asked to keep them
+            output_dir = params.get("output_dir") or temp_dir
+
+            command = [
+                "mlx_whisper",
+                temp_audio_path,
+                "--model", model,
+                "--output-dir", output_dir,
+            ]
 
-        result = subprocess.run(command, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise RuntimeError(f"MLX Whisper transcription failed: {result.stderr}")
+            result = subprocess.run(command, capture_output=True, text=True)
+            if result.returncode != 0:
+                raise RuntimeError(f"MLX Whisper transcription failed: {result.stderr}")
 
-        # Assuming the output is in the same directory with the same name as the input file
-        output_file = f"{output_dir}/{temp_audio_path.split('/')[-1]}.txt"
-        with open(output_file, 'r') as f:
-            transcription = f.read()
+            # Depending on the version the output is named <stem>.txt or <stem>.wav.txt
+            output_files = glob.glob(os.path.join(output_dir, f"{stem}*.txt"))
+            if not output_files:
+                raise RuntimeError(f"MLX Whisper did not write a transcription to {output_dir}")
+            with open(output_files[0], 'r') as f:
+                transcription = f.read()
 
         return transcription
@@ -1,26 +1,30 @@
-import os
+import httpx
 import requests
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from .base import ProviderStrategy
+from ...utils.http import get_session, get_async_client
+from ...utils.audio import detect_audio_format
 
 class OpenAIProviderStrategy(ProviderStrategy):
-    def __init__(self):
-        self.api_key = os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
-            raise ValueError("OPENAI_API_KEY environment variable is not set")
+    name = "openai"
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__(config)
         self.base_url = "https://api.openai.com/v1/audio/transcriptions"
+        self.session = get_session("openai")
 
-    def transcribe(self, audio_data: bytes, params: Dict[str, Any] = None) -> str:
+    def _build_request(self, audio_data: bytes, params: Dict[str, Any] = None) -> Tuple[Dict[str, str], Dict[str, Any], Dict[str, Any]]:
         params = params or {}
         model = params.get("model", "whisper-1")
         response_format = params.get("response_format", "text")
 
         headers = {
-            "Authorization": f"Bearer {self.api_key}",
+            "Authorization": f"Bearer {self._api_key()}",
         }
 
+        extension, mime_type = detect_audio_format(audio_data)
         files = {
-            "file": ("audio.wav", audio_data, "audio/wav"),
+            "file": (f"audio.{extension}", audio_data, mime_type),
         }
 
         data = {
@@ -28,7 +32,30 @@ class OpenAIProviderStrategy(ProviderStrategy):
             "response_format": response_format,
         }
 
-        response = requests.post(self.base_url, headers=headers, files=files, data=data)
+        return headers, files, data
+
+    def transcribe(self, audio_data: bytes, params: Dict[str, Any] = None, duration: Optional[float] = None) -> str:
+        headers, files, data = self._build_request(audio_data, params)
+
+        response = self._send_with_retries(
+            lambda: self.session.post(self.base_url, headers=headers, files=files, data=data),
+            audio_data,
+            (requests.ConnectionError, requests.Timeout),
+            duration=duration,
+        )
+        response.raise_for_status()
+
+        return response.text if data["response_format"] == "text" else response.json()
+
+    async def atranscribe(self, audio_data: bytes, params: Dict[str, Any] = None, duration: Optional[float] = None) -> str:
+        headers, files, data = self._build_request(audio_data, params)
+
+        response = await self._asend_with_retries(
+            lambda: get_async_client("openai").post(self.base_url, headers=headers, files=files, data=data),
+            audio_data,
+            (httpx.TransportError,),
+            duration=duration,
+        )
         response.raise_for_status()
 
-        return response.text if response_format == "text" else response.json()
\ No newline at end of file
+        return response.text if data["response_format"] == "text" else response.json()
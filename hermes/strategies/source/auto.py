@@ -7,11 +7,11 @@ from .web import WebSourceStrategy
 class AutoSourceStrategy(SourceStrategy):
     def get_audio(self, source: str) -> bytes:
         if self.is_youtube_url(source):
-            return YouTubeSourceStrategy().get_audio(source)
+            return YouTubeSourceStrategy(self.config).get_audio(source)
         elif self.is_web_url(source):
-            return WebSourceStrategy().get_audio(source)
+            return WebSourceStrategy(self.config).get_audio(source)
         else:
-            return FileSourceStrategy().get_audio(source)
+            return FileSourceStrategy(self.config).get_audio(source)
 
     @staticmethod
     def is_youtube_url(url: str) -> bool:
@@ -1,42 +1,50 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Dict, Optional
+from ...config import CONFIG
 
 class SourceStrategy(ABC):
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        :param config: The configuration (default: the process-wide configuration)
+        """
+        self.config = config if config is not None else CONFIG
+
     @abstractmethod
     def get_audio(self, source: str) -> bytes:
         """
         Retrieve audio data from the given source.
 
         :param source: The source identifier (e.g., file path, URL)
-        :return: Audio data as bytes in MP3 format
+        :return: Audio data as bytes (mono 16 kHz WAV for the built-in sources)
         """
         pass
 
     @classmethod
-    def get_strategy(cls, source_type: str) -> 'SourceStrategy':
+    def get_strategy(cls, source_type: str, config: Optional[Dict[str, Any]] = None) -> 'SourceStrategy':
         """
         Factory method to get the appropriate source strategy.
 
         :param source_type: The type of source strategy to use
+        :param config: The configuration (default: the process-wide configuration)
         :return: An instance of the appropriate SourceStrategy subclass
         """
         if source_type == 'auto':
             from .auto import AutoSourceStrategy
-            return AutoSourceStrategy()
+            return AutoSourceStrategy(config)
         elif source_type == 'file':
             from .file import FileSourceStrategy
-            return FileSourceStrategy()
+            return FileSourceStrategy(config)
         elif source_type == 'youtube':
             from .youtube import YouTubeSourceStrategy
-            return YouTubeSourceStrategy()
+            return YouTubeSourceStrategy(config)
         elif source_type == 'microphone':
             from .microphone import MicrophoneSourceStrategy
-            return MicrophoneSourceStrategy()
+            return MicrophoneSourceStrategy(config)
         elif source_type == 'clipboard':
             from .clipboard import ClipboardSourceStrategy
-            return ClipboardSourceStrategy()
+            return ClipboardSourceStrategy(config)
         elif source_type == 'web':
             from .web import WebSourceStrategy
-            return WebSourceStrategy()
+            return WebSourceStrategy(config)
         else:
             raise ValueError(f"Unknown source type: {source_type}")
\ No newline at end of file
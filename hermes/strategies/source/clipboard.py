@@ -1,7 +1,12 @@
 from .base import SourceStrategy
-from ...utils.audio import get_audio_from_clipboard
+from .auto import AutoSourceStrategy
+from .youtube import YouTubeSourceStrategy
+from .web import WebSourceStrategy
+from ...utils.audio import get_clipboard_url
 from typing import Any
 class ClipboardSourceStrategy(SourceStrategy):
     def get_audio(self, source: str) -> bytes:
-        audio_data = get_audio_from_clipboard()
-        return audio_data.export(format="mp3").read()
+        url = get_clipboard_url()
+        if AutoSourceStrategy.is_youtube_url(url):
+            return YouTubeSourceStrategy(self.config).get_audio(url)
+        return WebSourceStrategy(self.config).get_audio(url)
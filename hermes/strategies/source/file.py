@@ -1,6 +1,6 @@
 import os
 from .base import SourceStrategy
-from ...utils.audio import load_audio_file, convert_to_wav
+from ...utils.audio import decode_to_wav
 from typing import Any
 
 class FileSourceStrategy(SourceStrategy):
@@ -8,5 +8,4 @@ class FileSourceStrategy(SourceStrategy):
         abs_path = os.path.abspath(source)
         if not os.path.isfile(abs_path):
             raise FileNotFoundError(f"The file {abs_path} does not exist")
-        audio = load_audio_file(abs_path)
-        return convert_to_wav(audio)
\ No newline at end of file
+        return decode_to_wav(abs_path)
\ No newline at end of file
@@ -1,8 +1,9 @@
 from .base import SourceStrategy
-from ...utils.audio import record_audio
+from ...utils.audio import record_audio, convert_to_wav
 from typing import Any
 
 class MicrophoneSourceStrategy(SourceStrategy):
     def get_audio(self, source: str) -> bytes:
+        # Recorded as 16 kHz mono, so the WAV needs no resampling and no MP3 round trip
         audio_data = record_audio()
-        return audio_data.export(format="mp3").read()
\ No newline at end of file
+        return convert_to_wav(audio_data)
\ No newline at end of file
@@ -1,7 +1,15 @@
 from .base import SourceStrategy
-from ...utils.audio import download_web_audio
+from ...utils.audio import download_web_wav
+from ...utils.cache import get_media_cache, web_media_key
 from typing import Any
 class WebSourceStrategy(SourceStrategy):
     def get_audio(self, source: str) -> bytes:
-        audio_data = download_web_audio(source)
-        return audio_data.export(format="mp3").read()
\ No newline at end of file
+        options = self.config.get('download') or {}
+        media_cache = get_media_cache(self.config.get('media_cache') or {'enabled': False})
+        if media_cache.enabled:
+            from ...utils.download import fetch_validator
+            # Without an ETag or Last-Modified there is no way to tell a changed file from the cached one
+            validator = fetch_validator(source, timeout=options.get('timeout', 60))
+            if validator:
+                return media_cache.get_or_fetch(web_media_key(source, validator), lambda: download_web_wav(source, **options))
+        return download_web_wav(source, **options)
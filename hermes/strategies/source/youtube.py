@@ -1,9 +1,10 @@
 from .base import SourceStrategy
-from ...utils.audio import download_youtube_audio
+from ...utils.audio import download_youtube_wav
+from ...utils.cache import get_media_cache, youtube_media_key
 from typing import Any
-from pydub import AudioSegment
 
 class YouTubeSourceStrategy(SourceStrategy):
     def get_audio(self, source: str) -> bytes:
-        audioSegment : AudioSegment = download_youtube_audio(source)
-        return audioSegment.export(format="mp3").read()
+        # The native stream (m4a/webm) is decoded once to WAV; the upload codec is applied later
+        media_cache = get_media_cache(self.config.get('media_cache') or {'enabled': False})
+        return media_cache.get_or_fetch(youtube_media_key(source), lambda: download_youtube_wav(source))
@@ -1,101 +1,280 @@
+import io
 import os
+import bisect
 import tempfile
-from typing import Any
-import ffmpeg
-import yt_dlp
-import pyperclip
-import sounddevice as sd
-import numpy as np
-import requests
-from pydub import AudioSegment
+import wave
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from .lazy import LazyModule
 
-def load_audio_file(file_path: str) -> AudioSegment:
+if TYPE_CHECKING:
+    import numpy
+    from pydub import AudioSegment
+
+# Heavy dependencies are imported on first use, so importing this module stays cheap
+ffmpeg = LazyModule('ffmpeg')
+yt_dlp = LazyModule('yt_dlp')
+pyperclip = LazyModule('pyperclip')
+sd = LazyModule('sounddevice')
+np = LazyModule('numpy')
+pydub = LazyModule('pydub')
+pydub_silence = LazyModule('pydub.silence')
+
+def load_audio_file(file_path: str) -> 'AudioSegment':
     """
     Load an audio file using pydub.
 
     :param file_path: Path to the audio file
     :return: AudioSegment object
     """
-    return AudioSegment.from_file(file_path)
+    return pydub.AudioSegment.from_file(file_path)
 
-def download_youtube_audio(url: str) -> AudioSegment:
+def iter_pcm_chunks(file_path: str, sample_rate: int = 16000, chunk_size: int = 1 << 16) -> Iterator[bytes]:
     """
-    Download audio from a YouTube video.
+    Decode an audio/video file with ffmpeg and stream it as raw PCM.
 
-    :param url: YouTube video URL
+    ffmpeg resamples to mono 16-bit PCM at ``sample_rate`` and the output is read from
+    its stdout pipe chunk by chunk, so the full decoded stream is never held in memory.
+
+    :param file_path: Path to the audio or video file
+    :param sample_rate: Desired sample rate
+    :param chunk_size: Number of bytes to read from ffmpeg per chunk
+    :return: Iterator over chunks of signed 16-bit little-endian mono PCM
+    """
+    process = (
+        ffmpeg
+        .input(file_path)
+        .output('pipe:', format='s16le', acodec='pcm_s16le', ac=1, ar=sample_rate)
+        .global_args('-loglevel', 'error', '-nostdin')
+        .run_async(pipe_stdout=True, pipe_stderr=True)
+    )
+    finished = False
+    try:
+        while True:
+            chunk = process.stdout.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+        finished = True
+    finally:
+        if not finished and process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        stderr = process.stderr.read()
+        process.stderr.close()
+        returncode = process.wait()
+
+    if returncode != 0:
+        raise RuntimeError(f"ffmpeg failed to decode {file_path}: {stderr.decode(errors='replace').strip()}")
+
+def decode_to_wav(file_path: str, sample_rate: int = 16000) -> bytes:
+    """
+    Decode a file straight to mono WAV at the given sample rate using ffmpeg.
+
+    Unlike ``load_audio_file`` + ``convert_to_wav`` this never materializes the
+    decoded audio at its original rate and channel count.
+
+    :param file_path: Path to the audio or video file
+    :param sample_rate: Desired sample rate
+    :return: WAV audio data as bytes
+    """
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        for chunk in iter_pcm_chunks(file_path, sample_rate=sample_rate):
+            wav_file.writeframesraw(chunk)
+    return buffer.getvalue()
+
+def decode_stream_to_wav(chunks: Iterable[bytes], sample_rate: int = 16000) -> bytes:
+    """
+    Decode media arriving in chunks (e.g. from a download) to mono WAV while it arrives.
+
+    The chunks are fed to ffmpeg's stdin from a background thread while the decoded PCM
+    is read from its stdout, so decoding overlaps with producing the input. The input
+    iterator is always consumed to the end, even if ffmpeg gives up early.
+
+    :param chunks: Iterable of encoded media bytes
+    :param sample_rate: Desired sample rate
+    :return: WAV audio data as bytes
+    """
+    process = (
+        ffmpeg
+        .input('pipe:')
+        .output('pipe:', format='s16le', acodec='pcm_s16le', ac=1, ar=sample_rate)
+        .global_args('-loglevel', 'error', '-nostdin')
+        .run_async(pipe_stdin=True, pipe_stdout=True, pipe_stderr=True)
+    )
+    errors = []
+    stderr = []
+
+    def feed():
+        writable = True
+        try:
+            for chunk in chunks:
+                if writable:
+                    try:
+                        process.stdin.write(chunk)
+                    except OSError:
+                        # ffmpeg stopped reading; keep draining so the producer finishes
+                        writable = False
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+
+    feeder = threading.Thread(target=feed, daemon=True)
+    reader = threading.Thread(target=lambda: stderr.append(process.stderr.read()), daemon=True)
+    feeder.start()
+    reader.start()
+
+    buffer = io.BytesIO()
+    try:
+        with wave.open(buffer, 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            for chunk in iter(lambda: process.stdout.read(1 << 16), b''):
+                wav_file.writeframesraw(chunk)
+    except BaseException:
+        process.kill()
+        raise
+    finally:
+        feeder.join()
+        reader.join()
+        returncode = process.wait()
+
+    if errors:
+        raise errors[0]
+    if returncode != 0:
+        message = stderr[0].decode(errors='replace').strip() if stderr else ''
+        raise RuntimeError(f"ffmpeg failed to decode the stream: {message}")
+    return buffer.getvalue()
+
+def load_audio_bytes(audio_data: bytes) -> 'AudioSegment':
+    """
+    Load encoded audio bytes (as returned by a source strategy) using pydub.
+
+    :param audio_data: Encoded audio data (WAV, MP3, ...)
     :return: AudioSegment object
     """
+    # WAV can be parsed in-process; everything else goes through ffmpeg
+    audio_format = "wav" if audio_data[:4] == b"RIFF" else None
+    return pydub.AudioSegment.from_file(io.BytesIO(audio_data), format=audio_format)
+
+def fetch_youtube_audio(url: str, directory: str) -> str:
+    """
+    Download the native best audio stream of a YouTube video (m4a, webm/opus, ...) without transcoding.
+
+    :param url: YouTube video URL
+    :param directory: Directory to download into
+    :return: Path of the downloaded file
+    """
     ydl_opts = {
         'format': 'bestaudio/best',
-        'postprocessors': [{
-            'key': 'FFmpegExtractAudio',
-            'preferredcodec': 'mp3',
-            'preferredquality': '192',
-        }],
-        'outtmpl': '%(id)s.%(ext)s',
+        'outtmpl': os.path.join(directory, '%(id)s.%(ext)s'),
+        'quiet': True,
+        'noprogress': True,
     }
 
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
         info = ydl.extract_info(url, download=True)
-        filename = f"{info['id']}.mp3"
+        downloads = info.get('requested_downloads') or []
+        if downloads and downloads[0].get('filepath'):
+            return downloads[0]['filepath']
+        return ydl.prepare_filename(info)
 
-    audio = AudioSegment.from_mp3(filename)
-    os.remove(filename)
-    return audio
+def download_youtube_wav(url: str, sample_rate: int = 16000) -> bytes:
+    """
+    Download audio from a YouTube video as mono WAV, decoding the native stream once.
+
+    :param url: YouTube video URL
+    :param sample_rate: Desired sample rate
+    :return: WAV audio data as bytes
+    """
+    with tempfile.TemporaryDirectory(prefix='hermes-youtube-') as directory:
+        return decode_to_wav(fetch_youtube_audio(url, directory), sample_rate)
+
+def download_youtube_audio(url: str) -> 'AudioSegment':
+    """
+    Download audio from a YouTube video.
 
-def record_audio(duration: int = 10, sample_rate: int = 44100) -> AudioSegment:
+    :param url: YouTube video URL
+    :return: AudioSegment object
+    """
+    return load_audio_bytes(download_youtube_wav(url))
+
+def record_audio(duration: int = 10, sample_rate: int = 16000) -> 'AudioSegment':
     """
     Record audio from the microphone.
 
     :param duration: Recording duration in seconds
     :param sample_rate: Sample rate for recording
-    :return: AudioSegment object
+    :return: AudioSegment object (16-bit mono)
     """
     print(f"Recording for {duration} seconds...")
-    recording = sd.rec(int(duration * sample_rate), samplerate=sample_rate, channels=2)
+    recording = sd.rec(int(duration * sample_rate), samplerate=sample_rate, channels=1, dtype='int16')
     sd.wait()
     print("Recording finished.")
 
     # Convert numpy array to AudioSegment
-    audio = AudioSegment(
+    audio = pydub.AudioSegment(
         recording.tobytes(),
         frame_rate=sample_rate,
         sample_width=recording.dtype.itemsize,
-        channels=2
+        channels=1
     )
     return audio
 
-def get_audio_from_clipboard() -> AudioSegment:
+def get_clipboard_url() -> str:
+    """
+    Get the audio URL currently in the clipboard.
+
+    :return: The URL
+    """
+    clipboard_content = pyperclip.paste().strip()
+    if clipboard_content.startswith(('http://', 'https://')):
+        return clipboard_content
+    raise ValueError("No valid audio URL found in clipboard")
+
+def get_audio_from_clipboard() -> 'AudioSegment':
     """
     Get audio data from the clipboard.
 
     :return: AudioSegment object
     """
-    clipboard_content = pyperclip.paste()
-    if clipboard_content.startswith(('http://', 'https://')):
-        return download_web_audio(clipboard_content)
-    else:
-        raise ValueError("No valid audio URL found in clipboard")
+    return download_web_audio(get_clipboard_url())
+
+def download_web_wav(url: str, sample_rate: int = 16000, **options) -> bytes:
+    """
+    Download audio or video from a web URL and decode it once to mono WAV.
+
+    The container and codec are detected by ffmpeg, so MP3, M4A, Opus, video files, etc.
+    all work. The download is streamed and decoded as it arrives; see
+    ``hermes.utils.download.download_and_decode`` for the options.
 
-def download_web_audio(url: str) -> AudioSegment:
+    :param url: URL of the media file
+    :param sample_rate: Desired sample rate
+    :param options: Download options (chunk_size, segments, min_parallel_size, timeout)
+    :return: WAV audio data as bytes
+    """
+    from .download import download_and_decode
+    return download_and_decode(url, sample_rate, **options)
+
+def download_web_audio(url: str) -> 'AudioSegment':
     """
     Download audio from a web URL.
 
     :param url: URL of the audio file
     :return: AudioSegment object
     """
-    response = requests.get(url)
-    response.raise_for_status()
-
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as temp_file:
-        temp_file.write(response.content)
-        temp_file_path = temp_file.name
-
-    audio = AudioSegment.from_mp3(temp_file_path)
-    os.remove(temp_file_path)
-    return audio
+    return load_audio_bytes(download_web_wav(url))
 
-def convert_to_wav(audio: AudioSegment, sample_rate: int = 16000) -> bytes:
+def convert_to_wav(audio: 'AudioSegment', sample_rate: int = 16000) -> bytes:
     """
     Convert AudioSegment to WAV format with specified sample rate.
 
@@ -104,14 +283,92 @@ def convert_to_wav(audio: AudioSegment, sample_rate: int = 16000) -> bytes:
     :return: WAV audio data as bytes
     """
     try:
-        audio = audio.set_frame_rate(sample_rate).set_channels(1)
+        audio = audio.set_frame_rate(sample_rate).set_channels(1).set_sample_width(2)
         buffer = audio.export(format="wav")
         return buffer.read()
     except Exception as e:
         print(f"Error converting audio to WAV: {e}")
         return None
 
-def get_audio_duration(audio: AudioSegment) -> float:
+UPLOAD_CODECS = {
+    'flac': {'format': 'flac', 'acodec': 'flac'},
+    'ogg': {'format': 'ogg', 'acodec': 'libopus', 'audio_bitrate': '24k'},
+    'mp3': {'format': 'mp3', 'acodec': 'libmp3lame', 'audio_bitrate': '32k'},
+}
+
+AUDIO_SIGNATURES = [
+    (b'RIFF', ('wav', 'audio/wav')),
+    (b'fLaC', ('flac', 'audio/flac')),
+    (b'OggS', ('ogg', 'audio/ogg')),
+    (b'ID3', ('mp3', 'audio/mpeg')),
+    (b'\xff\xfb', ('mp3', 'audio/mpeg')),
+    (b'\xff\xf3', ('mp3', 'audio/mpeg')),
+    (b'\xff\xf2', ('mp3', 'audio/mpeg')),
+    (b'\x1a\x45\xdf\xa3', ('webm', 'audio/webm')),
+]
+
+def detect_audio_format(audio_data: bytes) -> Tuple[str, str]:
+    """
+    Detect the container of encoded audio from its magic bytes.
+
+    :param audio_data: Encoded audio data
+    :return: (file extension, MIME type); WAV if the format is not recognized
+    """
+    for signature, audio_format in AUDIO_SIGNATURES:
+        if audio_data.startswith(signature):
+            return audio_format
+    if audio_data[4:8] == b'ftyp':
+        return ('m4a', 'audio/mp4')
+    return ('wav', 'audio/wav')
+
+def encode_for_upload(audio_data: bytes, codec: Optional[str] = None, sample_rate: int = 16000) -> bytes:
+    """
+    Re-encode WAV audio with a compressed codec before uploading it to a provider.
+
+    Only WAV input is re-encoded; audio that is already compressed is returned as-is,
+    and so is the WAV if encoding fails.
+
+    :param audio_data: Audio data as bytes
+    :param codec: One of "flac", "ogg" (Opus) or "mp3"; None or "wav" keeps WAV
+    :param sample_rate: Sample rate of the encoded audio
+    :return: Encoded audio data as bytes
+    """
+    if not codec or codec == 'wav' or audio_data[:4] != b'RIFF':
+        return audio_data
+    if codec not in UPLOAD_CODECS:
+        raise ValueError(f"Unknown upload codec: {codec}")
+    try:
+        encoded, _ = (
+            ffmpeg
+            .input('pipe:', format='wav')
+            .output('pipe:', ac=1, ar=sample_rate, **UPLOAD_CODECS[codec])
+            .global_args('-loglevel', 'error', '-nostdin')
+            .run(input=audio_data, capture_stdout=True, capture_stderr=True)
+        )
+        return encoded
+    except (ffmpeg.Error, OSError) as e:
+        print(f"Error encoding audio to {codec}, uploading WAV instead: {getattr(e, 'stderr', e)}")
+        return audio_data
+
+def estimate_audio_duration(audio_data: bytes) -> float:
+    """
+    Get the duration of encoded audio without decoding it.
+
+    WAV durations are read from the header; for compressed formats the duration is
+    estimated assuming roughly 128 kbps.
+
+    :param audio_data: Encoded audio data
+    :return: Duration in seconds
+    """
+    if audio_data[:4] == b"RIFF":
+        try:
+            with wave.open(io.BytesIO(audio_data)) as wav_file:
+                return wav_file.getnframes() / float(wav_file.getframerate())
+        except (wave.Error, EOFError):
+            pass
+    return len(audio_data) / 16000.0
+
+def get_audio_duration(audio: 'AudioSegment') -> float:
     """
     Get the duration of an AudioSegment in seconds.
 
@@ -119,3 +376,209 @@ def get_audio_duration(audio: AudioSegment) -> float:
     :return: Duration in seconds
     """
     return len(audio) / 1000.0
+
+def split_on_silence_boundaries(
+    audio: 'AudioSegment',
+    chunk_length: float = 600,
+    min_silence_len: int = 500,
+    silence_thresh: Optional[float] = None,
+    search_window: float = 30,
+) -> List[Tuple[float, 'AudioSegment']]:
+    """
+    Split audio into chunks of roughly ``chunk_length`` seconds, cutting at silence.
+
+    For every chunk the last ``search_window`` seconds before the target cut point are
+    searched for silence, and the cut is placed in the middle of the latest silent span.
+    If no silence is found the audio is cut exactly at the target length.
+
+    :param audio: AudioSegment object
+    :param chunk_length: Target chunk length in seconds
+    :param min_silence_len: Minimum silence length in milliseconds to cut at
+    :param silence_thresh: Silence threshold in dBFS (default: 16 dB below the audio's loudness)
+    :param search_window: Length in seconds of the window searched for silence before each cut
+    :return: List of (offset in seconds, AudioSegment) tuples
+    """
+    chunk_ms = int(chunk_length * 1000)
+    window_ms = min(int(search_window * 1000), chunk_ms // 2)
+    if silence_thresh is None:
+        silence_thresh = audio.dBFS - 16
+
+    chunks = []
+    start = 0
+    total = len(audio)
+    while start < total:
+        end = start + chunk_ms
+        if end >= total:
+            end = total
+        else:
+            window_start = end - window_ms
+            silences = pydub_silence.detect_silence(
+                audio[window_start:end],
+                min_silence_len=min_silence_len,
+                silence_thresh=silence_thresh,
+                seek_step=10,
+            )
+            if silences:
+                silence_start, silence_end = silences[-1]
+                end = window_start + (silence_start + silence_end) // 2
+        chunks.append((start / 1000.0, audio[start:end]))
+        start = end
+    return chunks
+
+class OffsetMap:
+    """
+    Maps times in audio with silence removed back to times in the original audio.
+    """
+
+    def __init__(self, segments: List[Tuple[float, float, float]]):
+        """
+        :param segments: List of (start in stripped audio, start in original audio, duration) tuples, in order
+        """
+        self.segments = segments
+        self._kept_starts = [kept_start for kept_start, _, _ in segments]
+
+    def to_original(self, seconds: float) -> float:
+        """
+        Translate a time in the stripped audio to the original audio.
+
+        :param seconds: Time in the stripped audio
+        :return: Time in the original audio
+        """
+        if not self.segments:
+            return seconds
+        index = max(0, bisect.bisect_right(self._kept_starts, seconds) - 1)
+        kept_start, original_start, duration = self.segments[index]
+        return original_start + min(max(seconds - kept_start, 0.0), duration)
+
+def detect_speech_regions(
+    samples: 'numpy.ndarray',
+    sample_rate: int = 16000,
+    frame_ms: int = 30,
+    energy_threshold: Optional[float] = None,
+    zcr_threshold: float = 0.25,
+    min_silence_ms: int = 1000,
+    padding_ms: int = 200,
+) -> List[Tuple[int, int]]:
+    """
+    Find speech in 16-bit PCM using short-time energy and zero-crossing rate.
+
+    A frame counts as speech if its energy is above the threshold, or within 10 dB of
+    it with a high zero-crossing rate (unvoiced consonants are quiet but noisy). Speech
+    regions are padded and merged across gaps shorter than ``min_silence_ms``.
+
+    :param samples: Mono 16-bit PCM samples
+    :param sample_rate: Sample rate of the samples
+    :param frame_ms: Analysis frame length in milliseconds
+    :param energy_threshold: Energy threshold in dBFS (default: adaptive, 30% of the way from the noise floor to the speech level)
+    :param zcr_threshold: Zero-crossing rate (crossings per sample) above which quiet frames still count as speech
+    :param min_silence_ms: Minimum length of silence to remove, in milliseconds
+    :param padding_ms: Audio kept around each speech region, in milliseconds
+    :return: List of (start sample, end sample) tuples
+    """
+    frame = max(1, int(sample_rate * frame_ms / 1000))
+    count = len(samples) // frame
+    if count == 0:
+        return [(0, len(samples))] if len(samples) else []
+
+    frames = samples[:count * frame].astype(np.float32).reshape(count, frame) / 32768.0
+    energy = 20 * np.log10(np.sqrt(np.mean(frames ** 2, axis=1)) + 1e-10)
+    zcr = np.mean(np.abs(np.diff(np.signbit(frames).astype(np.int8), axis=1)), axis=1)
+
+    if energy_threshold is None:
+        noise_floor, speech_level = np.percentile(energy, [10, 95])
+        if speech_level - noise_floor > 6:
+            energy_threshold = noise_floor + 0.3 * (speech_level - noise_floor)
+        elif speech_level > -60:
+            energy_threshold = noise_floor - 1  # uniformly loud: keep everything
+        else:
+            energy_threshold = 0.0  # uniformly quiet: nothing is speech
+
+    speech = (energy > energy_threshold) | ((energy > energy_threshold - 10) & (zcr > zcr_threshold))
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], speech.astype(np.int8), [0]))))
+
+    padding = int(sample_rate * padding_ms / 1000)
+    min_silence = int(sample_rate * min_silence_ms / 1000)
+    regions = []
+    for start_frame, end_frame in edges.reshape(-1, 2):
+        start = max(0, start_frame * frame - padding)
+        end = len(samples) if end_frame == count else min(len(samples), end_frame * frame + padding)
+        if regions and start - regions[-1][1] < min_silence:
+            regions[-1] = (regions[-1][0], max(regions[-1][1], end))
+        else:
+            regions.append((start, end))
+    return regions
+
+def pcm_to_wav(samples: 'numpy.ndarray', sample_rate: int = 16000) -> bytes:
+    """
+    Wrap 16-bit mono PCM samples in a WAV container.
+
+    :param samples: 1-D array of 16-bit samples
+    :param sample_rate: Sample rate of the samples
+    :return: WAV audio data as bytes
+    """
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(np.asarray(samples, dtype='<i2').tobytes())
+    return buffer.getvalue()
+
+def decode_to_float32(audio_data: bytes, sample_rate: int = 16000) -> 'numpy.ndarray':
+    """
+    Decode audio into the mono float32 samples in [-1, 1] expected by in-process Whisper models.
+
+    :param audio_data: Audio data as bytes (16-bit mono WAV at ``sample_rate`` is read directly, anything else is converted)
+    :param sample_rate: Sample rate of the returned samples
+    :return: 1-D float32 array of samples
+    """
+    if audio_data[:4] == b"RIFF":
+        with wave.open(io.BytesIO(audio_data)) as wav_file:
+            if wav_file.getnchannels() == 1 and wav_file.getsampwidth() == 2 and wav_file.getframerate() == sample_rate:
+                samples = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype='<i2')
+                return samples.astype(np.float32) / 32768.0
+    return decode_to_float32(convert_to_wav(load_audio_bytes(audio_data), sample_rate), sample_rate)
+
+def strip_silence(audio_data: bytes, **options) -> Tuple[bytes, OffsetMap, Dict[str, float]]:
+    """
+    Remove long silent spans from audio before it is transcribed.
+
+    :param audio_data: Audio data as bytes (16 kHz mono WAV is used as-is, anything else is converted)
+    :param options: Options for ``detect_speech_regions``
+    :return: The audio without silence as WAV bytes, an OffsetMap back to the original timeline, and a report of the removed audio
+    """
+    if audio_data[:4] != b"RIFF":
+        audio_data = convert_to_wav(load_audio_bytes(audio_data))
+    with wave.open(io.BytesIO(audio_data)) as wav_file:
+        sample_rate = wav_file.getframerate()
+        if wav_file.getnchannels() != 1 or wav_file.getsampwidth() != 2:
+            return strip_silence(convert_to_wav(load_audio_bytes(audio_data), sample_rate), **options)
+        samples = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype='<i2')
+
+    original_duration = len(samples) / float(sample_rate)
+    regions = detect_speech_regions(samples, sample_rate, **options)
+    if not regions:
+        # Nothing recognizable as speech; leave the audio alone rather than upload nothing
+        regions = [(0, len(samples))]
+
+    segments = []
+    kept = 0
+    for start, end in regions:
+        segments.append((kept / float(sample_rate), start / float(sample_rate), (end - start) / float(sample_rate)))
+        kept += end - start
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        for start, end in regions:
+            wav_file.writeframesraw(samples[start:end].tobytes())
+
+    kept_duration = kept / float(sample_rate)
+    report = {
+        'original_duration': original_duration,
+        'kept_duration': kept_duration,
+        'removed_seconds': original_duration - kept_duration,
+    }
+    return buffer.getvalue(), OffsetMap(segments), report
@@ -1,33 +1,498 @@
 import os
+import re
 import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Tuple
+
+def hash_bytes(data: bytes) -> str:
+    """
+    Compute a fast content hash of the given bytes.
+
+    :param data: The data to hash
+    :return: Hex digest
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def hash_file(path: str, block_size: int = 1 << 20) -> str:
+    """
+    Compute a fast content hash of a file, reading it in blocks.
+
+    :param path: Path to the file
+    :param block_size: Number of bytes to read at a time
+    :return: Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def content_cache_key(content_hash: str, provider: str, params: Dict[str, Any]) -> str:
+    """
+    Build a cache key from the audio content hash and everything that affects the transcription.
+
+    :param content_hash: Hash of the audio content
+    :param provider: The name of the provider strategy
+    :param params: Provider parameters (model, response_format, ...); API keys are ignored
+    :return: Cache key
+    """
+    relevant = {key: value for key, value in params.items() if key != 'api_key'}
+    params_hash = hash_bytes(json.dumps([provider, relevant], sort_keys=True, default=str).encode())
+    return f"content_{content_hash}_{params_hash}"
+
+def llm_cache_key(text: str, prompt: str, model: str, params: Dict[str, Any]) -> str:
+    """
+    Build a cache key for an LLM result from everything that affects it.
+
+    :param text: The text processed (e.g. the transcription)
+    :param prompt: The prompt
+    :param model: The model, as "provider/model"
+    :param params: Additional arguments of the LLM call; API keys are ignored
+    :return: Cache key
+    """
+    relevant = {key: value for key, value in params.items() if key != 'api_key'}
+    return f"llm_{hash_bytes(json.dumps([text, prompt, model, relevant], sort_keys=True, default=str).encode())}"
+
+YOUTUBE_ID_PATTERN = re.compile(r'(?:[?&]v=|youtu\.be/|/shorts/|/embed/|/live/)([\w-]{11})')
+
+def youtube_media_key(url: str, sample_rate: int = 16000) -> str:
+    """
+    Build the media cache key of a YouTube video.
+
+    Videos are keyed by their id, so every URL form of the same video shares one entry.
+
+    :param url: URL of the video
+    :param sample_rate: Sample rate of the cached audio
+    :return: Cache key
+    """
+    match = YOUTUBE_ID_PATTERN.search(url)
+    identity = match.group(1) if match else url
+    return f"youtube_{hash_bytes(json.dumps([identity, sample_rate]).encode())}"
+
+def web_media_key(url: str, validator: str, sample_rate: int = 16000) -> str:
+    """
+    Build the media cache key of a web resource.
+
+    :param url: URL of the resource
+    :param validator: ETag or Last-Modified value of the resource, so a changed file gets a new entry
+    :param sample_rate: Sample rate of the cached audio
+    :return: Cache key
+    """
+    return f"web_{hash_bytes(json.dumps([url, validator, sample_rate]).encode())}"
 
 class Cache:
     def __init__(self, config: Dict[str, Any]):
         self.enabled = config.get('enabled', True)
         self.cache_dir = Path(config.get('directory', Path.home() / '.hermes' / 'cache'))
+        self.ttl = config.get('ttl')
         if self.enabled:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+    @classmethod
+    def get_cache(cls, config: Dict[str, Any]) -> 'Cache':
+        """
+        Factory method to get the cache backend selected in the configuration.
+
+        :param config: The cache section of the configuration
+        :return: An instance of the appropriate Cache subclass
+        """
+        backend = config.get('backend', 'file')
+        if backend == 'file':
+            cache = Cache(config)
+        elif backend == 'sqlite':
+            cache = SQLiteCache(config)
+        else:
+            raise ValueError(f"Unknown cache backend: {backend}")
+
+        memory = config.get('memory') or {}
+        if memory.get('enabled'):
+            return MemoryCache(cache, memory)
+        return cache
+
     def get(self, key: str) -> Optional[str]:
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """
+        Get a value together with its expiry time.
+
+        :param key: The cache key
+        :return: Tuple of (value, expiry timestamp or None), or None if there is no live entry
+        """
         if not self.enabled:
             return None
         cache_file = self.cache_dir / f"{key}.json"
         if cache_file.exists():
             with open(cache_file, 'r') as f:
-                return json.load(f)['transcription']
+                entry = json.load(f)
+            if entry.get('expires_at') and entry['expires_at'] < time.time():
+                return None
+            return entry['transcription'], entry.get('expires_at')
         return None
 
-    def set(self, key: str, value: str):
+    def set(self, key: str, value: str, ttl: Optional[float] = None):
         if not self.enabled:
             return
+        ttl = ttl if ttl is not None else self.ttl
+        entry = {'transcription': value}
+        if ttl:
+            entry['expires_at'] = time.time() + ttl
         cache_file = self.cache_dir / f"{key}.json"
         with open(cache_file, 'w') as f:
-            json.dump({'transcription': value}, f)
+            json.dump(entry, f)
             
+    def file_digest(self, path: str) -> str:
+        """
+        Hash a local file, reusing the previous hash if its size and mtime are unchanged.
+
+        :param path: Path to the file
+        :return: Hex digest of the file contents
+        """
+        stat = os.stat(path)
+        fingerprint = f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+        fingerprint_key = f"fingerprint_{hash_bytes(fingerprint.encode())}"
+        digest = self.get(fingerprint_key)
+        if digest is None:
+            digest = hash_file(path)
+            self.set(fingerprint_key, digest)
+        return digest
+
     def clear(self):
         if not self.enabled:
             return
         for cache_file in self.cache_dir.glob('*.json'):
-            cache_file.unlink()
\ No newline at end of file
+            cache_file.unlink()
+
+class SQLiteCache(Cache):
+    """
+    Cache backed by a single SQLite database file.
+
+    Lookups go through the primary key index, writes are transactional (and therefore
+    safe across threads and processes sharing the file), and entries are evicted
+    least-recently-used first once ``max_entries`` or ``max_bytes`` is exceeded.
+    Entries may carry a TTL, either per call or from the ``ttl`` config option.
+
+    Reads only record the access time of an entry when the recorded one is more
+    than ``touch_interval`` seconds old, so most hits don't take the write lock.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            accessed_at REAL NOT NULL,
+            expires_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+        CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.max_entries = config.get('max_entries')
+        self.max_bytes = config.get('max_bytes')
+        touch_interval = config.get('touch_interval')
+        self.touch_interval = 60 if touch_interval is None else touch_interval
+        self.db_path = self.cache_dir / config.get('filename', 'cache.sqlite3')
+        self._local = threading.local()
+        if self.enabled:
+            self._connection().executescript(self.SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections may not be shared between threads, so keep one per thread
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        if not self.enabled:
+            return None
+        connection = self._connection()
+        row = connection.execute('SELECT value, expires_at, accessed_at FROM entries WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        value, expires_at, accessed_at = row
+        now = time.time()
+        if expires_at is not None and expires_at < now:
+            connection.execute('DELETE FROM entries WHERE key = ? AND expires_at < ?', (key, now))
+            return None
+        if now - accessed_at >= self.touch_interval:
+            connection.execute('UPDATE entries SET accessed_at = ? WHERE key = ?', (now, key))
+        return json.loads(value), expires_at
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None):
+        if not self.enabled:
+            return
+        ttl = ttl if ttl is not None else self.ttl
+        payload = json.dumps(value)
+        now = time.time()
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.execute(
+                'INSERT OR REPLACE INTO entries (key, value, size, accessed_at, expires_at) VALUES (?, ?, ?, ?, ?)',
+                (key, payload, len(payload.encode()), now, now + ttl if ttl else None),
+            )
+            self._evict(connection, now)
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def _evict(self, connection: sqlite3.Connection, now: float):
+        connection.execute('DELETE FROM entries WHERE expires_at < ?', (now,))
+        if self.max_entries:
+            connection.execute(
+                'DELETE FROM entries WHERE key IN ('
+                'SELECT key FROM entries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,),
+            )
+        if self.max_bytes:
+            total = connection.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+            if total > self.max_bytes:
+                evicted = []
+                for key, size in connection.execute('SELECT key, size FROM entries ORDER BY accessed_at'):
+                    if total <= self.max_bytes:
+                        break
+                    evicted.append((key,))
+                    total -= size
+                connection.executemany('DELETE FROM entries WHERE key = ?', evicted)
+
+    def clear(self):
+        if not self.enabled:
+            return
+        self._connection().execute('DELETE FROM entries')
+
+
+class MemoryCache(Cache):
+    """
+    In-process LRU cache layered in front of another Cache.
+
+    Reads are served from memory when possible and fall through to the backend
+    otherwise (populating memory on the way back); writes go to both. Memory use is
+    bounded by ``max_entries`` and by ``max_bytes``, measured on the JSON-encoded values.
+    """
+
+    def __init__(self, backend: Cache, config: Dict[str, Any]):
+        self.backend = backend
+        self.enabled = backend.enabled
+        self.cache_dir = backend.cache_dir
+        self.ttl = backend.ttl
+        self.max_entries = config.get('max_entries', 1024)
+        self.max_bytes = config.get('max_bytes', 64 * 1024 * 1024)
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        now = time.time()
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                value, size, expires_at = entry
+                if expires_at is None or expires_at >= now:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                self._discard(key)
+            self.misses += 1
+
+        entry = self.backend.get_entry(key)
+        if entry is None:
+            return None
+        # Keep the entry in memory no longer than the backend does
+        value, expires_at = entry
+        self._remember(key, value, expires_at)
+        return value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None):
+        if not self.enabled:
+            return
+        ttl = ttl if ttl is not None else self.ttl
+        self.backend.set(key, value, ttl=ttl)
+        self._remember(key, value, time.time() + ttl if ttl else None)
+
+    def _remember(self, key: str, value: Any, expires_at: Optional[float]):
+        size = len(json.dumps(value))
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                return
+            self.entries[key] = (value, size, expires_at)
+            self.size += size
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                _, (_, evicted_size, _) = self.entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+
+    def _discard(self, key: str):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the counters of the in-memory tier.
+
+        :return: A dictionary with hits, misses, evictions, entries and bytes
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self.entries),
+                'bytes': self.size,
+            }
+
+    def clear(self):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.entries.clear()
+            self.size = 0
+        self.backend.clear()
+
+
+class MediaCache:
+    """
+    On-disk cache of decoded audio (mono WAV) for remote sources.
+
+    Each entry is a WAV file named after its key, written atomically. Reads refresh the
+    modification time, and once the directory grows beyond ``max_bytes`` the least
+    recently used entries are removed.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self.enabled = config.get('enabled', True)
+        self.directory = Path(config.get('directory', Path.home() / '.hermes' / 'media'))
+        self.max_bytes = config.get('max_bytes')
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        if self.enabled:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.wav"
+
+    def get(self, key: str) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def set(self, key: str, data: bytes):
+        if not self.enabled:
+            return
+        path = self._path(key)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        self._evict()
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], bytes]) -> bytes:
+        """
+        Get an entry, or fetch it and store it on a miss.
+
+        :param key: Cache key (see youtube_media_key and web_media_key)
+        :param fetch: Function downloading and decoding the audio
+        :return: WAV audio data as bytes
+        """
+        data = self.get(key)
+        if data is None:
+            data = fetch()
+            self.set(key, data)
+        return data
+
+    def _evict(self):
+        if not self.max_bytes:
+            return
+        entries = []
+        for path in self.directory.glob('*.wav'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            with self._lock:
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the counters of the media cache.
+
+        :return: A dictionary with hits, misses, evictions, entries and bytes
+        """
+        sizes = [path.stat().st_size for path in self.directory.glob('*.wav')] if self.enabled else []
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(sizes),
+                'bytes': sum(sizes),
+            }
+
+    def clear(self):
+        if not self.enabled:
+            return
+        for path in self.directory.glob('*.wav'):
+            path.unlink()
+
+_media_caches: Dict[str, MediaCache] = {}
+_media_caches_lock = threading.Lock()
+
+def get_media_cache(config: Dict[str, Any]) -> MediaCache:
+    """
+    Get the shared media cache for a configuration, so its counters cover every source.
+
+    :param config: The media_cache section of the configuration
+    :return: MediaCache instance
+    """
+    key = json.dumps(config, sort_keys=True, default=str)
+    with _media_caches_lock:
+        cache = _media_caches.get(key)
+        if cache is None:
+            cache = _media_caches[key] = MediaCache(config)
+        return cache
@@ -0,0 +1,174 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+import requests
+from .http import get_session
+from .audio import decode_stream_to_wav, decode_to_wav
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_MIN_PARALLEL_SIZE = 32 << 20
+
+def probe(url: str, session: Optional[requests.Session] = None, timeout: float = 60) -> Tuple[Optional[int], bool]:
+    """
+    Ask the server for the size of a resource and whether it serves byte ranges.
+
+    :param url: URL of the resource
+    :param session: Session to use (default: the shared 'web' session)
+    :param timeout: Connect/read timeout in seconds
+    :return: Tuple of (size in bytes or None if unknown, True if byte ranges are supported)
+    """
+    session = session or get_session('web')
+    try:
+        response = session.head(url, allow_redirects=True, timeout=timeout)
+    except requests.RequestException:
+        return None, False
+    if response.status_code >= 400:
+        return None, False
+    length = response.headers.get('Content-Length', '')
+    ranges = response.headers.get('Accept-Ranges', '').lower() == 'bytes'
+    return (int(length) if length.isdigit() else None), ranges
+
+def fetch_validator(url: str, session: Optional[requests.Session] = None, timeout: float = 60) -> Optional[str]:
+    """
+    Get the value that changes when a resource changes (its ETag, or else its Last-Modified date).
+
+    :param url: URL of the resource
+    :param session: Session to use (default: the shared 'web' session)
+    :param timeout: Connect/read timeout in seconds
+    :return: The validator, or None if the server provides neither header or can't be reached
+    """
+    session = session or get_session('web')
+    try:
+        response = session.head(url, allow_redirects=True, timeout=timeout)
+    except requests.RequestException:
+        return None
+    if response.status_code >= 400:
+        return None
+    etag = response.headers.get('ETag')
+    if etag:
+        return f"etag:{etag}"
+    last_modified = response.headers.get('Last-Modified')
+    return f"last-modified:{last_modified}" if last_modified else None
+
+def split_ranges(size: int, segments: int) -> List[Tuple[int, int]]:
+    """
+    Split a resource into contiguous byte ranges of about the same length.
+
+    :param size: Size of the resource in bytes
+    :param segments: Number of ranges
+    :return: List of inclusive (first, last) byte offsets
+    """
+    segments = max(1, min(segments, size))
+    step = -(-size // segments)
+    return [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+
+def iter_download(url: str, chunk_size: int = DEFAULT_CHUNK_SIZE, session: Optional[requests.Session] = None, timeout: float = 60) -> Iterator[bytes]:
+    """
+    Stream a resource in chunks instead of loading the whole response in memory.
+
+    :param url: URL of the resource
+    :param chunk_size: Size of the chunks read from the connection
+    :param session: Session to use (default: the shared 'web' session)
+    :param timeout: Connect/read timeout in seconds
+    :return: Iterator over the bytes of the response body
+    """
+    session = session or get_session('web')
+    with session.get(url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size):
+            if chunk:
+                yield chunk
+
+def download_ranges(
+    url: str,
+    path: str,
+    size: int,
+    segments: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    session: Optional[requests.Session] = None,
+    timeout: float = 60,
+) -> str:
+    """
+    Download a resource with parallel HTTP range requests into a file.
+
+    Each range is written at its offset in a preallocated file as it arrives.
+
+    :param url: URL of the resource
+    :param path: Destination file
+    :param size: Size of the resource in bytes
+    :param segments: Number of ranges fetched in parallel
+    :param chunk_size: Size of the chunks read from each connection
+    :param session: Session to use (default: the shared 'web' session)
+    :param timeout: Connect/read timeout in seconds
+    :return: The destination path
+    """
+    session = session or get_session('web')
+    with open(path, 'wb') as f:
+        f.truncate(size)
+
+    def fetch(byte_range: Tuple[int, int]):
+        first, last = byte_range
+        headers = {'Range': f'bytes={first}-{last}'}
+        with session.get(url, headers=headers, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise RuntimeError(f"Server ignored the range request for {url}")
+            with open(path, 'r+b') as f:
+                f.seek(first)
+                for chunk in response.iter_content(chunk_size):
+                    f.write(chunk)
+
+    ranges = split_ranges(size, segments)
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        list(executor.map(fetch, ranges))
+    return path
+
+def download_and_decode(
+    url: str,
+    sample_rate: int = 16000,
+    segments: int = 1,
+    min_parallel_size: int = DEFAULT_MIN_PARALLEL_SIZE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    timeout: float = 60,
+) -> bytes:
+    """
+    Download media from a web URL and decode it to mono WAV.
+
+    Sequential downloads are piped into ffmpeg as they arrive, so decoding overlaps
+    with the transfer. A copy is kept on disk: containers that can't be decoded from a
+    pipe (e.g. MP4 files with the index at the end) are decoded from the file once the
+    download is complete. Parallel range downloads are decoded when all ranges are in.
+
+    :param url: URL of the media file
+    :param sample_rate: Desired sample rate
+    :param segments: Number of ranges fetched in parallel (1 to disable range requests)
+    :param min_parallel_size: Minimum size in bytes for a parallel download
+    :param chunk_size: Size of the chunks read from the connection
+    :param timeout: Connect/read timeout in seconds
+    :return: WAV audio data as bytes
+    """
+    session = get_session('web')
+    with tempfile.TemporaryDirectory(prefix='hermes-web-') as directory:
+        path = os.path.join(directory, 'media')
+        if segments > 1:
+            size, ranges = probe(url, session, timeout)
+            if ranges and size and size >= min_parallel_size:
+                download_ranges(url, path, size, segments, chunk_size, session, timeout)
+                return decode_to_wav(path, sample_rate)
+
+        completed = []
+
+        def tee() -> Iterator[bytes]:
+            with open(path, 'wb') as f:
+                for chunk in iter_download(url, chunk_size, session, timeout):
+                    f.write(chunk)
+                    yield chunk
+            completed.append(True)
+
+        try:
+            return decode_stream_to_wav(tee(), sample_rate)
+        except RuntimeError:
+            if not completed:
+                raise
+            return decode_to_wav(path, sample_rate)
@@ -0,0 +1,62 @@
+import asyncio
+import threading
+import weakref
+from typing import Dict
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = weakref.WeakKeyDictionary()
+
+def get_session(name: str, pool_size: int = 32) -> requests.Session:
+    """
+    Get the shared, connection-pooled requests session for a service.
+
+    Reusing the session keeps TCP/TLS connections alive between calls instead of
+    paying a new handshake for every request.
+
+    :param name: Name of the service (e.g. "groq")
+    :param pool_size: Maximum number of pooled connections per host
+    :return: requests.Session object
+    """
+    with _sessions_lock:
+        session = _sessions.get(name)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _sessions[name] = session
+        return session
+
+def get_async_client(name: str, max_connections: int = 100) -> httpx.AsyncClient:
+    """
+    Get the shared, connection-pooled async HTTP client for a service.
+
+    Async clients are bound to the event loop they are used on, so one client is kept
+    per service and per running loop.
+
+    :param name: Name of the service (e.g. "groq")
+    :param max_connections: Maximum number of concurrent connections
+    :return: httpx.AsyncClient object
+    """
+    loop = asyncio.get_running_loop()
+    clients = _async_clients.setdefault(loop, {})
+    client = clients.get(name)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(600.0, connect=10.0),
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+        clients[name] = client
+    return client
+
+async def aclose_async_clients():
+    """
+    Close the async HTTP clients bound to the running event loop.
+    """
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
@@ -0,0 +1,259 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional
+from .cache import hash_bytes
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+class InvalidJobError(ValueError):
+    """
+    Raised when a job's options can't be used; retrying the job won't help.
+    """
+
+def job_key(source: str, options: Dict[str, Any]) -> str:
+    """
+    Compute the deduplication key of a job.
+
+    :param source: The source of the audio
+    :param options: The transcription options of the job
+    :return: Hex digest identifying the source and options
+    """
+    return hash_bytes(json.dumps({'source': source, 'options': options}, sort_keys=True, default=str).encode())
+
+class JobQueue:
+    """
+    Durable transcription job queue backed by a SQLite database file.
+
+    Any number of threads and processes may share the file. A job is leased to the
+    worker that claims it for ``lease_seconds``; a worker that dies stops renewing its
+    leases, and its jobs become claimable again once they expire. Failed attempts are
+    retried until the job has been tried ``max_attempts`` times. Enqueueing a job
+    identical to one that is still queued or running returns the existing job.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            key TEXT NOT NULL,
+            source TEXT NOT NULL,
+            options TEXT NOT NULL,
+            status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL,
+            available_at REAL NOT NULL,
+            lease_owner TEXT,
+            lease_expires_at REAL,
+            result TEXT,
+            error TEXT,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE UNIQUE INDEX IF NOT EXISTS jobs_active_key ON jobs (key) WHERE status IN ('queued', 'running');
+        CREATE INDEX IF NOT EXISTS jobs_status_available_at ON jobs (status, available_at);
+    """
+
+    def __init__(self, path: str, max_attempts: int = 3):
+        """
+        :param path: Path to the database file (created if needed)
+        :param max_attempts: Default number of attempts per job
+        """
+        self.path = os.path.expanduser(path)
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection().executescript(self.SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections may not be shared between threads, so keep one per thread
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def _transaction(self, statements) -> Any:
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            result = statements(connection)
+            connection.execute('COMMIT')
+            return result
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def enqueue(self, source: str, options: Optional[Dict[str, Any]] = None, max_attempts: Optional[int] = None) -> int:
+        """
+        Add a transcription job to the queue.
+
+        :param source: The source of the audio (file path, URL, etc.)
+        :param options: Arguments for ``hermes.core.transcribe`` (provider, model, response_format, llm_prompt, ...)
+        :param max_attempts: Number of attempts before the job fails (default: the queue's)
+        :return: The job id, or the id of the identical job already queued or running
+        """
+        options = options or {}
+        key = job_key(source, options)
+        now = time.time()
+
+        def insert(connection):
+            existing = connection.execute(
+                "SELECT id FROM jobs WHERE key = ? AND status IN (?, ?)", (key, QUEUED, RUNNING)
+            ).fetchone()
+            if existing is not None:
+                return existing['id']
+            cursor = connection.execute(
+                'INSERT INTO jobs (key, source, options, status, max_attempts, available_at, created_at, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, source, json.dumps(options), QUEUED, max_attempts or self.max_attempts, now, now, now),
+            )
+            return cursor.lastrowid
+
+        return self._transaction(insert)
+
+    def claim(self, owner: str, lease_seconds: float = 300) -> Optional[Dict[str, Any]]:
+        """
+        Lease the next available job.
+
+        Jobs whose lease expired (their worker crashed or hung) are claimed again, or
+        failed if they have used up their attempts.
+
+        :param owner: Identifier of the claiming worker
+        :param lease_seconds: How long the job is reserved for ``owner`` unless renewed
+        :return: The job, or None if no job is available
+        """
+        now = time.time()
+
+        def take(connection):
+            connection.execute(
+                "UPDATE jobs SET status = ?, error = ?, lease_owner = NULL, lease_expires_at = NULL, updated_at = ? "
+                "WHERE status = ? AND lease_expires_at < ? AND attempts >= max_attempts",
+                (FAILED, 'Lease expired', now, RUNNING, now),
+            )
+            row = connection.execute(
+                "SELECT id FROM jobs WHERE (status = ? AND available_at <= ?) OR (status = ? AND lease_expires_at < ?) "
+                "ORDER BY available_at, id LIMIT 1",
+                (QUEUED, now, RUNNING, now),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                'UPDATE jobs SET status = ?, attempts = attempts + 1, lease_owner = ?, lease_expires_at = ?, updated_at = ? WHERE id = ?',
+                (RUNNING, owner, now + lease_seconds, now, row['id']),
+            )
+            return self._job(connection.execute('SELECT * FROM jobs WHERE id = ?', (row['id'],)).fetchone())
+
+        return self._transaction(take)
+
+    def renew(self, job_id: int, owner: str, lease_seconds: float = 300) -> bool:
+        """
+        Extend the lease of a running job.
+
+        :param job_id: The job id
+        :param owner: The worker holding the lease
+        :param lease_seconds: New lease duration, from now
+        :return: False if the job is no longer leased to ``owner``
+        """
+        now = time.time()
+        cursor = self._connection().execute(
+            'UPDATE jobs SET lease_expires_at = ?, updated_at = ? WHERE id = ? AND status = ? AND lease_owner = ?',
+            (now + lease_seconds, now, job_id, RUNNING, owner),
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: int, owner: str, result: Dict[str, Any]) -> bool:
+        """
+        Mark a job as done.
+
+        :param job_id: The job id
+        :param owner: The worker holding the lease
+        :param result: The transcription result
+        :return: False if the job was no longer leased to ``owner`` (the result is dropped)
+        """
+        now = time.time()
+        cursor = self._connection().execute(
+            'UPDATE jobs SET status = ?, result = ?, error = NULL, lease_owner = NULL, lease_expires_at = NULL, updated_at = ? '
+            'WHERE id = ? AND status = ? AND lease_owner = ?',
+            (DONE, json.dumps(result, default=str), now, job_id, RUNNING, owner),
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, job_id: int, owner: str, error: str, retry_delay: float = 0.0, retry: bool = True) -> bool:
+        """
+        Record a failed attempt, requeueing the job if it has attempts left.
+
+        :param job_id: The job id
+        :param owner: The worker holding the lease
+        :param error: Description of the failure
+        :param retry_delay: Seconds before the job may be claimed again
+        :param retry: If False, fail the job even if it has attempts left
+        :return: False if the job was no longer leased to ``owner``
+        """
+        now = time.time()
+        cursor = self._connection().execute(
+            'UPDATE jobs SET status = CASE WHEN ? AND attempts < max_attempts THEN ? ELSE ? END, '
+            'available_at = ?, error = ?, lease_owner = NULL, lease_expires_at = NULL, updated_at = ? '
+            'WHERE id = ? AND status = ? AND lease_owner = ?',
+            (retry, QUEUED, FAILED, now + retry_delay, error, now, job_id, RUNNING, owner),
+        )
+        return cursor.rowcount == 1
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Look up a job.
+
+        :param job_id: The job id
+        :return: The job, or None if there is no such job
+        """
+        return self._job(self._connection().execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone())
+
+    def list(self, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        List jobs, most recent first.
+
+        :param status: Only list jobs with this status
+        :param limit: Maximum number of jobs
+        :return: List of jobs
+        """
+        if status:
+            rows = self._connection().execute('SELECT * FROM jobs WHERE status = ? ORDER BY id DESC LIMIT ?', (status, limit))
+        else:
+            rows = self._connection().execute('SELECT * FROM jobs ORDER BY id DESC LIMIT ?', (limit,))
+        return [self._job(row) for row in rows]
+
+    def pending(self) -> int:
+        """
+        Count the jobs that are not finished yet, including those waiting for a retry.
+
+        :return: Number of queued and running jobs
+        """
+        return self._connection().execute('SELECT COUNT(*) FROM jobs WHERE status IN (?, ?)', (QUEUED, RUNNING)).fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Count jobs by status.
+
+        :return: Dictionary mapping each status to its number of jobs
+        """
+        counts = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        for status, count in self._connection().execute('SELECT status, COUNT(*) FROM jobs GROUP BY status'):
+            counts[status] = count
+        return counts
+
+    def _job(self, row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        job = dict(row)
+        job['options'] = json.loads(job['options'])
+        job['result'] = json.loads(job['result']) if job['result'] is not None else None
+        return job
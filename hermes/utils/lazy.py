@@ -0,0 +1,29 @@
+import importlib
+from types import ModuleType
+from typing import Optional
+
+class LazyModule:
+    """
+    Stand-in for a module that is only imported when one of its attributes is used.
+
+    Lets heavy optional dependencies be referenced at module level (and patched in
+    tests) without paying their import cost until the code path that needs them runs.
+    Only public attributes are forwarded to the module.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[ModuleType] = None
+
+    def __getattr__(self, attr: str):
+        # Introspection (mock.patch, copy, pickle, inspect) probes dunders and private
+        # markers such as asyncio's _is_coroutine; don't import the module for those
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
@@ -1,22 +1,418 @@
-from typing import Dict, Any
-from litellm import completion
-from hermes.config import CONFIG
+import re
+import json
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, Iterable, List, Optional
+from hermes.config import CONFIG, require_api_key
+from .ratelimit import RETRYABLE_STATUS_CODES, backoff_delay, get_rate_limiter, retry_after_seconds
+
+# Rough size of a token in characters for English text; chunks are sized with this
+# estimate so splitting does not need the model's tokenizer
+CHARS_PER_TOKEN = 4
+
+MAP_INSTRUCTIONS = (
+    "The text below is one part of a longer transcript. Apply the instructions to this part only; "
+    "the results for all parts will be combined afterwards."
+)
+# Providers whose chat API accepts response_format={"type": "json_object"}
+JSON_MODE_PROVIDERS = {'groq', 'openai'}
+BATCH_INSTRUCTIONS = (
+    "Apply the instructions separately to each of the numbered texts below. Answer with a JSON object "
+    "that maps the number of each text (as a string) to its result, and nothing else."
+)
+REDUCE_INSTRUCTIONS = (
+    "The transcript was too long to process at once, so it was split into parts and the instructions "
+    "were applied to each part. Combine the partial results below into a single final result."
+)
+
+def completion(*args, **kwargs):
+    """
+    Call ``litellm.completion``, importing litellm (which takes seconds) on first use.
+    """
+    from litellm import completion as litellm_completion
+    return litellm_completion(*args, **kwargs)
+
+async def acompletion(*args, **kwargs):
+    """
+    Call ``litellm.acompletion``, importing litellm on first use.
+
+    litellm keeps its HTTP clients cached per process, so concurrent calls share pooled connections.
+    """
+    from litellm import acompletion as litellm_acompletion
+    return await litellm_acompletion(*args, **kwargs)
+
+def retry_delay(error: Exception, attempt: int, retry: Dict[str, Any]) -> Optional[float]:
+    """
+    Decide whether a failed LLM call should be retried.
+
+    :param error: The exception raised by the call
+    :param attempt: Number of the failed attempt, starting at 0
+    :param retry: Retry settings (max_retries, base_delay, max_delay)
+    :return: Seconds to wait before retrying, or None if the error is final
+    """
+    if getattr(error, 'status_code', None) not in RETRYABLE_STATUS_CODES or attempt >= retry.get('max_retries', 5):
+        return None
+    response = getattr(error, 'response', None)
+    retry_after = retry_after_seconds(response) if getattr(response, 'headers', None) is not None else None
+    delay = backoff_delay(attempt, retry.get('base_delay', 1.0), retry.get('max_delay', 60.0), retry_after)
+    # Don't block for longer than max_delay; retrying earlier than asked would fail again
+    return delay if delay <= retry.get('max_delay', 60.0) else None
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a text.
+
+    :param text: The text
+    :return: Approximate token count
+    """
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+def split_text(text: str, max_tokens: int) -> List[str]:
+    """
+    Split a text into pieces of at most ``max_tokens`` (estimated), preferring sentence ends and then spaces.
+
+    :param text: The text to split
+    :param max_tokens: Maximum size of a piece in tokens
+    :return: List of pieces
+    """
+    max_chars = max(1, max_tokens * CHARS_PER_TOKEN)
+    pieces = []
+    text = text.strip()
+    while len(text) > max_chars:
+        window = text[:max_chars + 1]
+        sentence_ends = [match.end() for match in re.finditer(r'[.!?]\s', window)]
+        cut = sentence_ends[-1] if sentence_ends and sentence_ends[-1] > max_chars // 2 else window.rfind(' ')
+        if cut <= 0:
+            cut = max_chars
+        pieces.append(text[:cut].strip())
+        text = text[cut:].strip()
+    if text:
+        pieces.append(text)
+    return pieces
+
+def chunk_text(text: str, chunk_tokens: int) -> List[str]:
+    """
+    Split a text into chunks of at most ``chunk_tokens`` (estimated), made of whole sentences where possible.
+
+    :param text: The text to split
+    :param chunk_tokens: Maximum size of a chunk in tokens
+    :return: List of chunks
+    """
+    max_chars = chunk_tokens * CHARS_PER_TOKEN
+    chunks = []
+    for piece in split_text(text, chunk_tokens):
+        if chunks and len(chunks[-1]) + len(piece) + 1 <= max_chars:
+            chunks[-1] = f"{chunks[-1]} {piece}"
+        else:
+            chunks.append(piece)
+    return chunks
+
+def group_partials(partials: List[str], chunk_tokens: int) -> List[List[str]]:
+    """
+    Group partial map-reduce results for the next round of reduction.
+
+    :param partials: Partial results, in order
+    :param chunk_tokens: Maximum size of a group in tokens (estimated)
+    :return: Consecutive groups; a single group means the next reduction is the last.
+        Every round merges at least two partials, so reduction always terminates.
+    """
+    max_chars = chunk_tokens * CHARS_PER_TOKEN
+    groups = [[]]
+    for partial in partials:
+        if groups[-1] and sum(len(p) for p in groups[-1]) + len(partial) > max_chars:
+            groups.append([])
+        groups[-1].append(partial)
+    if len(groups) > 1 and all(len(group) == 1 for group in groups):
+        groups = [partials[index:index + 2] for index in range(0, len(partials), 2)]
+    return groups
+
+def reduce_text(partials: List[str]) -> str:
+    return "\n\n".join(f"Part {index}:\n{partial}" for index, partial in enumerate(partials, start=1))
+
+class MapReduce:
+    """
+    Apply a prompt to a text that may be longer than the model's context, as it arrives.
+
+    Text is fed in pieces (e.g. transcript segments) and grouped into chunks of at most
+    ``chunk_tokens``. Each chunk is sent to the LLM as soon as it is complete, concurrently
+    with the rest of the feed, and ``result`` combines the partial results with further
+    calls. A text that fits in a single chunk is processed with one ordinary call.
+    """
+
+    def __init__(self, processor: 'LLMProcessor', prompt: str, chunk_tokens: int = 6000, max_workers: int = 4, **kwargs):
+        """
+        :param processor: The LLMProcessor making the calls
+        :param prompt: The prompt to apply
+        :param chunk_tokens: Maximum size of a chunk in tokens (estimated)
+        :param max_workers: Maximum number of concurrent LLM calls
+        :param kwargs: Additional arguments for the LLM API calls
+        """
+        self.processor = processor
+        self.prompt = prompt
+        self.chunk_tokens = chunk_tokens
+        self.kwargs = kwargs
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.pieces: List[str] = []
+        self.size = 0
+        self.first_chunk: Optional[str] = None
+        self.futures: List[Future] = []
+
+    def feed(self, text: str):
+        """
+        Add text, starting LLM calls on the chunks it completes.
+
+        :param text: The next piece of text
+        """
+        for piece in split_text(text, self.chunk_tokens):
+            if self.pieces and self.size + len(piece) + 1 > self.chunk_tokens * CHARS_PER_TOKEN:
+                self._chunk_done()
+            self.pieces.append(piece)
+            self.size += len(piece) + 1
+
+    def _chunk_done(self):
+        chunk = ' '.join(self.pieces)
+        self.pieces = []
+        self.size = 0
+        if self.first_chunk is None and not self.futures:
+            # Hold the first chunk: if it turns out to be the only one, it gets an ordinary call
+            self.first_chunk = chunk
+            return
+        if self.first_chunk is not None:
+            self.futures.append(self.executor.submit(self._map, self.first_chunk))
+            self.first_chunk = None
+        self.futures.append(self.executor.submit(self._map, chunk))
+
+    def _map(self, chunk: str) -> str:
+        return self.processor.complete(f"{self.prompt}\n\n{MAP_INSTRUCTIONS}", chunk, **self.kwargs)
+
+    def _reduce(self, partials: List[str]) -> str:
+        return self.processor.complete(f"{self.prompt}\n\n{REDUCE_INSTRUCTIONS}", reduce_text(partials), **self.kwargs)
+
+    def result(self) -> str:
+        """
+        Finish the feed and combine the partial results.
+
+        :return: The processed result from the language model
+        """
+        try:
+            if self.pieces:
+                self._chunk_done()
+            if not self.futures:
+                return self.processor.complete(self.prompt, self.first_chunk or '', **self.kwargs)
+            partials = [future.result() for future in self.futures]
+            # Combine in rounds until the partial results fit in a single call
+            while True:
+                groups = group_partials(partials, self.chunk_tokens)
+                if len(groups) == 1:
+                    return self._reduce(groups[0])
+                partials = list(self.executor.map(
+                    lambda group: self._reduce(group) if len(group) > 1 else group[0], groups
+                ))
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Stop the LLM calls that haven't started yet.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
 
 class LLMProcessor:
-    def __init__(self):
-        self.config = CONFIG['llm']
-        if not self.config['api_key']:
-            raise ValueError(f"API key for {self.config['provider']} is required. Set it in config.yml or as an environment variable.")
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        config = config if config is not None else CONFIG
+        self.config = config['llm']
+        self.retry = config.get('retry') or {}
+        self.rate_limits = config.get('rate_limits') or {}
+        require_api_key(config, 'llm')
 
     def process(self, text: str, prompt: str, **kwargs) -> str:
         """
         Process the given text with a language model using the provided prompt.
 
+        Texts longer than ``llm.chunk_tokens`` are processed with map-reduce (see
+        ``process_stream``) instead of overflowing the model's context.
+
+        :param text: The text to process (e.g., transcription)
+        :param prompt: The prompt to send to the language model
+        :param kwargs: Additional arguments for the LLM API call
+        :return: The processed result from the language model
+        """
+        if estimate_tokens(text) > self.config.get('chunk_tokens', 6000):
+            return self.process_stream([text], prompt, **kwargs)
+        return self.complete(prompt, text, **kwargs)
+
+    def process_stream(self, texts: Iterable[str], prompt: str, **kwargs) -> str:
+        """
+        Process text that arrives in pieces, e.g. segments of a transcription in progress.
+
+        Token-bounded chunks are sent to the LLM concurrently as soon as they are
+        complete, while the iterable is still being consumed, and the partial results
+        are combined at the end.
+
+        :param texts: Iterable of pieces of text
+        :param prompt: The prompt to send to the language model
+        :param kwargs: Additional arguments for the LLM API calls
+        :return: The processed result from the language model
+        """
+        job = self.map_reduce(prompt, **kwargs)
+        try:
+            for text in texts:
+                job.feed(text)
+        except BaseException:
+            job.close()
+            raise
+        return job.result()
+
+    def map_reduce(self, prompt: str, **kwargs) -> MapReduce:
+        """
+        Start a map-reduce job to feed text into incrementally.
+
+        :param prompt: The prompt to send to the language model
+        :param kwargs: Additional arguments for the LLM API calls
+        :return: A MapReduce job configured from the llm section of the configuration
+        """
+        return MapReduce(
+            self,
+            prompt,
+            chunk_tokens=self.config.get('chunk_tokens', 6000),
+            max_workers=self.config.get('max_workers', 4),
+            **kwargs
+        )
+
+    async def aprocess(self, text: str, prompt: str, **kwargs) -> str:
+        """
+        Async counterpart of ``process``; the chunks of a long text are processed concurrently.
+
         :param text: The text to process (e.g., transcription)
         :param prompt: The prompt to send to the language model
         :param kwargs: Additional arguments for the LLM API call
         :return: The processed result from the language model
         """
+        chunk_tokens = self.config.get('chunk_tokens', 6000)
+        if estimate_tokens(text) <= chunk_tokens:
+            return await self.acomplete(prompt, text, **kwargs)
+
+        semaphore = asyncio.Semaphore(self.config.get('max_workers', 4))
+
+        async def call(call_prompt, call_text):
+            async with semaphore:
+                return await self.acomplete(call_prompt, call_text, **kwargs)
+
+        partials = await asyncio.gather(*(call(f"{prompt}\n\n{MAP_INSTRUCTIONS}", chunk) for chunk in chunk_text(text, chunk_tokens)))
+        reduce_prompt = f"{prompt}\n\n{REDUCE_INSTRUCTIONS}"
+        while True:
+            groups = group_partials(list(partials), chunk_tokens)
+            if len(groups) == 1:
+                return await call(reduce_prompt, reduce_text(groups[0]))
+
+            async def reduce_group(group):
+                return await call(reduce_prompt, reduce_text(group)) if len(group) > 1 else group[0]
+
+            partials = await asyncio.gather(*(reduce_group(group) for group in groups))
+
+    def process_many(self, texts: Iterable[str], prompt: str, max_concurrency: Optional[int] = None, **kwargs) -> List[str]:
+        """
+        Process many texts with the same prompt concurrently, one call (or map-reduce) per text.
+
+        :param texts: The texts to process
+        :param prompt: The prompt to send to the language model
+        :param max_concurrency: Maximum number of texts in flight at once (default: llm.max_workers)
+        :param kwargs: Additional arguments for the LLM API calls
+        :return: The results, in the same order as the texts
+        """
+        with ThreadPoolExecutor(max_workers=max_concurrency or self.config.get('max_workers', 4)) as executor:
+            return list(executor.map(lambda text: self.process(text, prompt, **kwargs), texts))
+
+    async def aprocess_many(self, texts: Iterable[str], prompt: str, max_concurrency: Optional[int] = None, **kwargs) -> List[str]:
+        """
+        Async counterpart of ``process_many``.
+
+        :param texts: The texts to process
+        :param prompt: The prompt to send to the language model
+        :param max_concurrency: Maximum number of texts in flight at once (default: llm.max_workers)
+        :param kwargs: Additional arguments for the LLM API calls
+        :return: The results, in the same order as the texts
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.config.get('max_workers', 4))
+
+        async def run(text):
+            async with semaphore:
+                return await self.aprocess(text, prompt, **kwargs)
+
+        return list(await asyncio.gather(*(run(text) for text in texts)))
+
+    def process_batch(self, texts: Iterable[str], prompt: str, batch_size: Optional[int] = None, **kwargs) -> List[str]:
+        """
+        Process many short texts with the same prompt, several texts per LLM call.
+
+        Texts are packed into requests of up to ``batch_size`` texts and ``llm.chunk_tokens``
+        tokens, and the model is asked for a JSON object with one result per text (in
+        JSON mode, for the providers that support it). Texts too long to share a request,
+        and batches whose answer can't be parsed, are processed one by one instead.
+
+        :param texts: The texts to process
+        :param prompt: The prompt to send to the language model
+        :param batch_size: Maximum number of texts per call (default: llm.batch_size)
+        :param kwargs: Additional arguments for the LLM API calls
+        :return: The results, in the same order as the texts
+        """
+        texts = list(texts)
+        batch_size = batch_size or self.config.get('batch_size', 16)
+        max_chars = self.config.get('chunk_tokens', 6000) * CHARS_PER_TOKEN
+        batches = []
+        for index, text in enumerate(texts):
+            batch = batches[-1] if batches else None
+            if batch and len(batch) < batch_size and sum(len(texts[i]) for i in batch) + len(text) <= max_chars:
+                batch.append(index)
+            else:
+                batches.append([index])
+
+        results: List[Optional[str]] = [None] * len(texts)
+
+        def run(batch):
+            if len(batch) > 1:
+                answers = self._complete_batch([texts[i] for i in batch], prompt, **kwargs)
+                if answers is not None:
+                    for i, answer in zip(batch, answers):
+                        results[i] = answer
+                    return
+            for i in batch:
+                results[i] = self.process(texts[i], prompt, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=self.config.get('max_workers', 4)) as executor:
+            list(executor.map(run, batches))
+        return results
+
+    def _complete_batch(self, texts: List[str], prompt: str, **kwargs) -> Optional[List[str]]:
+        """
+        Process several texts in one call.
+
+        :param texts: The texts to process
+        :param prompt: The prompt to send to the language model
+        :param kwargs: Additional arguments for the LLM API call
+        :return: One result per text, or None if the answer doesn't have one result for each text
+        """
+        body = "\n\n".join(f"### Text {index}\n{text}" for index, text in enumerate(texts, start=1))
+        if self.config['provider'] in JSON_MODE_PROVIDERS:
+            kwargs = {'response_format': {'type': 'json_object'}, **kwargs}
+        answer = self.complete(f"{prompt}\n\n{BATCH_INSTRUCTIONS}", body, **kwargs)
+        answer = re.sub(r'^```(?:json)?\s*|\s*```$', '', answer.strip())
+        try:
+            parsed = json.loads(answer)
+        except ValueError:
+            return None
+        if not isinstance(parsed, dict):
+            return None
+        results = []
+        for index in range(1, len(texts) + 1):
+            value = parsed.get(str(index))
+            if value is None:
+                return None
+            results.append(value.strip() if isinstance(value, str) else json.dumps(value))
+        return results
+
+    def _request(self, prompt: str, text: str, **kwargs) -> Dict[str, Any]:
         full_prompt = f"{prompt}\n\nText: {text}"
         
         messages = [
@@ -27,11 +423,64 @@ class LLMProcessor:
         # Use a valid model string format
         model = f"{self.config['provider']}/{self.config['model']}"
 
-        response = completion(
+        return dict(
             model=model,
             messages=messages,
             api_key=self.config['api_key'],
             **kwargs
         )
 
-        return response.choices[0].message.content.strip()
\ No newline at end of file
+    def complete(self, prompt: str, text: str, **kwargs) -> str:
+        """
+        Send a single prompt and text to the language model.
+
+        Calls go through the shared rate limiter of the LLM provider (``rate_limits.<provider>_llm``)
+        and are retried with backoff on throttling and server errors.
+
+        :param prompt: The prompt to send to the language model
+        :param text: The text the prompt applies to
+        :param kwargs: Additional arguments for the LLM API call
+        :return: The response of the language model
+        """
+        request = self._request(prompt, text, **kwargs)
+        limiter = get_rate_limiter(f"{self.config['provider']}_llm", self.rate_limits)
+        retry = self.retry
+        attempt = 0
+        while True:
+            limiter.acquire()
+            try:
+                response = completion(**request)
+            except Exception as e:
+                delay = retry_delay(e, attempt, retry)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+            return response.choices[0].message.content.strip()
+
+    async def acomplete(self, prompt: str, text: str, **kwargs) -> str:
+        """
+        Async counterpart of ``complete``.
+
+        :param prompt: The prompt to send to the language model
+        :param text: The text the prompt applies to
+        :param kwargs: Additional arguments for the LLM API call
+        :return: The response of the language model
+        """
+        request = self._request(prompt, text, **kwargs)
+        limiter = get_rate_limiter(f"{self.config['provider']}_llm", self.rate_limits)
+        retry = self.retry
+        attempt = 0
+        while True:
+            await limiter.aacquire()
+            try:
+                response = await acompletion(**request)
+            except Exception as e:
+                delay = retry_delay(e, attempt, retry)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            return response.choices[0].message.content.strip()
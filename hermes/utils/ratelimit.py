@@ -0,0 +1,222 @@
+import time
+import random
+import asyncio
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+
+RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``. Reservations
+    are debited immediately, even past zero, and the caller is told how long to wait
+    before the debt is paid off; this keeps concurrent callers in FIFO order.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """
+        Take ``amount`` tokens from the bucket.
+
+        :param amount: Number of tokens to take
+        :return: Seconds to wait before the reserved tokens are actually available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= amount
+            return max(0.0, -self.tokens / self.rate)
+
+class RateLimiter:
+    """
+    Client-side quota for one provider: requests per minute and audio seconds per hour.
+    """
+
+    def __init__(self, requests_per_minute: Optional[float] = None, audio_seconds_per_hour: Optional[float] = None):
+        self.requests = TokenBucket(requests_per_minute / 60.0, requests_per_minute) if requests_per_minute else None
+        self.audio = TokenBucket(audio_seconds_per_hour / 3600.0, audio_seconds_per_hour) if audio_seconds_per_hour else None
+
+    def reserve(self, audio_seconds: float = 0.0) -> float:
+        """
+        Reserve quota for one request.
+
+        :param audio_seconds: Duration of the audio sent with the request
+        :return: Seconds to wait before sending the request
+        """
+        wait = 0.0
+        if self.requests:
+            wait = max(wait, self.requests.reserve(1))
+        if self.audio and audio_seconds:
+            wait = max(wait, self.audio.reserve(audio_seconds))
+        return wait
+
+    def acquire(self, audio_seconds: float = 0.0):
+        wait = self.reserve(audio_seconds)
+        if wait:
+            time.sleep(wait)
+
+    async def aacquire(self, audio_seconds: float = 0.0):
+        wait = self.reserve(audio_seconds)
+        if wait:
+            await asyncio.sleep(wait)
+
+_limiters: Dict[Any, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+def get_rate_limiter(provider: str, rate_limits: Optional[Dict[str, Any]] = None) -> RateLimiter:
+    """
+    Get the process-wide rate limiter for a provider, configured from ``rate_limits``.
+
+    Limiters are shared by every strategy instance of a provider configured with the
+    same limits; a limiter set with ``configure_rate_limiter`` takes precedence.
+
+    :param provider: The name of the provider (e.g. "groq")
+    :param rate_limits: The rate_limits section of the configuration (default: the process-wide configuration's)
+    :return: RateLimiter object
+    """
+    if rate_limits is None:
+        from hermes.config import CONFIG
+        rate_limits = CONFIG.get('rate_limits')
+    limits = (rate_limits or {}).get(provider) or {}
+    key = (provider, limits.get('requests_per_minute'), limits.get('audio_seconds_per_hour'))
+    with _limiters_lock:
+        limiter = _limiters.get(provider) or _limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(limits.get('requests_per_minute'), limits.get('audio_seconds_per_hour'))
+            _limiters[key] = limiter
+        return limiter
+
+def configure_rate_limiter(provider: str, requests_per_minute: Optional[float] = None, audio_seconds_per_hour: Optional[float] = None) -> RateLimiter:
+    """
+    Replace the rate limiter of a provider.
+
+    :param provider: The name of the provider (e.g. "groq")
+    :param requests_per_minute: Maximum requests per minute, or None for no limit
+    :param audio_seconds_per_hour: Maximum seconds of audio per hour, or None for no limit
+    :return: The new RateLimiter object
+    """
+    with _limiters_lock:
+        limiter = RateLimiter(requests_per_minute, audio_seconds_per_hour)
+        _limiters[provider] = limiter
+        return limiter
+
+def retry_after_seconds(response: Any) -> Optional[float]:
+    """
+    Read the Retry-After header of a response, in seconds or as an HTTP date.
+
+    :param response: A requests or httpx response
+    :return: Seconds to wait, or None if the header is absent or invalid
+    """
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def backoff_delay(attempt: int, base_delay: float = 1.0, max_delay: float = 60.0, retry_after: Optional[float] = None) -> float:
+    """
+    Compute the delay before a retry: full-jitter exponential backoff, or Retry-After if given.
+
+    A Retry-After longer than ``max_delay`` is returned as is: retrying earlier would
+    only be rejected again, so callers that won't wait that long should give up.
+
+    :param attempt: Number of the failed attempt, starting at 0
+    :param base_delay: Delay scale in seconds
+    :param max_delay: Upper bound for the backoff delay in seconds
+    :param retry_after: Delay requested by the server, if any
+    :return: Seconds to wait
+    """
+    if retry_after is not None:
+        return retry_after
+    return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+def send_with_retries(
+    send: Callable[[], Any],
+    limiter: RateLimiter,
+    audio_seconds: float = 0.0,
+    retry: Optional[Dict[str, Any]] = None,
+    retry_exceptions: Tuple[Type[BaseException], ...] = (),
+) -> Any:
+    """
+    Send a request through a rate limiter, retrying on throttling, server errors and transport errors.
+
+    :param send: Function performing the request and returning the response
+    :param limiter: The provider's rate limiter
+    :param audio_seconds: Duration of the audio sent with the request
+    :param retry: Retry settings (max_retries, base_delay, max_delay); a Retry-After
+        longer than max_delay ends the retries
+    :param retry_exceptions: Transport exceptions that should be retried
+    :return: The last response; the caller still has to check its status
+    """
+    retry = retry or {}
+    max_retries = retry.get('max_retries', 5)
+    for attempt in range(max_retries + 1):
+        # The audio is charged once; a retry only counts as another request
+        limiter.acquire(audio_seconds if attempt == 0 else 0.0)
+        try:
+            response = send()
+        except retry_exceptions:
+            if attempt == max_retries:
+                raise
+            delay = backoff_delay(attempt, retry.get('base_delay', 1.0), retry.get('max_delay', 60.0))
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt == max_retries:
+                return response
+            delay = backoff_delay(attempt, retry.get('base_delay', 1.0), retry.get('max_delay', 60.0), retry_after_seconds(response))
+            if delay > retry.get('max_delay', 60.0):
+                # The server asks for a longer wait than we are willing to block for
+                return response
+        time.sleep(delay)
+
+async def asend_with_retries(
+    send: Callable[[], Awaitable[Any]],
+    limiter: RateLimiter,
+    audio_seconds: float = 0.0,
+    retry: Optional[Dict[str, Any]] = None,
+    retry_exceptions: Tuple[Type[BaseException], ...] = (),
+) -> Any:
+    """
+    Async counterpart of ``send_with_retries``.
+
+    :param send: Coroutine function performing the request and returning the response
+    :param limiter: The provider's rate limiter
+    :param audio_seconds: Duration of the audio sent with the request
+    :param retry: Retry settings (max_retries, base_delay, max_delay)
+    :param retry_exceptions: Transport exceptions that should be retried
+    :return: The last response; the caller still has to check its status
+    """
+    retry = retry or {}
+    max_retries = retry.get('max_retries', 5)
+    for attempt in range(max_retries + 1):
+        # The audio is charged once; a retry only counts as another request
+        await limiter.aacquire(audio_seconds if attempt == 0 else 0.0)
+        try:
+            response = await send()
+        except retry_exceptions:
+            if attempt == max_retries:
+                raise
+            delay = backoff_delay(attempt, retry.get('base_delay', 1.0), retry.get('max_delay', 60.0))
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt == max_retries:
+                return response
+            delay = backoff_delay(attempt, retry.get('base_delay', 1.0), retry.get('max_delay', 60.0), retry_after_seconds(response))
+            if delay > retry.get('max_delay', 60.0):
+                # The server asks for a longer wait than we are willing to block for
+                return response
+        await asyncio.sleep(delay)
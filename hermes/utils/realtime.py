@@ -0,0 +1,339 @@
+import io
+import time
+import wave
+import threading
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+from .lazy import LazyModule
+
+if TYPE_CHECKING:
+    import numpy
+
+np = LazyModule('numpy')
+sd = LazyModule('sounddevice')
+
+class RingBuffer:
+    """
+    Fixed-capacity FIFO of 16-bit samples shared between a capture thread and a reader.
+
+    When the reader falls behind and the buffer is full, the oldest samples are
+    overwritten (and counted in ``dropped``) so that memory use stays bounded and
+    capture never blocks.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        :param capacity: Maximum number of samples held
+        """
+        self.capacity = capacity
+        self.data = np.zeros(capacity, dtype=np.int16)
+        self.start = 0
+        self.size = 0
+        self.dropped = 0
+        self.closed = False
+        self._condition = threading.Condition()
+
+    def write(self, samples: 'numpy.ndarray'):
+        """
+        Append samples, overwriting the oldest ones if the buffer is full.
+
+        :param samples: 1-D array of 16-bit samples
+        """
+        samples = np.asarray(samples, dtype=np.int16).ravel()
+        with self._condition:
+            if len(samples) > self.capacity:
+                self.dropped += len(samples) - self.capacity
+                samples = samples[-self.capacity:]
+            overflow = self.size + len(samples) - self.capacity
+            if overflow > 0:
+                self.dropped += overflow
+                self.start = (self.start + overflow) % self.capacity
+                self.size -= overflow
+            end = (self.start + self.size) % self.capacity
+            first = min(len(samples), self.capacity - end)
+            self.data[end:end + first] = samples[:first]
+            self.data[:len(samples) - first] = samples[first:]
+            self.size += len(samples)
+            self._condition.notify_all()
+
+    def read(self, max_samples: Optional[int] = None, timeout: Optional[float] = None) -> Optional['numpy.ndarray']:
+        """
+        Remove and return the oldest samples, waiting until some are available.
+
+        :param max_samples: Maximum number of samples to return (default: everything buffered)
+        :param timeout: Maximum time to wait in seconds (default: wait until data arrives or the buffer is closed)
+        :return: Array of samples (empty on timeout), or None once the buffer is closed and drained
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self.size or self.closed, timeout)
+            if not self.size:
+                return None if self.closed else np.zeros(0, dtype=np.int16)
+            count = self.size if max_samples is None else min(self.size, max_samples)
+            indices = (self.start + np.arange(count)) % self.capacity
+            samples = self.data[indices]
+            self.start = (self.start + count) % self.capacity
+            self.size -= count
+            return samples
+
+    def close(self):
+        """
+        Mark the end of the stream; readers get the remaining samples, then None.
+        """
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+class AudioCapture(ABC):
+    """
+    A live source of 16-bit mono samples, read through a ring buffer.
+
+    Subclasses start a producer that calls ``self.buffer.write`` and stop it again;
+    iterating over the capture yields blocks of samples until ``stop`` is called or
+    the producer ends.
+    """
+
+    def __init__(self, sample_rate: int = 16000, block_ms: int = 100, buffer_seconds: float = 60.0):
+        """
+        :param sample_rate: Sample rate of the captured audio
+        :param block_ms: Size of the blocks produced, in milliseconds
+        :param buffer_seconds: Capacity of the ring buffer, in seconds
+        """
+        self.sample_rate = sample_rate
+        self.block_size = max(1, int(sample_rate * block_ms / 1000))
+        self.buffer = RingBuffer(int(sample_rate * buffer_seconds))
+
+    @abstractmethod
+    def _start(self):
+        """
+        Start the producer feeding ``self.buffer``.
+        """
+        pass
+
+    @abstractmethod
+    def _stop(self):
+        """
+        Stop the producer started by ``_start``.
+        """
+        pass
+
+    def stop(self):
+        """
+        Stop capturing; blocks already buffered are still yielded.
+        """
+        self.buffer.close()
+
+    def __iter__(self) -> Iterator['numpy.ndarray']:
+        self._start()
+        try:
+            while True:
+                samples = self.buffer.read(timeout=1.0)
+                if samples is None:
+                    return
+                if len(samples):
+                    yield samples
+        finally:
+            self._stop()
+            self.buffer.close()
+
+class MicrophoneCapture(AudioCapture):
+    """
+    Capture from an input device with a sounddevice input stream (16 kHz mono by default).
+    """
+
+    def __init__(self, device: Optional[int] = None, **options):
+        """
+        :param device: Input device index or name (default: the system default input)
+        :param options: Options for ``AudioCapture``
+        """
+        super().__init__(**options)
+        self.device = device
+        self.stream = None
+
+    def _callback(self, indata, frames, time_info, status):
+        # Runs on the audio thread: copy and hand over, nothing else
+        self.buffer.write(indata[:, 0].copy())
+
+    def _start(self):
+        self.stream = sd.InputStream(
+            samplerate=self.sample_rate,
+            channels=1,
+            dtype='int16',
+            blocksize=self.block_size,
+            device=self.device,
+            callback=self._callback,
+        )
+        self.stream.start()
+
+    def _stop(self):
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+
+class SyntheticCapture(AudioCapture):
+    """
+    Replay prerecorded samples as if they came from a device, for tests and demos.
+    """
+
+    def __init__(self, samples: 'numpy.ndarray', realtime: bool = False, **options):
+        """
+        :param samples: 1-D array of 16-bit samples to replay
+        :param realtime: If True, produce blocks at the pace of the audio instead of as fast as possible
+        :param options: Options for ``AudioCapture``
+        """
+        super().__init__(**options)
+        self.samples = np.asarray(samples, dtype=np.int16)
+        self.realtime = realtime
+        self.thread = None
+
+    @classmethod
+    def from_wav(cls, audio_data: bytes, **options) -> 'SyntheticCapture':
+        """
+        Replay a 16-bit mono WAV file.
+
+        :param audio_data: WAV audio data
+        :param options: Options for ``SyntheticCapture``
+        :return: A SyntheticCapture at the sample rate of the file
+        """
+        with wave.open(io.BytesIO(audio_data)) as wav_file:
+            sample_rate = wav_file.getframerate()
+            samples = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype='<i2')
+        return cls(samples, sample_rate=sample_rate, **options)
+
+    def _produce(self):
+        start = time.monotonic()
+        for offset in range(0, len(self.samples), self.block_size):
+            if self.buffer.closed:
+                return
+            if self.realtime:
+                time.sleep(max(0.0, start + offset / self.sample_rate - time.monotonic()))
+            block = self.samples[offset:offset + self.block_size]
+            # Don't let a fast producer overwrite audio the reader hasn't seen yet
+            while not self.realtime and self.buffer.size + len(block) > self.buffer.capacity and not self.buffer.closed:
+                time.sleep(0.001)
+            self.buffer.write(block)
+        self.buffer.close()
+
+    def _start(self):
+        self.thread = threading.Thread(target=self._produce, daemon=True)
+        self.thread.start()
+
+    def _stop(self):
+        self.buffer.close()
+        if self.thread is not None:
+            self.thread.join()
+
+class SpeechWindower:
+    """
+    Cut a live stream of samples into windows to transcribe.
+
+    Frames are classified as speech by energy against a threshold that adapts to
+    the noise floor. A window is emitted once it holds at least ``min_window`` seconds
+    and speech is followed by ``min_silence_ms`` of silence, or as soon as it reaches
+    ``max_window`` seconds, which bounds the latency. Windows without speech are
+    dropped, and long silences between windows are not buffered.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_ms: int = 30,
+        energy_threshold: Optional[float] = None,
+        min_silence_ms: int = 500,
+        min_window: float = 2.0,
+        max_window: float = 15.0,
+        padding_ms: int = 200,
+    ):
+        """
+        :param sample_rate: Sample rate of the samples
+        :param frame_ms: Analysis frame length in milliseconds
+        :param energy_threshold: Speech threshold in dBFS (default: adaptive, 10 dB above the noise floor)
+        :param min_silence_ms: Silence after speech that ends a window, in milliseconds
+        :param min_window: Minimum window length in seconds before cutting on silence
+        :param max_window: Maximum window length in seconds
+        :param padding_ms: Silence kept before speech at the start of a window, in milliseconds
+        """
+        self.sample_rate = sample_rate
+        self.frame = max(1, int(sample_rate * frame_ms / 1000))
+        self.energy_threshold = energy_threshold
+        self.min_silence_frames = max(1, int(min_silence_ms / frame_ms))
+        self.min_window = int(min_window * sample_rate)
+        self.max_window = int(max_window * sample_rate)
+        self.padding_frames = int(padding_ms / frame_ms)
+        self.noise_floor = None
+        self.position = 0
+        self._remainder = np.zeros(0, dtype=np.int16)
+        self._reset(0)
+
+    def _reset(self, start: int):
+        self.window_start = start
+        self.frames = []
+        self.has_speech = False
+        self.trailing_silence = 0
+
+    def _is_speech(self, frame: 'numpy.ndarray') -> bool:
+        samples = frame.astype(np.float32) / 32768.0
+        energy = float(20 * np.log10(np.sqrt(np.mean(samples ** 2)) + 1e-10))
+        if self.energy_threshold is not None:
+            return energy > self.energy_threshold
+        if self.noise_floor is None:
+            # Assume a quiet room until proven otherwise, in case the stream starts mid-speech
+            self.noise_floor = min(energy, -60.0)
+        elif energy < self.noise_floor:
+            self.noise_floor = energy
+        else:
+            # Rise slowly so speech doesn't drag the floor up with it
+            self.noise_floor += 0.005 * (energy - self.noise_floor)
+        return energy > max(self.noise_floor + 10, -50)
+
+    def _emit(self) -> Tuple[float, 'numpy.ndarray']:
+        window = (self.window_start / float(self.sample_rate), np.concatenate(self.frames))
+        self._reset(self.position)
+        return window
+
+    def feed(self, samples: 'numpy.ndarray') -> List[Tuple[float, 'numpy.ndarray']]:
+        """
+        Add samples to the stream.
+
+        :param samples: 1-D array of 16-bit samples
+        :return: List of (start time in seconds, samples) windows completed by these samples
+        """
+        samples = np.concatenate((self._remainder, np.asarray(samples, dtype=np.int16)))
+        count = len(samples) // self.frame
+        self._remainder = samples[count * self.frame:]
+
+        windows = []
+        for index in range(count):
+            frame = samples[index * self.frame:(index + 1) * self.frame]
+            speech = self._is_speech(frame)
+            self.frames.append(frame)
+            self.position += len(frame)
+
+            if not self.has_speech:
+                if speech:
+                    self.has_speech = True
+                elif len(self.frames) > self.padding_frames:
+                    # Only keep a little leading silence
+                    self.frames.pop(0)
+                    self.window_start += self.frame
+                continue
+
+            self.trailing_silence = 0 if speech else self.trailing_silence + 1
+            length = self.position - self.window_start
+            if length >= self.max_window or (self.trailing_silence >= self.min_silence_frames and length >= self.min_window):
+                windows.append(self._emit())
+        return windows
+
+    def flush(self) -> List[Tuple[float, 'numpy.ndarray']]:
+        """
+        End the stream.
+
+        :return: The last window, if it contains speech
+        """
+        if self.has_speech and self.frames:
+            if len(self._remainder):
+                self.frames.append(self._remainder)
+                self.position += len(self._remainder)
+                self._remainder = np.zeros(0, dtype=np.int16)
+            return [self._emit()]
+        return []
@@ -0,0 +1,386 @@
+import json
+import math
+import re
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+TIMESTAMP_PATTERN = re.compile(
+    r"(?:(\d+):)?(\d{1,2}):(\d{2})[,.](\d{3})\s*-->\s*(?:(\d+):)?(\d{1,2}):(\d{2})[,.](\d{3})(.*)"
+)
+
+def format_timestamp(seconds: float, separator: str = ",") -> str:
+    """
+    Format seconds as an SRT/VTT timestamp (HH:MM:SS,mmm).
+
+    :param seconds: Time in seconds
+    :param separator: Separator between seconds and milliseconds ("," for SRT, "." for VTT)
+    :return: Formatted timestamp
+    """
+    milliseconds = max(0, int(round(seconds * 1000)))
+    hours, milliseconds = divmod(milliseconds, 3_600_000)
+    minutes, milliseconds = divmod(milliseconds, 60_000)
+    secs, milliseconds = divmod(milliseconds, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{milliseconds:03d}"
+
+def _to_seconds(hours: str, minutes: str, seconds: str, milliseconds: str) -> float:
+    return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds) + int(milliseconds) / 1000.0
+
+def parse_cues(transcription: str) -> List[Tuple[float, float, str]]:
+    """
+    Parse SRT or VTT text into a list of cues.
+
+    :param transcription: SRT or VTT formatted text
+    :return: List of (start, end, text) tuples, times in seconds
+    """
+    cues = []
+    for block in re.split(r"\n\s*\n", transcription.replace("\r\n", "\n").strip()):
+        lines = block.strip().split("\n")
+        for index, line in enumerate(lines):
+            match = TIMESTAMP_PATTERN.match(line.strip())
+            if match:
+                groups = match.groups()
+                start = _to_seconds(*groups[0:4])
+                end = _to_seconds(*groups[4:8])
+                cues.append((start, end, "\n".join(lines[index + 1:]).strip()))
+                break
+    return cues
+
+def render_srt(cues: List[Tuple[float, float, str]]) -> str:
+    """
+    Render cues as SRT text.
+
+    :param cues: List of (start, end, text) tuples
+    :return: SRT formatted text
+    """
+    blocks = [
+        f"{index}\n{format_timestamp(start)} --> {format_timestamp(end)}\n{text}"
+        for index, (start, end, text) in enumerate(cues, start=1)
+    ]
+    return "\n\n".join(blocks) + "\n"
+
+def render_vtt(cues: List[Tuple[float, float, str]]) -> str:
+    """
+    Render cues as WebVTT text.
+
+    :param cues: List of (start, end, text) tuples
+    :return: VTT formatted text
+    """
+    blocks = [
+        f"{format_timestamp(start, '.')} --> {format_timestamp(end, '.')}\n{text}"
+        for start, end, text in cues
+    ]
+    return "WEBVTT\n\n" + "\n\n".join(blocks) + "\n"
+
+def render_segments(segments: List[Dict[str, Any]], response_format: str = "text", language: Optional[str] = None, duration: Optional[float] = None) -> str:
+    """
+    Render the segments produced by an in-process model in a provider response format.
+
+    :param segments: List of segment dictionaries with at least start, end and text (and optionally words)
+    :param response_format: One of text, json, verbose_json, srt or vtt
+    :param language: Detected language, reported in verbose_json
+    :param duration: Audio duration in seconds, reported in verbose_json
+    :return: The transcription as text, SRT/VTT or a JSON string
+    """
+    text = " ".join(segment["text"].strip() for segment in segments).strip()
+    if response_format == "srt":
+        return render_srt([(segment["start"], segment["end"], segment["text"].strip()) for segment in segments])
+    if response_format == "vtt":
+        return render_vtt([(segment["start"], segment["end"], segment["text"].strip()) for segment in segments])
+    if response_format == "json":
+        return json.dumps({"text": text})
+    if response_format == "verbose_json":
+        result = {
+            "task": "transcribe",
+            "language": language,
+            "duration": duration if duration is not None else (segments[-1]["end"] if segments else 0.0),
+            "text": text,
+            "segments": [{**segment, "id": index} for index, segment in enumerate(segments)],
+        }
+        words = [word for segment in segments for word in segment.get("words") or []]
+        for segment in result["segments"]:
+            segment.pop("words", None)
+        if words:
+            result["words"] = words
+        return json.dumps(result)
+    return text
+
+class Segment:
+    """
+    A piece of transcribed text with its position in the source audio.
+
+    :param text: The transcribed text
+    :param start: Start time in seconds
+    :param end: End time in seconds
+    :param chunk_id: Index of the audio chunk the segment was transcribed from
+    :param confidence: Probability of the text according to the model (0-1), if the provider reports it
+    """
+
+    __slots__ = ('text', 'start', 'end', 'chunk_id', 'confidence')
+
+    def __init__(self, text: str, start: float, end: float, chunk_id: int = 0, confidence: Optional[float] = None):
+        self.text = text
+        self.start = start
+        self.end = end
+        self.chunk_id = chunk_id
+        self.confidence = confidence
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {'text': self.text, 'start': self.start, 'end': self.end, 'chunk_id': self.chunk_id}
+        if self.confidence is not None:
+            data['confidence'] = self.confidence
+        return data
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Segment):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"Segment(text={self.text!r}, start={self.start:.3f}, end={self.end:.3f}, chunk_id={self.chunk_id})"
+
+def segments_from_transcription(transcription: Any, offset: float = 0.0, chunk_id: int = 0, duration: Optional[float] = None) -> List[Segment]:
+    """
+    Extract segments from a provider transcription.
+
+    verbose_json transcriptions yield one Segment per provider segment; plain text
+    yields a single Segment spanning the whole audio.
+
+    :param transcription: The provider output (text, JSON string or dict)
+    :param offset: Time in seconds added to every timestamp
+    :param chunk_id: Chunk id for segments that don't carry their own
+    :param duration: Duration of the audio, used as the end of a plain text segment
+    :return: List of Segment objects
+    """
+    try:
+        data = _load_json(transcription)
+    except (TypeError, ValueError):
+        data = None
+    if not isinstance(data, dict):
+        text = str(transcription).strip()
+        return [Segment(text, offset, offset + (duration or 0.0), chunk_id)] if text else []
+    if not data.get("segments"):
+        text = data.get("text", "").strip()
+        return [Segment(text, offset, offset + float(data.get("duration") or duration or 0.0), chunk_id)] if text else []
+    return [
+        Segment(
+            segment["text"].strip(),
+            offset + segment["start"],
+            offset + segment["end"],
+            segment.get("chunk_id", chunk_id),
+            _confidence(segment),
+        )
+        for segment in data["segments"]
+    ]
+
+def _confidence(segment: Dict[str, Any]) -> Optional[float]:
+    if segment.get("confidence") is not None:
+        return float(segment["confidence"])
+    if segment.get("avg_logprob") is not None:
+        return math.exp(min(0.0, float(segment["avg_logprob"])))
+    return None
+
+class Transcript:
+    """
+    A transcription in a normalized form, from which every response format is rendered.
+
+    Segments are stored column-wise (a list of texts and one array per numeric field)
+    rather than as one object per segment, which keeps long transcripts compact in
+    memory and in the cache. Iterating yields Segment objects.
+    """
+
+    __slots__ = ('texts', 'starts', 'ends', 'confidences', 'chunk_ids', 'text', 'language', 'duration', 'words')
+
+    def __init__(
+        self,
+        segments: Iterable[Segment] = (),
+        text: Optional[str] = None,
+        language: Optional[str] = None,
+        duration: Optional[float] = None,
+        words: Optional[List[Dict[str, Any]]] = None,
+    ):
+        """
+        :param segments: The segments, in order
+        :param text: Full text as reported by the provider (default: the segment texts joined)
+        :param language: Detected language
+        :param duration: Duration of the audio in seconds (default: end of the last segment)
+        :param words: Word timestamps (dictionaries with word, start and end), if requested
+        """
+        self.texts: List[str] = []
+        self.starts = array('d')
+        self.ends = array('d')
+        # NaN marks an unknown confidence
+        self.confidences = array('f')
+        self.chunk_ids = array('i')
+        for segment in segments:
+            self.append(segment)
+        self.text = text
+        self.language = language
+        self.duration = duration
+        self.words = words
+
+    def append(self, segment: Segment):
+        self.texts.append(segment.text)
+        self.starts.append(segment.start)
+        self.ends.append(segment.end)
+        self.confidences.append(math.nan if segment.confidence is None else segment.confidence)
+        self.chunk_ids.append(segment.chunk_id)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, index: int) -> Segment:
+        confidence = self.confidences[index]
+        return Segment(
+            self.texts[index],
+            self.starts[index],
+            self.ends[index],
+            self.chunk_ids[index],
+            None if math.isnan(confidence) else confidence,
+        )
+
+    def __iter__(self) -> Iterator[Segment]:
+        return (self[index] for index in range(len(self)))
+
+    @property
+    def full_text(self) -> str:
+        if self.text is not None:
+            return self.text.strip()
+        return " ".join(text.strip() for text in self.texts).strip()
+
+    @classmethod
+    def from_transcription(cls, transcription: Any, duration: Optional[float] = None) -> 'Transcript':
+        """
+        Normalize a provider transcription.
+
+        verbose_json (with or without segments), json, SRT/VTT and plain text are all
+        accepted; text without timestamps becomes a single segment spanning the audio.
+
+        :param transcription: The provider output (text, JSON string or dict)
+        :param duration: Duration of the audio in seconds, if known
+        :return: Transcript object
+        """
+        try:
+            data = _load_json(transcription)
+        except (TypeError, ValueError):
+            data = None
+        if isinstance(data, dict):
+            return cls(
+                segments_from_transcription(data, duration=duration),
+                text=data.get("text", ""),
+                language=data.get("language"),
+                duration=float(data["duration"]) if data.get("duration") is not None else duration,
+                words=data.get("words"),
+            )
+        cues = parse_cues(transcription) if isinstance(transcription, str) else []
+        if cues:
+            return cls((Segment(text, start, end) for start, end, text in cues), duration=duration)
+        return cls(segments_from_transcription(transcription, duration=duration), text=str(transcription).strip(), duration=duration)
+
+    @classmethod
+    def concatenate(cls, parts: List[Tuple[float, 'Transcript']]) -> 'Transcript':
+        """
+        Join transcripts of consecutive audio chunks.
+
+        :param parts: List of (offset in seconds, Transcript) tuples, one per chunk
+        :return: Transcript with timestamps relative to the full audio and chunk ids set to the part index
+        """
+        parts = sorted(parts, key=lambda part: part[0])
+        merged = cls(text=" ".join(part.full_text for _, part in parts).strip())
+        words = []
+        for chunk_id, (offset, part) in enumerate(parts):
+            for segment in part:
+                segment.start += offset
+                segment.end += offset
+                segment.chunk_id = chunk_id
+                merged.append(segment)
+            words.extend({**word, "start": word["start"] + offset, "end": word["end"] + offset} for word in part.words or [])
+            merged.language = merged.language or part.language
+        if parts:
+            last_offset, last = parts[-1]
+            merged.duration = last_offset + (last.duration if last.duration is not None else (last.ends[-1] if len(last) else 0.0))
+        merged.words = words or None
+        return merged
+
+    def remap(self, mapper: Callable[[float], float]) -> 'Transcript':
+        """
+        Rewrite every timestamp through ``mapper``.
+
+        :param mapper: Function mapping a time in seconds to a new time in seconds
+        :return: A new Transcript
+        """
+        remapped = Transcript(text=self.text, language=self.language, duration=self.duration)
+        for segment in self:
+            segment.start = mapper(segment.start)
+            segment.end = mapper(segment.end)
+            remapped.append(segment)
+        if self.words:
+            remapped.words = [{**word, "start": mapper(word["start"]), "end": mapper(word["end"])} for word in self.words]
+        return remapped
+
+    def render(self, response_format: str = "text") -> str:
+        """
+        Render the transcript in a provider response format, without calling the provider.
+
+        :param response_format: One of text, json, verbose_json, srt or vtt
+        :return: The transcription as text, SRT/VTT or a JSON string
+        """
+        if response_format == "text":
+            return self.full_text
+        if response_format == "json":
+            return json.dumps({"text": self.full_text})
+        segments = []
+        for segment in self:
+            data = {"start": segment.start, "end": segment.end, "text": segment.text}
+            if segment.confidence is not None:
+                data["avg_logprob"] = math.log(max(segment.confidence, 1e-12))
+            segments.append(data)
+        if response_format == "verbose_json":
+            rendered = json.loads(render_segments(segments, "verbose_json", self.language, self.duration))
+            rendered["text"] = self.full_text
+            if self.words:
+                rendered["words"] = self.words
+            return json.dumps(rendered)
+        return render_segments(segments, response_format, self.language, self.duration)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Encode the transcript compactly for storage: one list per field instead of one object per segment.
+
+        :return: A JSON-serializable dictionary
+        """
+        return {
+            "version": 1,
+            "text": self.text,
+            "language": self.language,
+            "duration": self.duration,
+            "segments": {
+                "text": self.texts,
+                "start": [round(value, 3) for value in self.starts],
+                "end": [round(value, 3) for value in self.ends],
+                "confidence": [None if math.isnan(value) else round(value, 4) for value in self.confidences],
+                "chunk_id": list(self.chunk_ids),
+            },
+            "words": self.words,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Transcript':
+        """
+        Decode a transcript encoded with ``to_dict``.
+
+        :param data: The encoded transcript
+        :return: Transcript object
+        """
+        transcript = cls(text=data.get("text"), language=data.get("language"), duration=data.get("duration"), words=data.get("words"))
+        columns = data.get("segments") or {}
+        transcript.texts = list(columns.get("text", []))
+        transcript.starts = array('d', columns.get("start", []))
+        transcript.ends = array('d', columns.get("end", []))
+        transcript.confidences = array('f', (math.nan if value is None else value for value in columns.get("confidence", [])))
+        transcript.chunk_ids = array('i', columns.get("chunk_id", []))
+        return transcript
+
+def _load_json(transcription: Any) -> Dict[str, Any]:
+    if isinstance(transcription, (str, bytes)):
+        return json.loads(transcription)
+    return dict(transcription)
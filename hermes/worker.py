@@ -0,0 +1,266 @@
+import os
+import signal
+import logging
+import socket
+import threading
+import multiprocessing
+from typing import Any, Callable, Dict, Optional
+from .core import Hermes, transcribe, build_config
+from .utils.jobs import JobQueue, InvalidJobError
+from .utils.ratelimit import backoff_delay, retry_after_seconds
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Errors that another attempt won't fix: missing files and invalid job options
+NON_RETRYABLE_ERRORS = (FileNotFoundError, InvalidJobError)
+
+class Worker:
+    """
+    Long-lived worker processing jobs from a JobQueue with a pool of threads.
+
+    Every job goes through ``hermes.core.transcribe``, so the worker keeps one warm
+    Hermes instance per configuration (strategies, HTTP sessions, cache handles and
+    local models) across jobs, and a job whose transcription is already cached costs
+    no upload. Leases of the jobs in progress are renewed in the background; a
+    failing job is retried with exponential backoff until it runs out of attempts,
+    unless its error is one of ``NON_RETRYABLE_ERRORS``. Queue errors (e.g. a locked
+    or unavailable database) are logged and retried with backoff.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        threads: int = 4,
+        lease_seconds: float = 300,
+        poll_interval: float = 1.0,
+        retry: Optional[Dict[str, Any]] = None,
+        process: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        name: Optional[str] = None,
+    ):
+        """
+        :param queue: The queue to pull jobs from
+        :param threads: Number of jobs processed concurrently
+        :param lease_seconds: Lease duration; leases are renewed every third of it
+        :param poll_interval: Seconds to wait before polling an empty queue again
+        :param retry: The retry section of the configuration (base_delay, max_delay)
+        :param process: Function turning a job into its result (default: transcribe the job's source with its options)
+        :param name: Identifier of the worker in job leases (default: host and process id)
+        """
+        self.queue = queue
+        self.threads = threads
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.retry = retry or {}
+        self.process = process or run_job
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self.processed = 0
+        self.failed = 0
+        self._active: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def run(self, stop: Optional[threading.Event] = None, burst: bool = False) -> int:
+        """
+        Process jobs until ``stop`` is set, or until the queue is drained in burst mode.
+
+        Jobs already started are finished before returning.
+
+        :param stop: Event that stops the worker when set
+        :param burst: If True, return once no job is queued (including retries) or running
+        :return: Number of jobs processed, including failed attempts
+        """
+        stop = stop or threading.Event()
+        done = threading.Event()
+        heartbeat = threading.Thread(target=self._renew_leases, args=(done,), daemon=True)
+        heartbeat.start()
+        threads = [
+            threading.Thread(target=self._loop, args=(f"{self.name}/{index}", stop, burst), daemon=True)
+            for index in range(self.threads)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(0.5)
+        finally:
+            stop.set()
+            done.set()
+        return self.processed + self.failed
+
+    def _loop(self, owner: str, stop: threading.Event, burst: bool):
+        errors = 0
+        while not stop.is_set():
+            try:
+                job = self.queue.claim(owner, self.lease_seconds)
+                if job is None and burst and not self.queue.pending():
+                    return
+            except Exception:
+                logger.exception("Worker %s could not claim a job", owner)
+                stop.wait(backoff_delay(errors, self.poll_interval, self.retry.get('max_delay', 60.0)))
+                errors += 1
+                continue
+            errors = 0
+            if job is None:
+                stop.wait(self.poll_interval)
+                continue
+            try:
+                self.run_job(job, owner)
+            except Exception:
+                # The outcome couldn't be recorded; the job is retried once its lease expires
+                logger.exception("Worker %s could not record the outcome of job %s", owner, job['id'])
+
+    def run_job(self, job: Dict[str, Any], owner: str):
+        """
+        Process a claimed job and record its outcome in the queue.
+
+        :param job: The job, as returned by ``JobQueue.claim``
+        :param owner: The lease owner the job was claimed with
+        """
+        with self._lock:
+            self._active[job['id']] = owner
+        try:
+            result = self.process(job)
+        except Exception as e:
+            delay = backoff_delay(
+                job['attempts'] - 1,
+                self.retry.get('base_delay', 1.0),
+                self.retry.get('max_delay', 60.0),
+                _retry_after(e),
+            )
+            retry = not isinstance(e, NON_RETRYABLE_ERRORS)
+            self.queue.fail(job['id'], owner, f"{e.__class__.__name__}: {e}", delay, retry=retry)
+            with self._lock:
+                self.failed += 1
+        else:
+            self.queue.complete(job['id'], owner, result)
+            with self._lock:
+                self.processed += 1
+        finally:
+            with self._lock:
+                self._active.pop(job['id'], None)
+
+    def _renew_leases(self, done: threading.Event):
+        while not done.wait(self.lease_seconds / 3):
+            with self._lock:
+                active = list(self._active.items())
+            for job_id, owner in active:
+                try:
+                    self.queue.renew(job_id, owner, self.lease_seconds)
+                except Exception:
+                    logger.exception("Worker %s could not renew the lease of job %s", owner, job_id)
+
+def run_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Transcribe the source of a job with its options.
+
+    The options are checked first (provider, model, chunking), so that a job that
+    can never run fails with ``InvalidJobError`` instead of being retried.
+
+    :param job: The job
+    :return: The result of ``hermes.core.transcribe``
+    """
+    options = job['options']
+    if not isinstance(options, dict):
+        raise InvalidJobError(f"Job options must be a mapping, not {type(options).__name__}")
+    try:
+        config = build_config(options.get('provider'), options.get('model'), options.get('chunk_length'), options.get('max_workers'))
+        # Warms the instance transcribe() reuses; unknown source or provider types fail here
+        Hermes.from_config(config, reuse=True)
+    except ValueError as e:
+        raise InvalidJobError(str(e)) from e
+    return transcribe(job['source'], **options)
+
+def _retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, 'response', None)
+    if response is None or not hasattr(response, 'headers'):
+        return None
+    return retry_after_seconds(response)
+
+def get_queue(config: Optional[Dict[str, Any]] = None) -> JobQueue:
+    """
+    Open the job queue named in the worker section of the configuration.
+
+    :param config: The configuration (default: the process-wide configuration)
+    :return: JobQueue object
+    """
+    worker = (config or get_config()).get('worker') or {}
+    return JobQueue(worker.get('queue', '~/.hermes/queue.sqlite3'), worker.get('max_attempts', 3))
+
+def run_worker(
+    queue_path: str,
+    threads: int = 4,
+    lease_seconds: float = 300,
+    poll_interval: float = 1.0,
+    burst: bool = False,
+    stop: Optional[threading.Event] = None,
+) -> int:
+    """
+    Run a worker in the current process until it is stopped (SIGTERM or Ctrl-C).
+
+    :param queue_path: Path to the queue database
+    :param threads: Number of jobs processed concurrently
+    :param lease_seconds: Lease duration of claimed jobs
+    :param poll_interval: Seconds to wait before polling an empty queue again
+    :param burst: If True, return once the queue is drained
+    :param stop: Event that stops the worker when set (default: one set by SIGTERM/SIGINT)
+    :return: Number of jobs processed
+    """
+    config = get_config()
+    if stop is None:
+        stop = threading.Event()
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(signum, lambda *_: stop.set())
+    queue = JobQueue(queue_path, (config.get('worker') or {}).get('max_attempts', 3))
+    worker = Worker(queue, threads=threads, lease_seconds=lease_seconds, poll_interval=poll_interval, retry=config.get('retry'))
+    return worker.run(stop, burst=burst)
+
+def run_workers(
+    queue_path: str,
+    processes: int = 1,
+    threads: int = 4,
+    lease_seconds: float = 300,
+    poll_interval: float = 1.0,
+    burst: bool = False,
+) -> int:
+    """
+    Run worker processes, each with its own pool of threads, and supervise them.
+
+    A process that dies is replaced; the jobs it held are picked up again when their
+    leases expire. SIGTERM or Ctrl-C stops every worker once its current jobs are done.
+
+    :param queue_path: Path to the queue database
+    :param processes: Number of worker processes (1 runs the worker in this process)
+    :param threads: Number of jobs processed concurrently by each process
+    :param lease_seconds: Lease duration of claimed jobs
+    :param poll_interval: Seconds to wait before polling an empty queue again
+    :param burst: If True, stop once the queue is drained
+    :return: Number of jobs processed (only counted when running in this process)
+    """
+    if processes <= 1:
+        return run_worker(queue_path, threads, lease_seconds, poll_interval, burst)
+
+    stop = threading.Event()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda *_: stop.set())
+    # Spawned rather than forked: the parent may hold threads, sockets and SQLite handles
+    context = multiprocessing.get_context('spawn')
+    args = (queue_path, threads, lease_seconds, poll_interval, burst)
+    workers = [context.Process(target=run_worker, args=args) for _ in range(processes)]
+    for process in workers:
+        process.start()
+    try:
+        while not stop.is_set() and any(process.is_alive() for process in workers):
+            for index, process in enumerate(workers):
+                if not process.is_alive() and process.exitcode != 0:
+                    workers[index] = context.Process(target=run_worker, args=args)
+                    workers[index].start()
+            stop.wait(poll_interval)
+    finally:
+        for process in workers:
+            if process.is_alive():
+                process.terminate()
+        for process in workers:
+            process.join()
+    return 0
@@ -11,6 +11,9 @@ with open("requirements.txt") as f:
 # MLX-specific requirements
 mlx_requirements = ["mlx-whisper>=0.3.0"]
 
+# Local CPU transcription requirements
+local_requirements = ["faster-whisper>=1.0.0"]
+
 # Define the default configuration
 DEFAULT_CONFIG = {
     'llm': {
@@ -52,6 +55,7 @@ setup(
     install_requires=requirements,
     extras_require={
         "mlx": mlx_requirements,
+        "local": local_requirements,
     },
     entry_points={
         "console_scripts": [
@@ -69,7 +73,7 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.9",
     cmdclass={
         'install': PostInstallCommand,
     },
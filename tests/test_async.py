@@ -0,0 +1,106 @@
+import asyncio
+import httpx
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+from hermes.core import Hermes, transcribe_many_async
+from hermes.strategies.provider.groq import GroqProviderStrategy
+from hermes.strategies.provider.openai import OpenAIProviderStrategy
+from hermes.utils.http import get_session, get_async_client
+
+@pytest.fixture
+def mock_hermes():
+    with patch('hermes.core.SourceStrategy'), \
+         patch('hermes.core.ProviderStrategy'), \
+         patch('hermes.core.Cache'), \
+         patch('hermes.core.LLMProcessor'):
+        hermes = Hermes()
+    hermes.cache.get.return_value = None
+    hermes.source_strategy.get_audio.side_effect = lambda source: source.encode()
+    hermes.provider_strategy.atranscribe = AsyncMock(side_effect=lambda audio, params, duration=None: audio.decode().upper())
+    return hermes
+
+def test_get_session_is_shared():
+    assert get_session('groq') is get_session('groq')
+    assert get_session('groq') is not get_session('openai')
+
+def test_get_async_client_is_shared_per_loop():
+    async def clients():
+        return get_async_client('groq'), get_async_client('groq')
+
+    first, second = asyncio.run(clients())
+    assert first is second
+    third, _ = asyncio.run(clients())
+    assert third is not first
+
+def test_atranscribe(mock_hermes):
+    result = asyncio.run(mock_hermes.atranscribe('source'))
+
+    assert result['transcription'] == 'SOURCE'
+    mock_hermes.provider_strategy.atranscribe.assert_awaited_once()
+    mock_hermes.cache.set.assert_called_once()
+
+def test_atranscribe_cached(mock_hermes):
+    mock_hermes.cache.get.return_value = {'cached': 'result'}
+
+    assert asyncio.run(mock_hermes.atranscribe('source')) == {'cached': 'result'}
+    mock_hermes.provider_strategy.atranscribe.assert_not_called()
+
+def test_transcribe_many_async_bounds_concurrency(mock_hermes):
+    in_flight = 0
+    peak = 0
+
+    async def slow_transcribe(audio, params, duration=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return audio.decode()
+
+    mock_hermes.provider_strategy.atranscribe = slow_transcribe
+    sources = [f'source{i}' for i in range(10)]
+
+    results = asyncio.run(mock_hermes.transcribe_many_async(sources, max_concurrency=3))
+
+    assert [result['transcription'] for result in results] == sources
+    assert peak == 3
+
+def test_module_transcribe_many_async_closes_clients(mock_hermes):
+    async def transcribe_many(sources, **kwargs):
+        clients.append(get_async_client('groq'))
+        return [{'transcription': source} for source in sources]
+
+    clients = []
+    mock_hermes.transcribe_many_async = transcribe_many
+    with patch('hermes.core.build_config'), patch('hermes.core.Hermes.from_config', return_value=mock_hermes):
+        results = asyncio.run(transcribe_many_async(['source']))
+
+    assert results == [{'transcription': 'source'}]
+    assert clients[0].is_closed
+
+def test_groq_atranscribe_uses_async_client():
+    def handler(request):
+        assert request.headers['Authorization'] == 'Bearer fake_api_key'
+        assert b'name="response_format"\r\n\r\nsrt' in request.content
+        return httpx.Response(200, text='1\n00:00:00,000 --> 00:00:01,000\nhi\n')
+
+    async def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch('hermes.strategies.provider.groq.get_async_client', return_value=client):
+            return await GroqProviderStrategy({'transcription': {'provider': 'groq', 'api_key': 'fake_api_key'}}).atranscribe(b'audio data', {'response_format': 'srt'})
+
+    assert asyncio.run(run()).endswith('hi\n')
+
+def test_provider_api_key_is_checked_on_first_use():
+    with patch.dict('os.environ', {}, clear=True):
+        strategy = GroqProviderStrategy({'transcription': {'provider': 'groq', 'api_key': None}})
+        with pytest.raises(ValueError, match='GROQ_API_KEY'):
+            asyncio.run(strategy.atranscribe(b'audio data'))
+
+def test_openai_atranscribe_parses_json():
+    async def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={'text': 'hi'})))
+        with patch('hermes.strategies.provider.openai.get_async_client', return_value=client):
+            return await OpenAIProviderStrategy({'transcription': {'provider': 'openai', 'api_key': 'fake_api_key'}}).atranscribe(b'audio data', {'response_format': 'json'})
+
+    assert asyncio.run(run()) == {'text': 'hi'}
@@ -0,0 +1,203 @@
+import io
+import subprocess
+import wave
+import numpy as np
+import pytest
+from unittest.mock import Mock, patch
+from pydub import AudioSegment
+from pydub.generators import Sine
+from hermes.utils.audio import (
+    split_on_silence_boundaries, load_audio_bytes, convert_to_wav, iter_pcm_chunks, decode_to_wav,
+    detect_audio_format, encode_for_upload, estimate_audio_duration,
+    detect_speech_regions, strip_silence, decode_stream_to_wav,
+)
+
+def make_speech_with_gaps():
+    tone = Sine(440).to_audio_segment(duration=4000).apply_gain(-6)
+    gap = AudioSegment.silent(duration=1000)
+    return (tone + gap) * 4
+
+def test_split_on_silence_boundaries_cuts_in_silence():
+    audio = make_speech_with_gaps()
+    chunks = split_on_silence_boundaries(audio, chunk_length=6, min_silence_len=500, silence_thresh=-50, search_window=3)
+
+    assert sum(len(segment) for _, segment in chunks) == len(audio)
+    for offset, segment in chunks[1:]:
+        # Every cut must land inside one of the 1 s gaps that start at 4 s, 9 s, 14 s, ...
+        assert (offset % 5) >= 4
+
+def test_split_on_silence_boundaries_hard_cut_without_silence():
+    audio = Sine(440).to_audio_segment(duration=5000)
+    chunks = split_on_silence_boundaries(audio, chunk_length=2, silence_thresh=-90)
+    assert [offset for offset, _ in chunks] == [0.0, 2.0, 4.0]
+
+def test_load_audio_bytes_wav_roundtrip():
+    audio = Sine(440).to_audio_segment(duration=1000)
+    wav = convert_to_wav(audio)
+    loaded = load_audio_bytes(wav)
+    assert loaded.frame_rate == 16000
+    assert loaded.channels == 1
+    assert abs(len(loaded) - 1000) <= 1
+
+def make_ffmpeg_process(stdout, stderr=b'', returncode=0):
+    process = Mock()
+    process.stdout = io.BytesIO(stdout)
+    process.stderr = io.BytesIO(stderr)
+    process.poll.return_value = None
+    process.wait.return_value = returncode
+    return process
+
+@patch('hermes.utils.audio.ffmpeg')
+def test_iter_pcm_chunks_streams_ffmpeg_output(mock_ffmpeg):
+    process = make_ffmpeg_process(b'\x01\x00' * 5)
+    mock_ffmpeg.input.return_value.output.return_value.global_args.return_value.run_async.return_value = process
+
+    chunks = list(iter_pcm_chunks('input.mp4', chunk_size=4))
+
+    assert chunks == [b'\x01\x00\x01\x00', b'\x01\x00\x01\x00', b'\x01\x00']
+    output_kwargs = mock_ffmpeg.input.return_value.output.call_args.kwargs
+    assert output_kwargs['ar'] == 16000 and output_kwargs['ac'] == 1
+
+@patch('hermes.utils.audio.ffmpeg')
+def test_iter_pcm_chunks_raises_on_ffmpeg_error(mock_ffmpeg):
+    process = make_ffmpeg_process(b'', stderr=b'Invalid data found', returncode=1)
+    mock_ffmpeg.input.return_value.output.return_value.global_args.return_value.run_async.return_value = process
+
+    with pytest.raises(RuntimeError, match='Invalid data found'):
+        list(iter_pcm_chunks('broken.mp4'))
+
+@patch('hermes.utils.audio.iter_pcm_chunks')
+def test_decode_to_wav(mock_iter):
+    mock_iter.return_value = iter([b'\x00\x00' * 8000, b'\x00\x00' * 8000])
+
+    wav = decode_to_wav('input.mp4')
+
+    with wave.open(io.BytesIO(wav)) as wav_file:
+        assert wav_file.getframerate() == 16000
+        assert wav_file.getnchannels() == 1
+        assert wav_file.getnframes() == 16000
+
+@pytest.mark.parametrize('data, expected', [
+    (b'RIFF\x00\x00\x00\x00WAVE', 'wav'),
+    (b'fLaC\x00\x00', 'flac'),
+    (b'OggS\x00\x02', 'ogg'),
+    (b'ID3\x04\x00', 'mp3'),
+    (b'\xff\xfb\x90\x00', 'mp3'),
+    (b'\x00\x00\x00\x20ftypM4A ', 'm4a'),
+    (b'\x1a\x45\xdf\xa3\x01', 'webm'),
+    (b'unknown', 'wav'),
+])
+def test_detect_audio_format(data, expected):
+    assert detect_audio_format(data)[0] == expected
+
+def test_encode_for_upload_passthrough():
+    wav = convert_to_wav(Sine(440).to_audio_segment(duration=100))
+    assert encode_for_upload(wav, None) is wav
+    assert encode_for_upload(wav, 'wav') is wav
+    assert encode_for_upload(b'ID3 already mp3', 'flac') == b'ID3 already mp3'
+    with pytest.raises(ValueError):
+        encode_for_upload(wav, 'aac')
+
+@patch('hermes.utils.audio.ffmpeg')
+def test_encode_for_upload_pipes_through_ffmpeg(mock_ffmpeg):
+    wav = convert_to_wav(Sine(440).to_audio_segment(duration=100))
+    mock_ffmpeg.input.return_value.output.return_value.global_args.return_value.run.return_value = (b'fLaC encoded', b'')
+
+    assert encode_for_upload(wav, 'flac') == b'fLaC encoded'
+    output_kwargs = mock_ffmpeg.input.return_value.output.call_args.kwargs
+    assert output_kwargs['acodec'] == 'flac' and output_kwargs['ar'] == 16000 and output_kwargs['ac'] == 1
+
+@patch('hermes.utils.audio.ffmpeg')
+def test_encode_for_upload_falls_back_to_wav(mock_ffmpeg):
+    mock_ffmpeg.Error = type('Error', (Exception,), {})
+    mock_ffmpeg.input.return_value.output.return_value.global_args.return_value.run.side_effect = mock_ffmpeg.Error('boom')
+    wav = convert_to_wav(Sine(440).to_audio_segment(duration=100))
+
+    assert encode_for_upload(wav, 'ogg') == wav
+
+def test_estimate_audio_duration():
+    wav = convert_to_wav(Sine(440).to_audio_segment(duration=1500))
+    assert estimate_audio_duration(wav) == pytest.approx(1.5, abs=0.01)
+    assert estimate_audio_duration(b'\xff\xfb' + b'\x00' * 15998) == 1.0
+
+def make_pcm(pattern, sample_rate=16000):
+    """Build 16-bit PCM from (seconds, is_speech) pairs: a loud tone for speech, faint noise otherwise."""
+    rng = np.random.default_rng(0)
+    parts = []
+    for seconds, is_speech in pattern:
+        count = int(seconds * sample_rate)
+        if is_speech:
+            t = np.arange(count) / sample_rate
+            parts.append(np.sin(2 * np.pi * 220 * t) * 8000)
+        else:
+            parts.append(rng.normal(0, 5, count))
+    return np.concatenate(parts).astype('<i2')
+
+def pcm_to_wav(samples, sample_rate=16000):
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+def test_detect_speech_regions():
+    samples = make_pcm([(2, True), (3, False), (1, True), (0.5, False), (1, True), (2, False)])
+    regions = detect_speech_regions(samples, padding_ms=0, min_silence_ms=1000)
+
+    # The 0.5 s pause is kept, the 3 s and trailing 2 s silences are not
+    assert len(regions) == 2
+    (first_start, first_end), (second_start, second_end) = regions
+    assert first_start == 0 and abs(first_end - 2 * 16000) <= 480
+    assert abs(second_start - 5 * 16000) <= 480 and abs(second_end - 7.5 * 16000) <= 480
+
+def test_detect_speech_regions_all_quiet():
+    assert detect_speech_regions(make_pcm([(2, False)])) == []
+
+def test_strip_silence_reports_and_maps_offsets():
+    wav = pcm_to_wav(make_pcm([(2, True), (3, False), (2, True)]))
+
+    stripped, offset_map, report = strip_silence(wav, padding_ms=100)
+
+    assert report['original_duration'] == pytest.approx(7.0)
+    assert report['removed_seconds'] == pytest.approx(2.8, abs=0.05)
+    assert estimate_audio_duration(stripped) == pytest.approx(report['kept_duration'])
+    # 3 s into the stripped audio is 1 s into the second speech burst, i.e. 6 s in the original
+    assert offset_map.to_original(0.5) == pytest.approx(0.5)
+    assert offset_map.to_original(report['kept_duration'] - 1) == pytest.approx(6.0, abs=0.05)
+
+def test_strip_silence_keeps_audio_without_speech():
+    wav = pcm_to_wav(make_pcm([(1, False)]))
+    stripped, offset_map, report = strip_silence(wav)
+    assert report['removed_seconds'] == 0
+    assert offset_map.to_original(0.25) == 0.25
+
+def fake_ffmpeg(command):
+    # Stand in for the ffmpeg pipeline with a process that has the same pipes
+    mock_ffmpeg = Mock()
+    process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    mock_ffmpeg.input.return_value.output.return_value.global_args.return_value.run_async.return_value = process
+    return mock_ffmpeg
+
+def test_decode_stream_to_wav_pipes_chunks():
+    chunks = [bytes([i]) * 4000 for i in range(50)]
+    with patch('hermes.utils.audio.ffmpeg', fake_ffmpeg(['cat'])):
+        wav_data = decode_stream_to_wav(iter(chunks), 8000)
+    with wave.open(io.BytesIO(wav_data)) as wav_file:
+        assert wav_file.getframerate() == 8000
+        assert wav_file.getnchannels() == 1
+        assert wav_file.readframes(wav_file.getnframes()) == b''.join(chunks)
+
+def test_decode_stream_to_wav_drains_input_on_failure():
+    consumed = []
+
+    def chunks():
+        for i in range(200):
+            consumed.append(i)
+            yield b'x' * 4096
+
+    with patch('hermes.utils.audio.ffmpeg', fake_ffmpeg(['sh', '-c', 'head -c 10 >/dev/null; echo bad input >&2; exit 1'])):
+        with pytest.raises(RuntimeError, match='bad input'):
+            decode_stream_to_wav(chunks())
+    assert len(consumed) == 200
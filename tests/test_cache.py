@@ -1,7 +1,11 @@
+import os
 import pytest
 from pathlib import Path
-from unittest.mock import patch, mock_open
-from hermes.utils.cache import Cache
+from unittest.mock import Mock, patch, mock_open
+from hermes.utils.cache import (
+    Cache, SQLiteCache, MemoryCache, MediaCache, content_cache_key, hash_bytes,
+    youtube_media_key, web_media_key, get_media_cache, llm_cache_key,
+)
 
 @pytest.fixture
 def cache():
@@ -67,4 +71,208 @@ def test_cache_clear(mock_unlink, mock_exists, cache):
 def test_cache_clear_disabled():
     disabled_cache = Cache({'enabled': False})
     disabled_cache.clear()
-    # No assertion needed, just make sure it doesn't raise an exception
\ No newline at end of file
+    # No assertion needed, just make sure it doesn't raise an exception
+def test_content_cache_key_ignores_api_key_and_source():
+    key = content_cache_key('abc', 'GroqProviderStrategy', {'model': 'm', 'response_format': 'srt', 'api_key': 'secret'})
+    same = content_cache_key('abc', 'GroqProviderStrategy', {'response_format': 'srt', 'model': 'm', 'api_key': 'other'})
+    assert key == same
+    assert key.startswith('content_abc_')
+    assert key != content_cache_key('abc', 'GroqProviderStrategy', {'model': 'm', 'response_format': 'vtt'})
+
+def test_cache_file_digest_uses_size_and_mtime_fast_path(tmp_path):
+    cache = Cache({'enabled': True, 'directory': str(tmp_path / 'cache')})
+    media = tmp_path / 'media.wav'
+    media.write_bytes(b'audio bytes')
+    copy = tmp_path / 'copy.wav'
+    copy.write_bytes(b'audio bytes')
+
+    digest = cache.file_digest(str(media))
+    assert digest == hash_bytes(b'audio bytes')
+    assert cache.file_digest(str(copy)) == digest
+
+    with patch('hermes.utils.cache.hash_file') as mock_hash_file:
+        assert cache.file_digest(str(media)) == digest
+        mock_hash_file.assert_not_called()
+
+    os.utime(media, ns=(0, 0))
+    media.write_bytes(b'edited audio')
+    assert cache.file_digest(str(media)) == hash_bytes(b'edited audio')
+
+@pytest.fixture
+def sqlite_cache(tmp_path):
+    return Cache.get_cache({'enabled': True, 'directory': str(tmp_path), 'backend': 'sqlite'})
+
+def test_get_cache_selects_backend(tmp_path):
+    assert type(Cache.get_cache({'directory': str(tmp_path)})) is Cache
+    assert isinstance(Cache.get_cache({'directory': str(tmp_path), 'backend': 'sqlite'}), SQLiteCache)
+    with pytest.raises(ValueError):
+        Cache.get_cache({'directory': str(tmp_path), 'backend': 'invalid'})
+
+def test_sqlite_cache_roundtrip(sqlite_cache):
+    assert sqlite_cache.get('missing') is None
+    sqlite_cache.set('key', {'source': 'a.mp4', 'transcription': 'hello'})
+    assert sqlite_cache.get('key') == {'source': 'a.mp4', 'transcription': 'hello'}
+    sqlite_cache.set('key', 'replaced')
+    assert sqlite_cache.get('key') == 'replaced'
+    sqlite_cache.clear()
+    assert sqlite_cache.get('key') is None
+
+def test_sqlite_cache_ttl(sqlite_cache):
+    with patch('hermes.utils.cache.time.time', return_value=1000.0):
+        sqlite_cache.set('short', 'value', ttl=10)
+        sqlite_cache.set('forever', 'value')
+    with patch('hermes.utils.cache.time.time', return_value=1011.0):
+        assert sqlite_cache.get('short') is None
+        assert sqlite_cache.get('forever') == 'value'
+
+def test_sqlite_cache_lru_max_entries(tmp_path):
+    cache = SQLiteCache({'directory': str(tmp_path), 'max_entries': 2, 'touch_interval': 0})
+    with patch('hermes.utils.cache.time.time', side_effect=[1.0, 2.0, 3.0, 4.0, 5.0]):
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+def test_sqlite_cache_reads_touch_entries_at_most_once_per_interval(tmp_path):
+    cache = SQLiteCache({'directory': str(tmp_path), 'touch_interval': 60})
+    with patch('hermes.utils.cache.time.time', return_value=1000.0):
+        cache.set('a', 1)
+    accessed_at = lambda: cache._connection().execute("SELECT accessed_at FROM entries WHERE key = 'a'").fetchone()[0]
+    with patch('hermes.utils.cache.time.time', return_value=1030.0):
+        assert cache.get('a') == 1
+    assert accessed_at() == 1000.0
+    with patch('hermes.utils.cache.time.time', return_value=1061.0):
+        assert cache.get('a') == 1
+    assert accessed_at() == 1061.0
+
+def test_sqlite_cache_max_bytes(tmp_path):
+    cache = SQLiteCache({'directory': str(tmp_path), 'max_bytes': 20})
+    with patch('hermes.utils.cache.time.time', side_effect=[1.0, 2.0, 3.0]):
+        cache.set('a', 'x' * 10)
+        cache.set('b', 'y' * 10)
+        cache.set('c', 'z' * 10)
+    assert cache.get('a') is None
+    assert cache.get('b') is None
+    assert cache.get('c') == 'z' * 10
+
+def test_sqlite_cache_shared_between_instances(tmp_path):
+    writer = SQLiteCache({'directory': str(tmp_path)})
+    reader = SQLiteCache({'directory': str(tmp_path)})
+    writer.set('key', 'value')
+    assert reader.get('key') == 'value'
+
+def test_file_cache_ttl(tmp_path):
+    cache = Cache({'directory': str(tmp_path), 'ttl': 10})
+    with patch('hermes.utils.cache.time.time', return_value=1000.0):
+        cache.set('key', 'value')
+        assert cache.get('key') == 'value'
+    with patch('hermes.utils.cache.time.time', return_value=1011.0):
+        assert cache.get('key') is None
+
+def test_get_cache_wraps_backend_in_memory_tier(tmp_path):
+    cache = Cache.get_cache({'directory': str(tmp_path), 'backend': 'sqlite', 'memory': {'enabled': True}})
+    assert isinstance(cache, MemoryCache)
+    assert isinstance(cache.backend, SQLiteCache)
+
+def test_memory_cache_read_through_and_write_through():
+    backend = Mock(enabled=True, cache_dir=Path('/tmp/hermes_cache'), ttl=None)
+    backend.get_entry.return_value = ('from disk', None)
+    cache = MemoryCache(backend, {})
+
+    assert cache.get('key') == 'from disk'
+    assert cache.get('key') == 'from disk'
+    backend.get_entry.assert_called_once_with('key')
+
+    cache.set('other', 'value')
+    backend.set.assert_called_once_with('other', 'value', ttl=None)
+    assert cache.get('other') == 'value'
+    assert cache.stats() == {'hits': 2, 'misses': 1, 'evictions': 0, 'entries': 2, 'bytes': 18}
+
+def test_memory_cache_evicts_lru_by_entries_and_bytes():
+    backend = Mock(enabled=True, cache_dir=Path('/tmp/hermes_cache'), ttl=None)
+    backend.get_entry.return_value = None
+    cache = MemoryCache(backend, {'max_entries': 2, 'max_bytes': 30})
+
+    cache.set('a', 'x' * 5)
+    cache.set('b', 'y' * 5)
+    cache.get('a')
+    cache.set('c', 'z' * 5)
+    assert list(cache.entries) == ['a', 'c']
+
+    cache.set('d', 'w' * 25)
+    assert list(cache.entries) == ['d']
+    assert cache.stats()['evictions'] == 3
+    assert cache.stats()['bytes'] == 27
+
+def test_memory_cache_clear_clears_backend():
+    backend = Mock(enabled=True, cache_dir=Path('/tmp/hermes_cache'), ttl=None)
+    cache = MemoryCache(backend, {})
+    cache.set('a', 'value')
+    cache.clear()
+    assert cache.stats()['entries'] == 0
+    backend.clear.assert_called_once()
+
+def test_youtube_media_key_uses_video_id():
+    key = youtube_media_key('https://www.youtube.com/watch?v=PNulbFECY-I&t=10')
+    assert key == youtube_media_key('https://youtu.be/PNulbFECY-I')
+    assert key == youtube_media_key('https://www.youtube.com/shorts/PNulbFECY-I')
+    assert key != youtube_media_key('https://youtu.be/PNulbFECY-I', sample_rate=8000)
+    assert key != youtube_media_key('https://youtu.be/aaaaaaaaaaa')
+
+def test_web_media_key_includes_validator():
+    assert web_media_key('https://example.com/a.mp3', 'etag:"1"') == web_media_key('https://example.com/a.mp3', 'etag:"1"')
+    assert web_media_key('https://example.com/a.mp3', 'etag:"1"') != web_media_key('https://example.com/a.mp3', 'etag:"2"')
+
+def test_media_cache_get_or_fetch(tmp_path):
+    media_cache = MediaCache({'directory': str(tmp_path)})
+    fetch = Mock(return_value=b'RIFF data')
+    assert media_cache.get_or_fetch('web_a', fetch) == b'RIFF data'
+    assert media_cache.get_or_fetch('web_a', fetch) == b'RIFF data'
+    fetch.assert_called_once()
+    assert media_cache.stats() == {'hits': 1, 'misses': 1, 'evictions': 0, 'entries': 1, 'bytes': 9}
+    assert not list(tmp_path.glob('*.tmp'))
+
+def test_media_cache_evicts_least_recently_used(tmp_path):
+    media_cache = MediaCache({'directory': str(tmp_path), 'max_bytes': 250})
+    media_cache.set('a', b'a' * 100)
+    media_cache.set('b', b'b' * 100)
+    os.utime(tmp_path / 'a.wav', (1, 1))
+    os.utime(tmp_path / 'b.wav', (2, 2))
+    media_cache.get('a')
+    media_cache.set('c', b'c' * 100)
+    assert media_cache.get('b') is None
+    assert media_cache.get('a') == b'a' * 100
+    assert media_cache.get('c') == b'c' * 100
+    assert media_cache.stats()['evictions'] == 1
+
+def test_media_cache_disabled(tmp_path):
+    media_cache = MediaCache({'enabled': False, 'directory': str(tmp_path / 'media')})
+    media_cache.set('a', b'data')
+    assert media_cache.get('a') is None
+    assert not (tmp_path / 'media').exists()
+
+def test_get_media_cache_is_shared(tmp_path):
+    config = {'directory': str(tmp_path), 'max_bytes': 10}
+    assert get_media_cache(config) is get_media_cache(dict(config))
+    assert get_media_cache(config) is not get_media_cache({'directory': str(tmp_path), 'max_bytes': 20})
+
+def test_llm_cache_key():
+    key = llm_cache_key('text', 'Summarize', 'groq/llama', {'temperature': 0})
+    assert key.startswith('llm_')
+    assert key == llm_cache_key('text', 'Summarize', 'groq/llama', {'temperature': 0, 'api_key': 'secret'})
+    assert key != llm_cache_key('text2', 'Summarize', 'groq/llama', {'temperature': 0})
+    assert key != llm_cache_key('text', 'Translate', 'groq/llama', {'temperature': 0})
+    assert key != llm_cache_key('text', 'Summarize', 'openai/gpt', {'temperature': 0})
+    assert key != llm_cache_key('text', 'Summarize', 'groq/llama', {'temperature': 1})
+
+def test_memory_cache_keeps_backend_expiry(tmp_path):
+    cache = MemoryCache(SQLiteCache({'directory': str(tmp_path)}), {})
+    with patch('hermes.utils.cache.time.time', return_value=1000.0):
+        cache.backend.set('key', 'value', ttl=0.5)
+        assert cache.get('key') == 'value'
+    with patch('hermes.utils.cache.time.time', return_value=1000.7):
+        assert cache.backend.get('key') is None
+        assert cache.get('key') is None
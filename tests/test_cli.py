@@ -1,6 +1,7 @@
+import json
 import pytest
 from unittest.mock import patch
-from hermes.cli import parse_args, main
+from hermes.cli import parse_args, main, collect_sources
 
 def test_parse_args():
     known_args, extra_args = parse_args(['test_source', '-p', 'groq', '-m', 'test_model', '--response_format', 'json'])
@@ -49,4 +50,111 @@ def test_main_with_llm_processing(mock_transcribe):
         llm_prompt='Summarize',
         model=None,
         response_format='text'
-    )
\ No newline at end of file
+    )
+
+@patch('hermes.cli.Hermes')
+@patch('hermes.cli.transcribe')
+def test_main_cache_stats(mock_transcribe, mock_hermes_class, capsys):
+    mock_transcribe.return_value = {'transcription': 'Test', 'llm_processed': 'Summary'}
+    mock_hermes_class.from_config.return_value.cache_stats.return_value = {'llm': {'hits': 1, 'misses': 0}}
+    with patch('sys.argv', ['hermes', 'test_source', '--llm_prompt', 'Summarize', '--cache_stats']):
+        main()
+    assert json.loads(capsys.readouterr().err) == {'llm': {'hits': 1, 'misses': 0}}
+    assert mock_hermes_class.from_config.call_args.kwargs == {'reuse': True}
+
+@patch('hermes.cli.Hermes')
+def test_main_stream(mock_hermes_class, capsys):
+    from hermes.utils.transcript import Segment
+    mock_hermes_class.from_config.return_value.transcribe_stream.return_value = iter([
+        Segment('Hello', 0.0, 1.5, 0),
+        Segment('world', 1.5, 3.0, 1),
+    ])
+    with patch('sys.argv', ['hermes', 'test_source', '--stream', '--response_format', 'srt', '--chunk_length', '20']):
+        main()
+    captured = capsys.readouterr()
+    assert captured.out == "1\n00:00:00,000 --> 00:00:01,500\nHello\n\n2\n00:00:01,500 --> 00:00:03,000\nworld\n\n"
+    kwargs = mock_hermes_class.from_config.return_value.transcribe_stream.call_args.kwargs
+    assert kwargs['chunk_length'] == 20
+
+@patch('hermes.cli.Hermes')
+def test_main_stream_text(mock_hermes_class, capsys):
+    from hermes.utils.transcript import Segment
+    mock_hermes_class.from_config.return_value.transcribe_stream.return_value = iter([Segment('Hello', 0.0, 1.5, 0)])
+    with patch('sys.argv', ['hermes', 'test_source', '--stream']):
+        main()
+    assert capsys.readouterr().out == "[00:00:00.000 --> 00:00:01.500] Hello\n"
+
+@patch('hermes.cli.Hermes')
+def test_main_stream_with_llm_prompt(mock_hermes_class, capsys):
+    from hermes.utils.transcript import Segment
+    hermes = mock_hermes_class.from_config.return_value
+    hermes.transcribe_stream.return_value = iter([Segment('Hello', 0.0, 1.5, 0), Segment('world', 1.5, 3.0, 1)])
+    job = hermes.llm_processor.map_reduce.return_value
+    job.result.return_value = 'Greeting'
+    with patch('sys.argv', ['hermes', 'test_source', '--stream', '--llm_prompt', 'Summarize']):
+        main()
+    assert capsys.readouterr().out.endswith("\nLLM Processed Result:\nGreeting\n")
+    hermes.llm_processor.map_reduce.assert_called_once_with('Summarize')
+    assert [call.args[0] for call in job.feed.call_args_list] == ['Hello', 'world']
+
+def test_collect_sources_from_directory(tmp_path):
+    (tmp_path / 'b.mp3').write_bytes(b'')
+    (tmp_path / 'nested').mkdir()
+    (tmp_path / 'nested' / 'a.mp4').write_bytes(b'')
+    (tmp_path / '.hidden').write_bytes(b'')
+    assert collect_sources(str(tmp_path)) == [str(tmp_path / 'b.mp3'), str(tmp_path / 'nested' / 'a.mp4')]
+
+def test_collect_sources_from_list_file(tmp_path):
+    list_file = tmp_path / 'sources.txt'
+    list_file.write_text('# podcasts\nhttps://example.com/a.mp3\n\n/data/b.mp4\n')
+    assert collect_sources(str(list_file)) == ['https://example.com/a.mp3', '/data/b.mp4']
+
+@patch('hermes.cli.Hermes')
+def test_batch_main_streams_jsonl(mock_hermes_class, tmp_path, capsys):
+    list_file = tmp_path / 'sources.txt'
+    list_file.write_text('a.mp3\nb.mp3\n')
+    mock_hermes_class.from_config.return_value.transcribe_batch.return_value = iter([
+        {'source': 'b.mp3', 'transcription': 'B'},
+        {'source': 'a.mp3', 'transcription': 'A'},
+    ])
+
+    with patch('sys.argv', ['hermes', 'batch', str(list_file), '--max_workers', '8']):
+        main()
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)['transcription'] for line in lines] == ['B', 'A']
+    mock_hermes_class.from_config.return_value.transcribe_batch.assert_called_once_with(
+        ['a.mp3', 'b.mp3'], max_workers=8, force=False, response_format='text'
+    )
+
+@patch('hermes.cli.Hermes')
+def test_batch_main_fails_on_errors(mock_hermes_class, tmp_path):
+    list_file = tmp_path / 'sources.txt'
+    list_file.write_text('a.mp3\n')
+    output_file = tmp_path / 'out.jsonl'
+    mock_hermes_class.from_config.return_value.transcribe_batch.return_value = iter([{'source': 'a.mp3', 'error': 'boom'}])
+
+    with patch('sys.argv', ['hermes', 'batch', str(list_file), '-o', str(output_file)]):
+        with pytest.raises(SystemExit):
+            main()
+    assert json.loads(output_file.read_text()) == {'source': 'a.mp3', 'error': 'boom'}
+
+def test_enqueue_and_jobs_main(tmp_path, capsys):
+    path = str(tmp_path / 'queue.sqlite3')
+    with patch('sys.argv', ['hermes', 'enqueue', 'a.mp3', 'b.mp3', '--queue', path, '-p', 'openai', '--response_format', 'srt']):
+        main()
+    enqueued = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [job['source'] for job in enqueued] == ['a.mp3', 'b.mp3']
+
+    with patch('sys.argv', ['hermes', 'jobs', '--queue', path, '--status', 'queued']):
+        main()
+    captured = capsys.readouterr()
+    jobs = [json.loads(line) for line in captured.out.splitlines()]
+    assert [job['options'] for job in jobs] == [{'provider': 'openai', 'response_format': 'srt'}] * 2
+    assert json.loads(captured.err)['queued'] == 2
+
+@patch('hermes.cli.run_workers')
+def test_worker_main(mock_run_workers):
+    with patch('sys.argv', ['hermes', 'worker', '--queue', 'q.sqlite3', '--processes', '2', '--threads', '8', '--burst']):
+        main()
+    mock_run_workers.assert_called_once_with('q.sqlite3', processes=2, threads=8, lease_seconds=300, poll_interval=1.0, burst=True)
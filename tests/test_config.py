@@ -1,7 +1,10 @@
 import pytest
 from unittest.mock import patch, mock_open
-from hermes.config import load_config, DEFAULT_CONFIG
+from hermes.config import load_config, get_config, reset_config, require_api_key, merge_config, DEFAULT_CONFIG
+import hermes.config
 import os
+import subprocess
+import sys
 
 @pytest.fixture
 def mock_config_file():
@@ -16,9 +19,15 @@ def mock_config_file():
     return mock_open(read_data=config_content)
 
 def test_load_config_default():
-    with patch('os.path.exists', return_value=False):
+    with patch('os.path.exists', return_value=False), \
+        patch.dict('os.environ', {}, clear=True):
         config = load_config()
-    assert config == DEFAULT_CONFIG
+    assert config == merge_config(DEFAULT_CONFIG, {
+        'cache': {'directory': os.path.expanduser('~/.hermes/cache')},
+        'media_cache': {'directory': os.path.expanduser('~/.hermes/media')},
+        'worker': {'queue': os.path.expanduser('~/.hermes/queue.sqlite3')},
+    })
+    assert DEFAULT_CONFIG['cache']['directory'] == '~/.hermes/cache'
 
 def test_load_config_custom(mock_config_file):
     with patch('os.path.exists', return_value=True), \
@@ -32,6 +41,52 @@ def test_load_config_env_vars():
     with patch('os.path.exists', return_value=False), \
         patch.dict('os.environ', {'GROQ_API_KEY': 'test_key'}, clear=True):
         config = load_config()
-    assert config['llm']['api_key'] == os.environ['GROQ_API_KEY']
+        assert config['llm']['api_key'] == os.environ['GROQ_API_KEY']
+
+def test_load_config_custom_merges_nested_sections(mock_config_file):
+    with patch('os.path.exists', return_value=True), \
+         patch('builtins.open', mock_config_file):
+        config = load_config()
+    assert config['transcription']['model'] == DEFAULT_CONFIG['transcription']['model']
+    assert config['cache']['backend'] == 'file'
+
+def test_load_config_overrides():
+    with patch('os.path.exists', return_value=False):
+        config = load_config({'transcription': {'model': 'whisper-large-v3'}, 'vad': {'enabled': True}})
+    assert config['transcription']['model'] == 'whisper-large-v3'
+    assert config['transcription']['provider'] == 'groq'
+    assert config['vad']['enabled'] is True
+    assert config['vad']['frame_ms'] == 30
+
+def test_load_config_missing_api_key_does_not_raise():
+    with patch('os.path.exists', return_value=False), \
+        patch.dict('os.environ', {}, clear=True):
+        config = load_config()
+    assert config['llm']['api_key'] is None
+    with pytest.raises(ValueError, match="GROQ_API_KEY"):
+        require_api_key(config, 'llm')
+
+def test_require_api_key():
+    config = {'llm': {'provider': 'groq', 'api_key': 'key'}}
+    assert require_api_key(config, 'llm') == 'key'
+
+def test_get_config_is_memoized():
+    reset_config()
+    try:
+        with patch('hermes.config.load_config', return_value={'transcription': {'model': 'a'}}) as mock_load:
+            assert get_config() is get_config()
+            overridden = get_config({'transcription': {'model': 'b'}})
+        mock_load.assert_called_once()
+        assert overridden['transcription']['model'] == 'b'
+        assert get_config()['transcription']['model'] == 'a'
+        assert hermes.config.CONFIG['transcription']['model'] == 'a'
+    finally:
+        reset_config()
 
-# Add more tests as needed
\ No newline at end of file
+def test_import_without_api_keys():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {key: value for key, value in os.environ.items() if not key.endswith('_API_KEY')}
+    env['PYTHONPATH'] = root
+    code = "import hermes, hermes.core, hermes.cli; from hermes.config import CONFIG; CONFIG['transcription']"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, cwd=root)
+    assert result.returncode == 0, result.stderr
\ No newline at end of file
@@ -1,9 +1,15 @@
 import os, sys
 # Append the parent directory to the sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import json
+import asyncio
 import pytest
-from unittest.mock import Mock, patch, ANY
-from hermes.core import Hermes, transcribe
+from unittest.mock import Mock, AsyncMock, patch, ANY
+from hermes.core import Hermes, transcribe, clear_instances, build_config, config_key
+import numpy
+from hermes.utils.audio import OffsetMap, pcm_to_wav
+from hermes.config import get_config
+from hermes.utils.transcript import Segment, Transcript
 
 @pytest.fixture
 def mock_hermes():
@@ -19,6 +25,30 @@ def test_hermes_initialization(mock_hermes):
     assert mock_hermes.cache is not None
     assert mock_hermes.llm_processor is not None
 
+def test_hermes_strategies_use_instance_config():
+    config = get_config({'source_type': 'web', 'transcription': {'provider': 'local'}, 'local': {'cpu_threads': 2}})
+    with patch('hermes.core.Cache'):
+        hermes = Hermes(config)
+    assert hermes.source_strategy.config is config
+    assert hermes.provider_strategy.config is config
+    assert hermes.provider_strategy.options['cpu_threads'] == 2
+
+def test_hermes_uses_configured_transcription_api_key():
+    config = get_config({'transcription': {'provider': 'groq', 'api_key': 'explicit'}})
+    with patch.dict('os.environ', {}, clear=True), patch('hermes.core.Cache'):
+        hermes = Hermes(config)
+        assert hermes.provider_strategy._api_key() == 'explicit'
+
+def test_hermes_creates_llm_processor_on_first_use():
+    with patch('hermes.core.SourceStrategy'), \
+         patch('hermes.core.ProviderStrategy'), \
+         patch('hermes.core.Cache'), \
+         patch('hermes.core.LLMProcessor') as mock_llm_processor:
+        hermes = Hermes()
+        mock_llm_processor.assert_not_called()
+        assert hermes.llm_processor is hermes.llm_processor
+    mock_llm_processor.assert_called_once_with(hermes.config)
+
 def test_hermes_transcribe(mock_hermes):
     mock_hermes.cache.get.return_value = None
     mock_hermes.source_strategy.get_audio.return_value = b'audio_data'
@@ -31,7 +61,8 @@ def test_hermes_transcribe(mock_hermes):
     mock_hermes.source_strategy.get_audio.assert_called_once_with('test_source')
     mock_hermes.provider_strategy.transcribe.assert_called_once_with(
         b'audio_data',
-        params={'provider': ANY, 'model': ANY}
+        params={'provider': ANY, 'model': ANY, 'api_key': ANY, 'response_format': 'verbose_json'},
+        duration=ANY,
     )
     mock_hermes.cache.set.assert_called_once()
 
@@ -44,6 +75,81 @@ def test_hermes_transcribe_cached(mock_hermes):
     mock_hermes.source_strategy.get_audio.assert_not_called()
     mock_hermes.provider_strategy.transcribe.assert_not_called()
 
+def test_hermes_transcribe_content_addressed(mock_hermes, tmp_path):
+    mock_hermes.config = {**mock_hermes.config, 'cache': {'enabled': True, 'key_mode': 'content'}}
+    media = tmp_path / 'media.wav'
+    media.write_bytes(b'audio')
+    mock_hermes.cache.file_digest.return_value = 'digest'
+    mock_hermes.cache.get.return_value = {'source': 'elsewhere.wav', 'transcription': 'cached'}
+
+    result = mock_hermes.transcribe(str(media))
+
+    assert result == {'source': str(media), 'transcription': 'cached'}
+    assert mock_hermes.cache.get.call_args.args[0].startswith('content_digest_')
+    mock_hermes.source_strategy.get_audio.assert_not_called()
+
+def test_hermes_transcribe_content_addressed_remote(mock_hermes):
+    mock_hermes.config = {**mock_hermes.config, 'cache': {'enabled': True, 'key_mode': 'content'}}
+    mock_hermes.cache.get.return_value = None
+    mock_hermes.source_strategy.get_audio.return_value = b'audio_data'
+    mock_hermes.provider_strategy.transcribe.return_value = 'Transcription result'
+
+    mock_hermes.transcribe('https://example.com/a.mp3')
+
+    # The audio is fetched once, for hashing, and then reused for the upload
+    mock_hermes.source_strategy.get_audio.assert_called_once_with('https://example.com/a.mp3')
+    mock_hermes.provider_strategy.transcribe.assert_called_once()
+
+def test_hermes_transcribe_batch(mock_hermes):
+    mock_hermes.cache.get.side_effect = lambda key: {'source': 'cached.mp3', 'transcription': 'cached'} if 'cached' in key else None
+    mock_hermes.source_strategy.get_audio.side_effect = lambda source: source.encode()
+
+    def fake_transcribe(audio, params, duration=None):
+        if audio == b'bad.mp3':
+            raise RuntimeError('upload failed')
+        return audio.decode().upper()
+    mock_hermes.provider_strategy.transcribe.side_effect = fake_transcribe
+
+    results = list(mock_hermes.transcribe_batch(['a.mp3', 'cached.mp3', 'bad.mp3', 'b.mp3'], max_workers=2))
+
+    # Cache hits come out before anything is fetched
+    assert results[0] == {'source': 'cached.mp3', 'transcription': 'cached'}
+    by_source = {result['source']: result for result in results}
+    assert by_source['a.mp3']['transcription'] == 'A.MP3'
+    assert by_source['b.mp3']['transcription'] == 'B.MP3'
+    assert by_source['bad.mp3'] == {'source': 'bad.mp3', 'error': 'upload failed'}
+    assert mock_hermes.source_strategy.get_audio.call_count == 3
+    assert mock_hermes.cache.set.call_count == 2
+
+@patch('hermes.core.encode_for_upload', return_value=b'encoded')
+def test_hermes_transcribe_encodes_for_provider(mock_encode, mock_hermes):
+    mock_hermes.config = {**mock_hermes.config, 'upload_codecs': {'groq': 'ogg'}, 'transcription': {'provider': 'groq', 'model': 'm'}}
+    mock_hermes.cache.get.return_value = None
+    wav = pcm_to_wav(numpy.zeros(32000, dtype=numpy.int16))
+    mock_hermes.source_strategy.get_audio.return_value = wav
+
+    mock_hermes.transcribe('test_source')
+
+    mock_encode.assert_called_once_with(wav, 'ogg')
+    assert mock_hermes.provider_strategy.transcribe.call_args.args[0] == b'encoded'
+    # The rate limiter is charged the duration of the WAV, not an estimate from the encoded size
+    assert mock_hermes.provider_strategy.transcribe.call_args.kwargs['duration'] == 2.0
+
+@patch('hermes.core.strip_silence')
+def test_hermes_transcribe_vad_remaps_timestamps(mock_strip, mock_hermes):
+    mock_hermes.config = {**mock_hermes.config, 'vad': {'enabled': True, 'min_silence_ms': 500}}
+    mock_hermes.cache.get.return_value = None
+    mock_hermes.source_strategy.get_audio.return_value = b'audio_data'
+    report = {'original_duration': 20.0, 'kept_duration': 5.0, 'removed_seconds': 15.0}
+    mock_strip.return_value = (b'stripped', OffsetMap([(0.0, 0.0, 2.0), (2.0, 12.0, 3.0)]), report)
+    mock_hermes.provider_strategy.transcribe.return_value = "1\n00:00:02,500 --> 00:00:04,000\nLater\n"
+
+    result = mock_hermes.transcribe('test_source', response_format='srt')
+
+    mock_strip.assert_called_once_with(b'audio_data', min_silence_ms=500)
+    assert '00:00:12,500 --> 00:00:14,000' in result['transcription']
+    assert result['vad'] == report
+
 @patch('hermes.core.Hermes')
 def test_transcribe_function(mock_hermes_class):
     mock_hermes_instance = Mock()
@@ -56,13 +162,341 @@ def test_transcribe_function(mock_hermes_class):
     mock_hermes_class.from_config.assert_called_once()
     mock_hermes_instance.transcribe.assert_called_once_with('test_source', force=True, response_format='text')
 
+def test_from_config_builds_strategies_once():
+    config = {'source_type': 'auto', 'transcription': {'provider': 'groq', 'model': 'm'}, 'cache': {'enabled': False}}
+    with patch('hermes.core.SourceStrategy') as mock_source, \
+         patch('hermes.core.ProviderStrategy') as mock_provider, \
+         patch('hermes.core.Cache'):
+        Hermes.from_config(config)
+    mock_source.get_strategy.assert_called_once_with('auto', config)
+    mock_provider.get_strategy.assert_called_once_with('groq', config)
+
+def test_from_config_reuse():
+    config = {'source_type': 'auto', 'transcription': {'provider': 'groq', 'model': 'm'}, 'cache': {'enabled': False}}
+    clear_instances()
+    try:
+        with patch('hermes.core.SourceStrategy'), \
+             patch('hermes.core.ProviderStrategy') as mock_provider, \
+             patch('hermes.core.Cache'):
+            first = Hermes.from_config(config, reuse=True)
+            assert Hermes.from_config({**config}, reuse=True) is first
+            assert Hermes.from_config(config) is not first
+            other = Hermes.from_config({**config, 'transcription': {'provider': 'groq', 'model': 'other'}}, reuse=True)
+            assert other is not first
+            assert mock_provider.get_strategy.call_count == 3
+    finally:
+        clear_instances()
+
+def test_build_config_is_memoized_until_reload():
+    from hermes.config import reset_config
+    clear_instances()
+    try:
+        config = build_config('groq', 'm')
+        assert build_config('groq', 'm') is config
+        assert build_config('groq', 'other') is not config
+        with patch('hermes.core.config_key', wraps=config_key) as mock_key, \
+             patch('hermes.core.SourceStrategy'), patch('hermes.core.ProviderStrategy'), patch('hermes.core.Cache'):
+            first = Hermes.from_config(build_config('groq', 'm'), reuse=True)
+            assert Hermes.from_config(build_config('groq', 'm'), reuse=True) is first
+            mock_key.assert_not_called()
+        reset_config()
+        assert build_config('groq', 'm') is not config
+    finally:
+        reset_config()
+        clear_instances()
+
+def test_transcribe_function_reuses_instance():
+    clear_instances()
+    try:
+        with patch('hermes.core.SourceStrategy'), \
+             patch('hermes.core.ProviderStrategy') as mock_provider, \
+             patch('hermes.core.Cache') as mock_cache:
+            mock_cache.get_cache.return_value.get.return_value = {'transcription': 'Cached'}
+            transcribe('test_source', provider='groq')
+            transcribe('test_source', provider='groq')
+            transcribe('test_source', provider='openai')
+        assert mock_provider.get_strategy.call_count == 2
+    finally:
+        clear_instances()
+
+@patch('hermes.core.convert_to_wav', side_effect=lambda segment: segment)
+@patch('hermes.core.load_audio_bytes')
+@patch('hermes.core.split_on_silence_boundaries')
+def test_hermes_transcribe_chunked(mock_split, mock_load, mock_convert, mock_hermes):
+    mock_hermes.config = {**mock_hermes.config, 'chunking': {'enabled': True, 'chunk_length': 60, 'max_workers': 2}}
+    mock_hermes.cache.get.return_value = None
+    mock_hermes.source_strategy.get_audio.return_value = b'audio_data'
+    mock_split.return_value = [(0.0, b'first'), (60.0, b'second')]
+    mock_hermes.provider_strategy.transcribe.side_effect = lambda audio, params, duration=None: audio.decode()
+
+    result = mock_hermes.transcribe('test_source')
+
+    assert result['transcription'] == 'first second'
+    assert mock_split.call_args.kwargs['chunk_length'] == 60
+    assert mock_hermes.provider_strategy.transcribe.call_count == 2
+
+@patch('hermes.core.estimate_audio_duration', return_value=30.0)
+def test_hermes_transcribe_stream(mock_duration, mock_hermes):
+    mock_hermes.cache.get.return_value = None
+    mock_hermes.source_strategy.get_audio.return_value = b'audio_data'
+    mock_hermes._split_chunks = Mock(return_value=[(0.0, b'first'), (30.0, b'second')])
+    responses = {
+        b'first': json.dumps({'text': 'one two', 'segments': [
+            {'start': 0.0, 'end': 10.0, 'text': ' one'},
+            {'start': 10.0, 'end': 29.0, 'text': ' two'},
+        ]}),
+        b'second': json.dumps({'text': 'three', 'segments': [{'start': 1.0, 'end': 5.0, 'text': ' three'}]}),
+    }
+    mock_hermes.provider_strategy.transcribe.side_effect = lambda audio, params, duration=None: responses[audio]
+
+    segments = list(mock_hermes.transcribe_stream('test_source', chunk_length=30))
+
+    assert [(s.text, s.start, s.end, s.chunk_id) for s in segments] == [
+        ('one', 0.0, 10.0, 0),
+        ('two', 10.0, 29.0, 0),
+        ('three', 31.0, 35.0, 1),
+    ]
+    assert mock_hermes._split_chunks.call_args.args[1]['chunk_length'] == 30
+    assert mock_hermes.provider_strategy.transcribe.call_args.kwargs['params']['response_format'] == 'verbose_json'
+    cache_key, result = mock_hermes.cache.set.call_args.args
+    assert '_transcript_' in cache_key
+    assert result['transcript']['segments']['start'] == [0.0, 10.0, 31.0]
+    assert result['transcript']['segments']['chunk_id'] == [0, 0, 1]
+
+def test_hermes_transcribe_renders_formats_from_one_transcript(mock_hermes):
+    store = {}
+    mock_hermes.cache.get.side_effect = store.get
+    mock_hermes.cache.set.side_effect = store.__setitem__
+    mock_hermes.source_strategy.get_audio.return_value = b'audio_data'
+    mock_hermes.provider_strategy.transcribe.return_value = json.dumps({
+        'text': ' one two', 'language': 'en', 'duration': 4.0, 'segments': [
+            {'start': 0.0, 'end': 1.5, 'text': ' one', 'avg_logprob': -0.1},
+            {'start': 1.5, 'end': 4.0, 'text': ' two', 'avg_logprob': -0.2},
+        ]})
+
+    assert mock_hermes.transcribe('test_source')['transcription'] == 'one two'
+    srt = mock_hermes.transcribe('test_source', response_format='srt')['transcription']
+    vtt = mock_hermes.transcribe('test_source', response_format='vtt')['transcription']
+    verbose = json.loads(mock_hermes.transcribe('test_source', response_format='verbose_json')['transcription'])
+
+    # Switching formats is a local conversion of the cached transcript
+    mock_hermes.provider_strategy.transcribe.assert_called_once()
+    assert mock_hermes.provider_strategy.transcribe.call_args.kwargs['params']['response_format'] == 'verbose_json'
+    assert len(store) == 1
+    assert '00:00:01,500 --> 00:00:04,000\ntwo' in srt
+    assert vtt.startswith('WEBVTT') and '00:00:01.500 --> 00:00:04.000' in vtt
+    assert verbose['language'] == 'en' and [s['text'] for s in verbose['segments']] == ['one', 'two']
+    assert verbose['segments'][0]['avg_logprob'] == pytest.approx(-0.1, abs=1e-3)
+
+def test_hermes_transcribe_stream_uses_cached_transcript(mock_hermes):
+    from hermes.utils.transcript import Segment, Transcript
+    transcript = Transcript([Segment('hi', 1.0, 2.0, 3, 0.9)])
+    mock_hermes.cache.get.return_value = {'source': 'test_source', 'transcript': transcript.to_dict()}
+
+    segments = list(mock_hermes.transcribe_stream('test_source'))
+
+    assert [(s.text, s.start, s.end, s.chunk_id) for s in segments] == [('hi', 1.0, 2.0, 3)]
+    assert segments[0].confidence == pytest.approx(0.9)
+    mock_hermes.source_strategy.get_audio.assert_not_called()
+
+def test_hermes_transcribe_stream_cached(mock_hermes):
+    mock_hermes.cache.get.return_value = {'transcription': {'text': 'hi', 'segments': [{'start': 1.0, 'end': 2.0, 'text': 'hi', 'chunk_id': 3}]}}
+
+    segments = list(mock_hermes.transcribe_stream('test_source'))
+
+    assert [(s.text, s.start, s.end, s.chunk_id) for s in segments] == [('hi', 1.0, 2.0, 3)]
+    mock_hermes.source_strategy.get_audio.assert_not_called()
+
+def test_hermes_transcribe_live(mock_hermes):
+    import numpy as np
+    from hermes.utils.realtime import SyntheticCapture
+    t = np.arange(16000 * 3) / 16000
+    speech = (np.sin(2 * np.pi * 220 * t) * 8000).astype(np.int16)
+    audio = np.concatenate([np.zeros(16000, dtype=np.int16), speech, np.zeros(16000, dtype=np.int16), speech])
+    mock_hermes.config = {**mock_hermes.config, 'live': {'min_silence_ms': 500, 'padding_ms': 0, 'max_workers': 1}}
+    # Both windows hold the same audio, so responses can only be matched to windows by call order
+    mock_hermes.provider_strategy.transcribe.side_effect = [
+        json.dumps({'text': 'first', 'segments': [{'start': 0.5, 'end': 2.5, 'text': ' first'}]}),
+        json.dumps({'text': 'second', 'segments': [{'start': 0.0, 'end': 3.0, 'text': ' second'}]}),
+    ]
+
+    segments = list(mock_hermes.transcribe_live(SyntheticCapture(audio, sample_rate=16000)))
+
+    assert [(s.text, s.chunk_id) for s in segments] == [('first', 0), ('second', 1)]
+    assert segments[0].start == pytest.approx(1.5, abs=0.05)
+    assert segments[1].start == pytest.approx(5.0, abs=0.05)
+    uploaded = mock_hermes.provider_strategy.transcribe.call_args_list[0].args[0]
+    assert uploaded[:4] == b'RIFF'
+
+@patch('hermes.core.Hermes')
+def test_transcribe_function_chunking(mock_hermes_class):
+    mock_hermes_class.from_config.return_value.transcribe.return_value = {'transcription': 'Test'}
+
+    transcribe('test_source', chunk_length=120)
+
+    config = mock_hermes_class.from_config.call_args.args[0]
+    assert config['chunking']['enabled'] is True
+    assert config['chunking']['chunk_length'] == 120
+
 def test_hermes_process_with_llm(mock_hermes):
+    mock_hermes.cache.get.return_value = None
     mock_hermes.llm_processor.process.return_value = 'Processed result'
     
     result = mock_hermes.process_with_llm('Test transcription', 'Summarize')
     
     assert result == 'Processed result'
     mock_hermes.llm_processor.process.assert_called_once_with('Test transcription', 'Summarize')
+
+def test_hermes_transcribe_and_process_feeds_segments(mock_hermes):
+    from hermes.utils.transcript import Segment
+    mock_hermes.cache.get.return_value = None
+    mock_hermes._stream_transcript = Mock(return_value=iter([Segment('one', 0.0, 1.0), Segment('two', 1.0, 2.0, 1)]))
+    job = mock_hermes.llm_processor.map_reduce.return_value
+    job.result.return_value = 'Summary'
+
+    result = mock_hermes.transcribe_and_process('test_source', 'Summarize', chunk_length=30, response_format='srt')
+
+    assert result['transcription'] == '1\n00:00:00,000 --> 00:00:01,000\none\n\n2\n00:00:01,000 --> 00:00:02,000\ntwo\n'
+    assert result['llm_processed'] == 'Summary'
+    mock_hermes.llm_processor.map_reduce.assert_called_once_with('Summarize')
+    assert [call.args[0] for call in job.feed.call_args_list] == ['one', 'two']
+    assert mock_hermes._stream_transcript.call_args.args[4] == 30
+    # The transcript itself is cached by _stream_transcript; the LLM result is keyed on the plain text
+    (llm_key, llm_cached), = [call.args for call in mock_hermes.cache.set.call_args_list]
+    assert llm_key == mock_hermes._llm_cache_key('one two', 'Summarize', {}) and llm_cached == 'Summary'
+
+def test_hermes_transcribe_and_process_reuses_llm_result_of_same_text(mock_hermes):
+    from hermes.utils.transcript import Segment
+    summary_key = mock_hermes._llm_cache_key('one two', 'Summarize', {})
+    mock_hermes.cache.get.side_effect = lambda key: 'Cached summary' if key == summary_key else None
+    mock_hermes._stream_transcript = Mock(return_value=iter([Segment('one', 0.0, 1.0), Segment('two', 1.0, 2.0, 1)]))
+    job = mock_hermes.llm_processor.map_reduce.return_value
+
+    result = mock_hermes.transcribe_and_process('test_source', 'Summarize')
+
+    assert result['llm_processed'] == 'Cached summary'
+    job.result.assert_not_called()
+    job.close.assert_called_once()
+
+def test_hermes_transcribe_and_process_cached(mock_hermes):
+    transcript = Transcript([Segment('Cached', 0.0, 1.0)]).to_dict()
+    mock_hermes.cache.get.side_effect = lambda key: None if key.startswith('llm_') else {'transcript': transcript}
+    mock_hermes._stream_transcript = Mock()
+    mock_hermes.llm_processor.process.return_value = 'Summary'
+
+    result = mock_hermes.transcribe_and_process('test_source', 'Summarize', response_format='srt')
+
+    assert result == {'transcription': '1\n00:00:00,000 --> 00:00:01,000\nCached\n', 'llm_processed': 'Summary'}
+    mock_hermes._stream_transcript.assert_not_called()
+    # The LLM gets the same plain text as on the streamed path
+    mock_hermes.llm_processor.process.assert_called_once_with('Cached', 'Summarize')
+
+def test_hermes_process_with_llm_cache(tmp_path):
+    config = {
+        'source_type': 'auto',
+        'transcription': {'provider': 'groq', 'model': 'm'},
+        'llm': {'provider': 'groq', 'model': 'llama', 'api_key': 'k', 'chunk_tokens': 6000},
+        'cache': {'enabled': True, 'directory': str(tmp_path), 'backend': 'sqlite'},
+    }
+    with patch('hermes.core.SourceStrategy'), \
+         patch('hermes.core.ProviderStrategy'), \
+         patch('hermes.core.LLMProcessor') as mock_llm_processor:
+        hermes = Hermes(config)
+        mock_llm_processor.return_value.process.side_effect = lambda text, prompt, **kwargs: f'{prompt}: {text}'
+
+        assert hermes.process_with_llm('text', 'Summarize') == 'Summarize: text'
+        assert hermes.process_with_llm('text', 'Summarize') == 'Summarize: text'
+        hermes.process_with_llm('text', 'Translate')
+        hermes.process_with_llm('text', 'Summarize', temperature=0.2)
+        hermes.process_with_llm('text', 'Summarize', force=True)
+
+        assert mock_llm_processor.return_value.process.call_count == 4
+        assert hermes.cache_stats() == {'llm': {'hits': 1, 'misses': 4}}
+
+        # Another model is another cache entry
+        other = Hermes({**config, 'llm': {**config['llm'], 'model': 'other'}})
+        other.process_with_llm('text', 'Summarize')
+        assert other.cache_stats()['llm'] == {'hits': 0, 'misses': 1}
+
+def test_hermes_process_many_with_llm_uses_cache(tmp_path):
+    config = {
+        'source_type': 'auto',
+        'transcription': {'provider': 'groq', 'model': 'm'},
+        'llm': {'provider': 'groq', 'model': 'llama', 'api_key': 'k'},
+        'cache': {'enabled': True, 'directory': str(tmp_path), 'backend': 'sqlite'},
+    }
+    with patch('hermes.core.SourceStrategy'), \
+         patch('hermes.core.ProviderStrategy'), \
+         patch('hermes.core.LLMProcessor') as mock_llm_processor:
+        hermes = Hermes(config)
+        processor = mock_llm_processor.return_value
+        processor.process.side_effect = lambda text, prompt, **kwargs: text.upper()
+        processor.process_batch.side_effect = lambda texts, prompt, **kwargs: [text.upper() for text in texts]
+
+        assert hermes.process_with_llm('b', 'Up') == 'B'
+        assert hermes.process_many_with_llm(['a', 'b', 'c'], 'Up', batch=True) == ['A', 'B', 'C']
+        processor.process_batch.assert_called_once_with(['a', 'c'], 'Up')
+
+        assert hermes.process_many_with_llm(['a', 'c'], 'Up', batch=True) == ['A', 'C']
+        processor.process_batch.assert_called_once()
+
+        # Results of packed calls aren't reused for texts processed on their own
+        processor.process_many.side_effect = lambda texts, prompt, **kwargs: [text.upper() for text in texts]
+        assert hermes.process_many_with_llm(['a', 'b'], 'Up') == ['A', 'B']
+        assert processor.process_many.call_args.args == (['a'], 'Up')
+        assert hermes.cache_stats()['llm'] == {'hits': 4, 'misses': 4}
+
+        processor.aprocess = AsyncMock(return_value='E')
+        assert asyncio.run(hermes.aprocess_with_llm('e', 'Up')) == 'E'
+        assert asyncio.run(hermes.aprocess_with_llm('e', 'Up')) == 'E'
+        processor.aprocess.assert_awaited_once()
+
+def test_hermes_cache_stats_reports_memory_tier(tmp_path):
+    config = {
+        'source_type': 'auto',
+        'transcription': {'provider': 'groq', 'model': 'm'},
+        'llm': {'provider': 'groq', 'model': 'llama', 'api_key': 'k'},
+        'cache': {'enabled': True, 'directory': str(tmp_path), 'memory': {'enabled': True}},
+    }
+    with patch('hermes.core.SourceStrategy'), patch('hermes.core.ProviderStrategy'):
+        stats = Hermes(config).cache_stats()
+    assert stats['llm'] == {'hits': 0, 'misses': 0}
+    assert stats['memory']['entries'] == 0
+
+@patch('hermes.core.Hermes')
+def test_transcribe_function_with_llm_prompt_chunked(mock_hermes_class):
+    instance = mock_hermes_class.from_config.return_value
+    instance.transcribe_and_process.return_value = {'transcription': 'Test', 'llm_processed': 'Summary'}
+
+    result = transcribe('test_source', llm_prompt='Summarize', chunk_length=60)
+
+    assert result['llm_processed'] == 'Summary'
+    instance.transcribe.assert_not_called()
+    assert instance.transcribe_and_process.call_args.args == ('test_source', 'Summarize')
+    assert instance.transcribe_and_process.call_args.kwargs['chunk_length'] == 60
+
+def test_transcribe_function_with_llm_prompt_not_chunked():
+    clear_instances()
+    try:
+        with patch('hermes.core.SourceStrategy') as mock_source, \
+             patch('hermes.core.ProviderStrategy') as mock_provider, \
+             patch('hermes.core.Cache') as mock_cache, \
+             patch('hermes.core.LLMProcessor') as mock_llm_processor:
+            mock_cache.get_cache.return_value.get.return_value = None
+            mock_source.get_strategy.return_value.get_audio.return_value = b'audio_data'
+            provider = mock_provider.get_strategy.return_value
+            provider.transcribe.return_value = json.dumps({'text': 'Hello world.', 'segments': [{'text': 'Hello world.', 'start': 0.0, 'end': 40.0}]})
+            mock_llm_processor.return_value.process.return_value = 'Summary'
+
+            result = transcribe('test_source', provider='groq', llm_prompt='Summarize')
+
+        # The whole audio goes to the provider in one request
+        provider.transcribe.assert_called_once()
+        assert result['transcription'] == 'Hello world.'
+        assert result['llm_processed'] == 'Summary'
+        mock_llm_processor.return_value.map_reduce.assert_not_called()
+    finally:
+        clear_instances()
     
 if __name__ == "__main__":
     pytest.main()
\ No newline at end of file
@@ -0,0 +1,162 @@
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+import pytest
+import requests
+from hermes.utils.download import split_ranges, probe, fetch_validator, iter_download, download_and_decode
+
+CONTENT = os.urandom(256 * 1024 + 123)
+
+class MediaHandler(BaseHTTPRequestHandler):
+    ranges = True
+    requests = []
+    validators = {}
+
+    def log_message(self, *args):
+        pass
+
+    def _headers(self, status, length, extra=None):
+        self.send_response(status)
+        self.send_header('Content-Length', str(length))
+        if self.ranges:
+            self.send_header('Accept-Ranges', 'bytes')
+        for name, value in (extra or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    def do_HEAD(self):
+        self.requests.append(('HEAD', None))
+        if self.path != '/media':
+            self._headers(404, 0)
+            return
+        self._headers(200, len(CONTENT), self.validators)
+
+    def do_GET(self):
+        byte_range = self.headers.get('Range')
+        self.requests.append(('GET', byte_range))
+        if self.path != '/media':
+            self._headers(404, 0)
+            return
+        match = re.match(r'bytes=(\d+)-(\d+)', byte_range or '')
+        if self.ranges and match:
+            first, last = int(match.group(1)), int(match.group(2))
+            body = CONTENT[first:last + 1]
+            self._headers(206, len(body), {'Content-Range': f'bytes {first}-{last}/{len(CONTENT)}'})
+        else:
+            body = CONTENT
+            self._headers(200, len(body))
+        self.wfile.write(body)
+
+@pytest.fixture
+def server():
+    handler = type('Handler', (MediaHandler,), {'ranges': True, 'requests': [], 'validators': {}})
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd, handler, f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+    httpd.server_close()
+
+def test_split_ranges():
+    assert split_ranges(10, 3) == [(0, 3), (4, 7), (8, 9)]
+    assert split_ranges(2, 8) == [(0, 0), (1, 1)]
+    ranges = split_ranges(len(CONTENT), 4)
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(CONTENT) - 1
+    assert all(a[1] + 1 == b[0] for a, b in zip(ranges, ranges[1:]))
+
+def test_probe(server):
+    _, handler, base = server
+    assert probe(f'{base}/media') == (len(CONTENT), True)
+    assert probe(f'{base}/missing') == (None, False)
+    handler.ranges = False
+    assert probe(f'{base}/media') == (len(CONTENT), False)
+
+def test_fetch_validator(server):
+    _, handler, base = server
+    assert fetch_validator(f'{base}/media') is None
+    handler.validators = {'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+    assert fetch_validator(f'{base}/media') == 'last-modified:Wed, 21 Oct 2015 07:28:00 GMT'
+    handler.validators = {'ETag': '"abc"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+    assert fetch_validator(f'{base}/media') == 'etag:"abc"'
+    assert fetch_validator(f'{base}/missing') is None
+
+def test_iter_download_streams_chunks(server):
+    _, _, base = server
+    chunks = list(iter_download(f'{base}/media', chunk_size=64 * 1024))
+    assert len(chunks) > 1
+    assert b''.join(chunks) == CONTENT
+
+def test_iter_download_raises_on_http_error(server):
+    _, _, base = server
+    with pytest.raises(requests.HTTPError):
+        list(iter_download(f'{base}/missing'))
+
+def test_download_and_decode_overlaps_with_download(server):
+    _, _, base = server
+    received = []
+
+    def fake_decode(chunks, sample_rate):
+        # Chunks reach the decoder one by one, before the download has finished
+        for chunk in chunks:
+            received.append(chunk)
+        return b'RIFF' + str(sample_rate).encode()
+
+    with patch('hermes.utils.download.decode_stream_to_wav', side_effect=fake_decode), \
+         patch('hermes.utils.download.decode_to_wav') as mock_decode:
+        assert download_and_decode(f'{base}/media', 8000, chunk_size=16 * 1024) == b'RIFF8000'
+    assert len(received) > 1
+    assert b''.join(received) == CONTENT
+    mock_decode.assert_not_called()
+
+def test_download_and_decode_falls_back_to_file(server):
+    _, _, base = server
+
+    def failing_decode(chunks, sample_rate):
+        for _ in chunks:
+            pass
+        raise RuntimeError("moov atom not found")
+
+    def decode_file(path, sample_rate):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    with patch('hermes.utils.download.decode_stream_to_wav', side_effect=failing_decode), \
+         patch('hermes.utils.download.decode_to_wav', side_effect=decode_file):
+        assert download_and_decode(f'{base}/media') == CONTENT
+
+def test_download_and_decode_parallel(server):
+    _, handler, base = server
+
+    def decode_file(path, sample_rate):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    with patch('hermes.utils.download.decode_stream_to_wav') as mock_stream, \
+         patch('hermes.utils.download.decode_to_wav', side_effect=decode_file):
+        assert download_and_decode(f'{base}/media', segments=3, min_parallel_size=0) == CONTENT
+    mock_stream.assert_not_called()
+    assert len([r for method, r in handler.requests if method == 'GET']) == 3
+
+def test_download_and_decode_without_range_support_streams(server):
+    _, handler, base = server
+    handler.ranges = False
+
+    with patch('hermes.utils.download.decode_stream_to_wav', side_effect=lambda chunks, sample_rate: b''.join(chunks)), \
+         patch('hermes.utils.download.decode_to_wav') as mock_decode:
+        assert download_and_decode(f'{base}/media', segments=4, min_parallel_size=0) == CONTENT
+    mock_decode.assert_not_called()
+    assert handler.requests == [('HEAD', None), ('GET', None)]
+
+def test_download_and_decode_raises_download_errors(server):
+    _, _, base = server
+
+    def consume(chunks, sample_rate):
+        return b''.join(chunks)
+
+    with patch('hermes.utils.download.decode_stream_to_wav', side_effect=consume), \
+         patch('hermes.utils.download.decode_to_wav') as mock_decode:
+        with pytest.raises(requests.HTTPError):
+            download_and_decode(f'{base}/missing')
+    mock_decode.assert_not_called()
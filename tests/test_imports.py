@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ["litellm", "yt_dlp", "sounddevice", "pyperclip", "ffmpeg", "pydub", "numpy", "requests", "httpx"]
+
+def loaded_after_import(statement):
+    env = {**os.environ, "PYTHONPATH": ROOT, "GROQ_API_KEY": "test", "OPENAI_API_KEY": "test"}
+    code = f"import sys\n{statement}\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, cwd=ROOT, check=True)
+    return [name for name in result.stdout.strip().split(",") if name]
+
+@pytest.mark.parametrize("statement", [
+    "import hermes",
+    "import hermes.core",
+    "import hermes.cli",
+    "from hermes import Hermes, transcribe",
+    "from hermes.strategies.provider import ProviderStrategy",
+])
+def test_import_does_not_load_heavy_modules(statement):
+    assert loaded_after_import(statement) == []
+
+@pytest.mark.parametrize("module", ["hermes", "hermes.cli"])
+def test_import_time_within_budget(module):
+    env = {**os.environ, "GROQ_API_KEY": "test", "OPENAI_API_KEY": "test"}
+    script = os.path.join(ROOT, "benchmarks", "bench_import_time.py")
+    result = subprocess.run([sys.executable, script, "--module", module], capture_output=True, text=True, env=env, cwd=ROOT)
+    assert result.returncode == 0, result.stdout + result.stderr
+
+def test_patching_lazy_module_does_not_import_it():
+    statement = "from unittest import mock\nimport hermes.utils.realtime\nwith mock.patch('hermes.utils.realtime.sd'): pass"
+    assert loaded_after_import(statement) == []
+
+def test_lazy_module_dunders_do_not_import():
+    from hermes.utils.lazy import LazyModule
+    module = LazyModule('json')
+    assert not hasattr(module, '__code__')
+    assert module._module is None
+    assert module.dumps([]) == '[]'
+
+def test_lazy_exports_resolve():
+    import hermes
+    from hermes.core import Hermes
+    assert hermes.Hermes is Hermes
+    with pytest.raises(AttributeError):
+        hermes.does_not_exist
+
+def test_provider_strategies_are_exported_lazily():
+    from hermes.strategies import provider
+    from hermes.strategies.provider.groq import GroqProviderStrategy
+    assert provider.GroqProviderStrategy is GroqProviderStrategy
@@ -0,0 +1,171 @@
+import time
+import sqlite3
+import threading
+from unittest.mock import patch
+import pytest
+from hermes.utils.jobs import JobQueue, InvalidJobError
+from hermes.worker import Worker, run_worker, run_job
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(str(tmp_path / 'queue.sqlite3'), max_attempts=2)
+
+def test_enqueue_deduplicates_active_jobs(queue):
+    first = queue.enqueue('a.mp3', {'response_format': 'srt'})
+    assert queue.enqueue('a.mp3', {'response_format': 'srt'}) == first
+    assert queue.enqueue('a.mp3', {'response_format': 'vtt'}) != first
+
+    job = queue.claim('worker')
+    assert queue.enqueue('a.mp3', {'response_format': 'srt'}) == first
+    queue.complete(job['id'], 'worker', {'transcription': 'done'})
+    # Once done, the same job may be queued again (the worker then hits the cache)
+    assert queue.enqueue('a.mp3', {'response_format': 'srt'}) != first
+
+def test_claim_and_complete(queue):
+    job_id = queue.enqueue('a.mp3', {'model': 'm'})
+
+    job = queue.claim('worker')
+    assert (job['id'], job['source'], job['options'], job['status'], job['attempts']) == (job_id, 'a.mp3', {'model': 'm'}, 'running', 1)
+    assert queue.claim('other') is None
+
+    assert queue.complete(job_id, 'worker', {'transcription': 'hello'})
+    assert queue.get(job_id)['result'] == {'transcription': 'hello'}
+    assert queue.stats() == {'queued': 0, 'running': 0, 'done': 1, 'failed': 0}
+
+def test_fail_retries_then_gives_up(queue):
+    job_id = queue.enqueue('a.mp3')
+
+    job = queue.claim('worker')
+    assert queue.fail(job_id, 'worker', 'boom', retry_delay=60)
+    assert queue.get(job_id)['status'] == 'queued'
+    # Not claimable before the retry delay has passed
+    assert queue.claim('worker') is None
+
+    with patch('hermes.utils.jobs.time.time', return_value=time.time() + 61):
+        job = queue.claim('worker')
+    assert job['attempts'] == 2
+    queue.fail(job_id, 'worker', 'boom again')
+    job = queue.get(job_id)
+    assert (job['status'], job['error']) == ('failed', 'boom again')
+
+def test_expired_lease_is_reclaimed(queue):
+    job_id = queue.enqueue('a.mp3')
+    assert queue.claim('crashed', lease_seconds=-1)['id'] == job_id
+
+    job = queue.claim('survivor')
+    assert (job['id'], job['lease_owner'], job['attempts']) == (job_id, 'survivor', 2)
+    # The crashed worker no longer owns the job
+    assert not queue.complete(job_id, 'crashed', {'transcription': 'stale'})
+    assert not queue.renew(job_id, 'crashed')
+    assert queue.complete(job_id, 'survivor', {'transcription': 'fresh'})
+
+def test_expired_lease_without_attempts_left_fails(queue):
+    job_id = queue.enqueue('a.mp3', max_attempts=1)
+    queue.claim('crashed', lease_seconds=-1)
+
+    assert queue.claim('survivor') is None
+    assert queue.get(job_id)['status'] == 'failed'
+
+def test_concurrent_claims_take_each_job_once(queue):
+    for index in range(20):
+        queue.enqueue(f'{index}.mp3')
+    claimed = []
+
+    def claim_all(owner):
+        while True:
+            job = queue.claim(owner)
+            if job is None:
+                return
+            claimed.append(job['id'])
+
+    threads = [threading.Thread(target=claim_all, args=(f'w{index}',)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(claimed) == list(range(1, 21))
+
+def test_worker_processes_jobs_and_retries(queue):
+    calls = []
+
+    def process(job):
+        calls.append(job['source'])
+        if job['source'] == 'flaky.mp3' and job['attempts'] == 1:
+            raise RuntimeError('upload failed')
+        if job['source'] == 'bad.mp3':
+            raise RuntimeError('unsupported media')
+        return {'transcription': job['source'].upper()}
+
+    ids = {source: queue.enqueue(source) for source in ['a.mp3', 'flaky.mp3', 'bad.mp3']}
+    worker = Worker(queue, threads=2, retry={'base_delay': 0, 'max_delay': 0}, process=process)
+
+    assert worker.run(burst=True) == 5
+    assert queue.get(ids['a.mp3'])['result'] == {'transcription': 'A.MP3'}
+    assert queue.get(ids['flaky.mp3'])['result'] == {'transcription': 'FLAKY.MP3'}
+    bad = queue.get(ids['bad.mp3'])
+    assert (bad['status'], bad['attempts'], bad['error']) == ('failed', 2, 'RuntimeError: unsupported media')
+    assert sorted(calls) == ['a.mp3', 'bad.mp3', 'bad.mp3', 'flaky.mp3', 'flaky.mp3']
+
+def test_worker_fails_non_retryable_errors_at_once(queue):
+    def process(job):
+        raise FileNotFoundError(job['source'])
+
+    job_id = queue.enqueue('missing.mp3')
+    assert Worker(queue, threads=1, retry={'base_delay': 0, 'max_delay': 0}, process=process).run(burst=True) == 1
+    job = queue.get(job_id)
+    assert (job['status'], job['attempts']) == ('failed', 1)
+
+def test_worker_retries_value_errors(queue):
+    def process(job):
+        raise ValueError('Expecting value: line 1 column 1 (char 0)')
+
+    job_id = queue.enqueue('a.mp3')
+    assert Worker(queue, threads=1, retry={'base_delay': 0, 'max_delay': 0}, process=process).run(burst=True) == 2
+    job = queue.get(job_id)
+    assert (job['status'], job['attempts']) == ('failed', 2)
+
+@patch('hermes.worker.transcribe')
+def test_run_job_rejects_invalid_options(mock_transcribe):
+    with pytest.raises(InvalidJobError):
+        run_job({'source': 'a.mp3', 'options': {'provider': 'no-such-provider'}})
+    with pytest.raises(InvalidJobError):
+        run_job({'source': 'a.mp3', 'options': ['srt']})
+    mock_transcribe.assert_not_called()
+
+def test_worker_survives_queue_errors(queue):
+    job_id = queue.enqueue('a.mp3')
+    claim = queue.claim
+    errors = [sqlite3.OperationalError('database is locked')] * 2
+
+    def flaky_claim(owner, lease_seconds=300):
+        if errors:
+            raise errors.pop()
+        return claim(owner, lease_seconds)
+
+    worker = Worker(queue, threads=1, poll_interval=0.01, process=lambda job: {'transcription': 'ok'})
+    with patch.object(queue, 'claim', side_effect=flaky_claim):
+        assert worker.run(burst=True) == 1
+    assert queue.get(job_id)['status'] == 'done'
+
+def test_worker_renews_leases_of_slow_jobs(queue):
+    job_id = queue.enqueue('slow.mp3')
+
+    def process(job):
+        time.sleep(0.5)
+        # A worker polling meanwhile can't take over the job
+        assert queue.claim('other', lease_seconds=0.3) is None
+        return {'transcription': 'slow'}
+
+    Worker(queue, threads=1, lease_seconds=0.3, process=process).run(burst=True)
+    assert queue.get(job_id)['status'] == 'done'
+
+@patch('hermes.worker.transcribe')
+def test_run_worker_transcribes_with_job_options(mock_transcribe, tmp_path):
+    path = str(tmp_path / 'queue.sqlite3')
+    JobQueue(path).enqueue('a.mp3', {'provider': 'groq', 'response_format': 'srt'})
+    mock_transcribe.return_value = {'source': 'a.mp3', 'transcription': 'SRT'}
+
+    assert run_worker(path, threads=2, burst=True, stop=threading.Event()) == 1
+
+    mock_transcribe.assert_called_once_with('a.mp3', provider='groq', response_format='srt')
+    assert JobQueue(path).list('done')[0]['result'] == {'source': 'a.mp3', 'transcription': 'SRT'}
@@ -1,6 +1,9 @@
+import json
+import asyncio
+import threading
 import pytest
-from unittest.mock import patch, Mock
-from hermes.utils.llm import LLMProcessor
+from unittest.mock import patch, Mock, AsyncMock
+from hermes.utils.llm import LLMProcessor, split_text, chunk_text, estimate_tokens, MAP_INSTRUCTIONS, REDUCE_INSTRUCTIONS, BATCH_INSTRUCTIONS
 
 @pytest.fixture
 def mock_config():
@@ -19,7 +22,7 @@ def test_llm_processor_initialization(mock_config):
 
 def test_llm_processor_missing_api_key():
     with patch('hermes.utils.llm.CONFIG', {'llm': {'provider': 'openai', 'model': 'gpt-3.5-turbo', 'api_key': None}}):
-        with pytest.raises(ValueError, match="API key for openai is required"):
+        with pytest.raises(ValueError, match="No API key found for openai"):
             LLMProcessor()
 
 @patch('hermes.utils.llm.completion')
@@ -40,4 +43,175 @@ def test_llm_processor_process(mock_completion, mock_config):
             {"role": "user", "content": "Test prompt\n\nText: Test input"}
         ],
         api_key='test_api_key'
-    )
\ No newline at end of file
+    )
+def response(content):
+    return Mock(choices=[Mock(message=Mock(content=content))])
+
+def user_message(call):
+    return call.kwargs['messages'][1]['content']
+
+def test_split_text_prefers_sentence_ends():
+    text = "First sentence here. Second sentence is here. Third one."
+    pieces = split_text(text, 6)
+    assert all(estimate_tokens(piece) <= 6 for piece in pieces)
+    assert pieces[0] == "First sentence here."
+    assert ' '.join(pieces) == text
+    assert split_text("x" * 10, 1) == ["xxxx", "xxxx", "xx"]
+    assert split_text("  ", 5) == []
+
+@patch('hermes.utils.llm.completion')
+def test_llm_processor_map_reduces_long_text(mock_completion, mock_config):
+    mock_completion.side_effect = lambda **kwargs: response('partial' if MAP_INSTRUCTIONS in kwargs['messages'][1]['content'] else 'final')
+    mock_config['llm'].update({'chunk_tokens': 10, 'max_workers': 2})
+    text = ' '.join(f"Sentence number {i}." for i in range(8))
+
+    result = LLMProcessor(mock_config).process(text, 'Summarize')
+
+    assert result == 'final'
+    messages = [user_message(call) for call in mock_completion.call_args_list]
+    maps = [m for m in messages if MAP_INSTRUCTIONS in m]
+    reduces = [m for m in messages if REDUCE_INSTRUCTIONS in m]
+    assert len(maps) > 1
+    assert all(m.startswith('Summarize') for m in messages)
+    assert len(reduces) == 1 and 'Part 1:\npartial' in reduces[0]
+
+@patch('hermes.utils.llm.completion')
+def test_llm_processor_reduces_in_rounds(mock_completion, mock_config):
+    def fake(**kwargs):
+        content = kwargs['messages'][1]['content']
+        return response('p' * 30 if MAP_INSTRUCTIONS in content else 'r')
+    mock_completion.side_effect = fake
+    mock_config['llm'].update({'chunk_tokens': 10, 'max_workers': 2})
+    processor = LLMProcessor(mock_config)
+
+    result = processor.process_stream(['a' * 40, 'b' * 40, 'c' * 40, 'd' * 40], 'Summarize')
+
+    assert result == 'r'
+    messages = [user_message(call) for call in mock_completion.call_args_list]
+    assert len([m for m in messages if MAP_INSTRUCTIONS in m]) == 4
+    # Four 30-character partials don't fit in 40 characters: two rounds of reduction
+    assert len([m for m in messages if REDUCE_INSTRUCTIONS in m]) == 3
+
+@patch('hermes.utils.llm.completion')
+def test_llm_processor_stream_single_chunk_is_one_call(mock_completion, mock_config):
+    mock_completion.return_value = response('Processed result')
+    assert LLMProcessor(mock_config).process_stream(['Test', 'input'], 'Test prompt') == 'Processed result'
+    mock_completion.assert_called_once()
+    assert user_message(mock_completion.call_args) == "Test prompt\n\nText: Test input"
+
+@patch('hermes.utils.llm.completion')
+def test_llm_processor_stream_starts_before_input_ends(mock_completion, mock_config):
+    started = threading.Event()
+
+    def fake(**kwargs):
+        started.set()
+        return response('partial')
+
+    mock_completion.side_effect = fake
+    mock_config['llm'].update({'chunk_tokens': 10})
+    observed = []
+
+    def texts():
+        yield 'a' * 40
+        yield 'b' * 40
+        yield 'c' * 40
+        # Two chunks are complete: the LLM is working on them while more text is produced
+        observed.append(started.wait(5))
+        yield 'd' * 40
+
+    LLMProcessor(mock_config).process_stream(texts(), 'Summarize')
+    assert observed == [True]
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+def test_chunk_text_packs_pieces():
+    chunks = chunk_text(' '.join(f"Sentence {i}." for i in range(20)), 10)
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 10 for chunk in chunks)
+
+@patch('hermes.utils.llm.acompletion', new_callable=AsyncMock)
+def test_llm_processor_aprocess(mock_acompletion, mock_config):
+    mock_acompletion.return_value = response('Processed result')
+    result = asyncio.run(LLMProcessor(mock_config).aprocess('Test input', 'Test prompt'))
+    assert result == 'Processed result'
+    assert user_message(mock_acompletion.call_args) == "Test prompt\n\nText: Test input"
+
+@patch('hermes.utils.llm.acompletion', new_callable=AsyncMock)
+def test_llm_processor_aprocess_map_reduces_long_text(mock_acompletion, mock_config):
+    mock_acompletion.side_effect = lambda **kwargs: response('partial' if MAP_INSTRUCTIONS in kwargs['messages'][1]['content'] else 'final')
+    mock_config['llm'].update({'chunk_tokens': 10})
+    text = ' '.join(f"Sentence number {i}." for i in range(8))
+    assert asyncio.run(LLMProcessor(mock_config).aprocess(text, 'Summarize')) == 'final'
+    messages = [user_message(call) for call in mock_acompletion.call_args_list]
+    assert len([m for m in messages if MAP_INSTRUCTIONS in m]) == len(chunk_text(text, 10))
+    assert len([m for m in messages if REDUCE_INSTRUCTIONS in m]) == 1
+
+def test_llm_processor_aprocess_many_bounds_concurrency(mock_config):
+    active = []
+    peak = []
+
+    async def fake(**kwargs):
+        active.append(1)
+        peak.append(len(active))
+        await asyncio.sleep(0.01)
+        active.pop()
+        return response(kwargs['messages'][1]['content'].split('Text: ')[1].upper())
+
+    with patch('hermes.utils.llm.acompletion', side_effect=fake):
+        results = asyncio.run(LLMProcessor(mock_config).aprocess_many([f't{i}' for i in range(10)], 'Up', max_concurrency=3))
+    assert results == [f'T{i}' for i in range(10)]
+    assert max(peak) == 3
+
+@patch('hermes.utils.llm.completion')
+def test_llm_processor_process_many_keeps_order(mock_completion, mock_config):
+    mock_completion.side_effect = lambda **kwargs: response(kwargs['messages'][1]['content'].split('Text: ')[1] + '!')
+    assert LLMProcessor(mock_config).process_many(['a', 'b', 'c'], 'Shout', max_concurrency=2) == ['a!', 'b!', 'c!']
+
+@patch('hermes.utils.llm.completion')
+def test_llm_processor_process_batch_single_call(mock_completion, mock_config):
+    mock_completion.return_value = response('```json\n{"1": "A", "2": "B", "3": "C"}\n```')
+    assert LLMProcessor(mock_config).process_batch(['a', 'b', 'c'], 'Summarize') == ['A', 'B', 'C']
+    mock_completion.assert_called_once()
+    kwargs = mock_completion.call_args.kwargs
+    assert kwargs['response_format'] == {'type': 'json_object'}
+    message = user_message(mock_completion.call_args)
+    assert BATCH_INSTRUCTIONS in message and '### Text 3\nc' in message
+
+@patch('hermes.utils.llm.completion')
+def test_llm_processor_process_batch_splits_and_falls_back(mock_completion, mock_config):
+    def fake(**kwargs):
+        content = kwargs['messages'][1]['content']
+        if BATCH_INSTRUCTIONS in content:
+            return response('not json')
+        return response(content.split('Text: ')[1].upper())
+
+    mock_completion.side_effect = fake
+    mock_config['llm'].update({'batch_size': 2})
+    assert LLMProcessor(mock_config).process_batch(['a', 'b', 'c'], 'Up') == ['A', 'B', 'C']
+    messages = [user_message(call) for call in mock_completion.call_args_list]
+    # [a, b] is batched (and falls back after the unparsable answer); [c] is sent alone
+    assert len([m for m in messages if BATCH_INSTRUCTIONS in m]) == 1
+    assert len(messages) == 4
+
+@patch('hermes.utils.llm.time.sleep')
+@patch('hermes.utils.llm.completion')
+def test_llm_processor_retries_throttled_calls(mock_completion, mock_sleep, mock_config):
+    mock_completion.side_effect = [StatusError(429), StatusError(503), response('ok')]
+    config = {**mock_config, 'rate_limits': {'groq_llm': {'requests_per_minute': 30}}, 'retry': {'base_delay': 0.5}}
+    with patch('hermes.utils.llm.get_rate_limiter') as mock_limiter:
+        assert LLMProcessor(config).process('text', 'prompt') == 'ok'
+    assert mock_completion.call_count == 3
+    assert mock_sleep.call_count == 2
+    assert all(call.args[0] <= 1.0 for call in mock_sleep.call_args_list)
+    mock_limiter.assert_called_with('groq_llm', config['rate_limits'])
+    assert mock_limiter.return_value.acquire.call_count == 3
+
+@patch('hermes.utils.llm.completion')
+def test_llm_processor_does_not_retry_client_errors(mock_completion, mock_config):
+    mock_completion.side_effect = StatusError(400)
+    with pytest.raises(StatusError):
+        LLMProcessor(mock_config).process('text', 'prompt')
+    assert mock_completion.call_count == 1
@@ -0,0 +1,89 @@
+import io
+import json
+import sys
+import wave
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from hermes.strategies.provider import ProviderStrategy
+from hermes.strategies.provider import local
+from hermes.strategies.provider.local import LocalProviderStrategy
+
+def make_wav(samples, sample_rate=16000):
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(np.asarray(samples, dtype='<i2').tobytes())
+    return buffer.getvalue()
+
+@pytest.fixture
+def faster_whisper():
+    model = Mock()
+    model.transcribe.side_effect = lambda audio, **kwargs: (
+        iter([
+            SimpleNamespace(start=0.0, end=1.5, text=' Hello', avg_logprob=-0.1, no_speech_prob=0.01, words=None),
+            SimpleNamespace(start=1.5, end=3.0, text=' world.', avg_logprob=-0.2, no_speech_prob=0.02, words=None),
+        ]),
+        SimpleNamespace(language='en', duration=3.0),
+    )
+    module = SimpleNamespace(WhisperModel=Mock(return_value=model))
+    local._models.clear()
+    with patch.dict(sys.modules, {'faster_whisper': module}):
+        yield module
+    local._models.clear()
+
+def test_get_strategy_local():
+    assert isinstance(ProviderStrategy.get_strategy('local'), LocalProviderStrategy)
+
+def test_local_transcribe_text(faster_whisper):
+    strategy = LocalProviderStrategy()
+    result = strategy.transcribe(make_wav([0, 16384, -16384]), {'model': 'base', 'response_format': 'text'})
+
+    assert result == 'Hello world.'
+    faster_whisper.WhisperModel.assert_called_once()
+    args, kwargs = faster_whisper.WhisperModel.call_args
+    assert args == ('base',)
+    assert kwargs['device'] == 'cpu'
+    assert kwargs['compute_type'] == 'int8'
+    audio = faster_whisper.WhisperModel.return_value.transcribe.call_args.args[0]
+    assert audio.dtype == np.float32
+    assert audio.tolist() == [0.0, 0.5, -0.5]
+
+def test_local_model_stays_resident(faster_whisper):
+    LocalProviderStrategy().transcribe(make_wav([0] * 160), {'model': 'base'})
+    LocalProviderStrategy().transcribe(make_wav([0] * 160), {'model': 'base'})
+    LocalProviderStrategy().transcribe(make_wav([0] * 160), {'model': 'small'})
+
+    assert faster_whisper.WhisperModel.call_count == 2
+    assert faster_whisper.WhisperModel.return_value.transcribe.call_count == 3
+
+def test_local_model_aliases(faster_whisper):
+    LocalProviderStrategy().transcribe(make_wav([0] * 160), {'model': 'distil-whisper-large-v3-en'})
+    assert faster_whisper.WhisperModel.call_args.args == ('distil-large-v3',)
+
+def test_local_cpu_threads_from_config(faster_whisper):
+    LocalProviderStrategy({'local': {'cpu_threads': 3, 'compute_type': 'int8_float32'}}).transcribe(make_wav([0] * 160), {'model': 'base'})
+    kwargs = faster_whisper.WhisperModel.call_args.kwargs
+    assert kwargs['cpu_threads'] == 3
+    assert kwargs['compute_type'] == 'int8_float32'
+
+def test_local_transcribe_srt(faster_whisper):
+    result = LocalProviderStrategy().transcribe(make_wav([0] * 160), {'model': 'base', 'response_format': 'srt'})
+    assert result == "1\n00:00:00,000 --> 00:00:01,500\nHello\n\n2\n00:00:01,500 --> 00:00:03,000\nworld.\n"
+
+def test_local_transcribe_verbose_json(faster_whisper):
+    result = json.loads(LocalProviderStrategy().transcribe(make_wav([0] * 160), {'model': 'base', 'response_format': 'verbose_json'}))
+    assert result['text'] == 'Hello world.'
+    assert result['language'] == 'en'
+    assert [segment['start'] for segment in result['segments']] == [0.0, 1.5]
+
+def test_local_missing_dependency():
+    local._models.clear()
+    with patch.dict(sys.modules, {'faster_whisper': None}):
+        with pytest.raises(ImportError, match=r"hermes\[local\]"):
+            LocalProviderStrategy().transcribe(make_wav([0] * 160), {'model': 'base'})
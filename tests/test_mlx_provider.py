@@ -0,0 +1,104 @@
+import io
+import json
+import os
+import sys
+import wave
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from hermes.strategies.provider import mlx
+from hermes.strategies.provider.mlx import MLXProviderStrategy
+
+def make_wav(samples, sample_rate=16000):
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(np.asarray(samples, dtype='<i2').tobytes())
+    return buffer.getvalue()
+
+@pytest.fixture
+def mlx_whisper():
+    backend = SimpleNamespace(transcribe=Mock(return_value={
+        'text': ' Hello world.',
+        'language': 'en',
+        'segments': [
+            {'start': 0.0, 'end': 1.0, 'text': ' Hello'},
+            {'start': 1.0, 'end': 2.0, 'text': ' world.'},
+        ],
+    }))
+    mlx._backend = None
+    with patch.dict(sys.modules, {'mlx_whisper': backend}):
+        yield backend
+    mlx._backend = None
+
+@pytest.fixture
+def no_mlx_whisper():
+    mlx._backend = None
+    with patch.dict(sys.modules, {'mlx_whisper': None}):
+        yield
+    mlx._backend = None
+
+def test_mlx_in_process_passes_audio_array(mlx_whisper):
+    result = MLXProviderStrategy().transcribe(make_wav([0, 16384]), {'model': 'mlx-community/test-model'})
+
+    assert result == 'Hello world.'
+    args, kwargs = mlx_whisper.transcribe.call_args
+    assert args[0].dtype == np.float32
+    assert args[0].tolist() == [0.0, 0.5]
+    assert kwargs['path_or_hf_repo'] == 'mlx-community/test-model'
+
+def test_mlx_backend_is_imported_once(mlx_whisper):
+    with patch('hermes.strategies.provider.mlx.subprocess.run') as mock_run:
+        for _ in range(3):
+            MLXProviderStrategy().transcribe(make_wav([0] * 160), {})
+    assert mlx_whisper.transcribe.call_count == 3
+    assert mlx._backend is mlx_whisper
+    mock_run.assert_not_called()
+
+def test_mlx_in_process_srt(mlx_whisper):
+    result = MLXProviderStrategy().transcribe(make_wav([0] * 160), {'response_format': 'srt'})
+    assert result.startswith("1\n00:00:00,000 --> 00:00:01,000\nHello\n")
+
+def test_mlx_in_process_verbose_json(mlx_whisper):
+    result = json.loads(MLXProviderStrategy().transcribe(make_wav([0] * 160), {'response_format': 'verbose_json'}))
+    assert result['language'] == 'en'
+    assert [segment['text'] for segment in result['segments']] == [' Hello', ' world.']
+
+def test_mlx_subprocess_fallback_cleans_up(no_mlx_whisper):
+    created = []
+
+    def fake_mlx_whisper(command, capture_output, text):
+        audio_path, output_dir = command[1], command[5]
+        created.append(audio_path)
+        with open(os.path.join(output_dir, os.path.basename(audio_path) + '.txt'), 'w') as f:
+            f.write('MLX transcription result')
+        return SimpleNamespace(returncode=0, stderr='')
+
+    with patch('hermes.strategies.provider.mlx.subprocess.run', side_effect=fake_mlx_whisper) as mock_run:
+        result = MLXProviderStrategy().transcribe(b'audio data', {'model': 'mlx-community/test-model'})
+
+    assert result == 'MLX transcription result'
+    command = mock_run.call_args.args[0]
+    assert command[0] == 'mlx_whisper'
+    assert command[2:4] == ['--model', 'mlx-community/test-model']
+    assert not os.path.exists(os.path.dirname(created[0]))
+
+def test_mlx_subprocess_failure(no_mlx_whisper):
+    with patch('hermes.strategies.provider.mlx.subprocess.run', return_value=SimpleNamespace(returncode=1, stderr='boom')):
+        with pytest.raises(RuntimeError, match='boom'):
+            MLXProviderStrategy().transcribe(b'audio data', {})
+
+def test_mlx_forced_modes(mlx_whisper):
+    with patch('hermes.strategies.provider.mlx.subprocess.run', return_value=SimpleNamespace(returncode=1, stderr='cli')):
+        with pytest.raises(RuntimeError, match='cli'):
+            MLXProviderStrategy({'mlx': {'mode': 'subprocess'}}).transcribe(make_wav([0] * 160), {})
+    mlx_whisper.transcribe.assert_not_called()
+
+def test_mlx_inprocess_mode_requires_backend(no_mlx_whisper):
+    with pytest.raises(ImportError, match=r'hermes\[mlx\]'):
+        MLXProviderStrategy({'mlx': {'mode': 'inprocess'}}).transcribe(make_wav([0] * 160), {})
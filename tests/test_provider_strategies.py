@@ -17,7 +17,7 @@ def test_get_strategy():
         ProviderStrategy.get_strategy('invalid_provider')
 
 @patch('os.getenv')
-@patch('requests.post')
+@patch('requests.Session.post')
 def test_groq_provider_strategy(mock_post, mock_getenv):
     mock_getenv.return_value = 'fake_api_key'
     mock_response = Mock()
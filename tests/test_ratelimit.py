@@ -0,0 +1,132 @@
+import asyncio
+import pytest
+from unittest.mock import Mock, patch
+from hermes.utils.ratelimit import (
+    TokenBucket, RateLimiter, backoff_delay, retry_after_seconds,
+    send_with_retries, asend_with_retries, configure_rate_limiter, get_rate_limiter,
+)
+
+def make_response(status_code, headers=None):
+    return Mock(status_code=status_code, headers=headers or {})
+
+@patch('hermes.utils.ratelimit.time.monotonic')
+def test_token_bucket_reserve(mock_monotonic):
+    mock_monotonic.return_value = 0.0
+    bucket = TokenBucket(rate=1.0, capacity=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 1.0
+    assert bucket.reserve() == 2.0
+    mock_monotonic.return_value = 10.0
+    assert bucket.reserve() == 0.0
+
+@patch('hermes.utils.ratelimit.time.monotonic', return_value=0.0)
+def test_rate_limiter_audio_quota(mock_monotonic):
+    limiter = RateLimiter(requests_per_minute=60, audio_seconds_per_hour=3600)
+    assert limiter.reserve(audio_seconds=3600) == 0.0
+    # The audio bucket is empty now: 60 more seconds of audio take 60 seconds to refill
+    assert limiter.reserve(audio_seconds=60) == pytest.approx(60.0)
+
+def test_rate_limiter_unlimited():
+    limiter = RateLimiter()
+    assert limiter.reserve(audio_seconds=10 ** 6) == 0.0
+
+def test_retry_after_seconds():
+    assert retry_after_seconds(make_response(429, {'Retry-After': '7'})) == 7.0
+    assert retry_after_seconds(make_response(429, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})) == 0.0
+    assert retry_after_seconds(make_response(429)) is None
+    assert retry_after_seconds(make_response(429, {'Retry-After': 'soon'})) is None
+
+def test_backoff_delay():
+    assert backoff_delay(3, retry_after=12.0) == 12.0
+    assert backoff_delay(3, retry_after=120.0, max_delay=60.0) == 120.0
+    with patch('hermes.utils.ratelimit.random.uniform', side_effect=lambda low, high: high):
+        assert backoff_delay(0) == 1.0
+        assert backoff_delay(3) == 8.0
+        assert backoff_delay(10) == 60.0
+
+@patch('hermes.utils.ratelimit.time.sleep')
+def test_send_with_retries_respects_retry_after(mock_sleep):
+    send = Mock(side_effect=[make_response(429, {'Retry-After': '3'}), make_response(503), make_response(200)])
+    with patch('hermes.utils.ratelimit.random.uniform', return_value=0.5):
+        response = send_with_retries(send, RateLimiter())
+    assert response.status_code == 200
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [3.0, 0.5]
+
+@patch('hermes.utils.ratelimit.time.sleep')
+def test_send_with_retries_charges_audio_once(mock_sleep):
+    limiter = Mock()
+    send = Mock(side_effect=[make_response(503), make_response(503), make_response(200)])
+    send_with_retries(send, limiter, audio_seconds=30.0)
+    assert [call.args[0] for call in limiter.acquire.call_args_list] == [30.0, 0.0, 0.0]
+
+@patch('hermes.utils.ratelimit.time.sleep')
+def test_send_with_retries_stops_on_long_retry_after(mock_sleep):
+    send = Mock(return_value=make_response(429, {'Retry-After': '120'}))
+    response = send_with_retries(send, RateLimiter(), retry={'max_delay': 60.0})
+    assert response.status_code == 429
+    send.assert_called_once()
+    mock_sleep.assert_not_called()
+
+@patch('hermes.utils.ratelimit.time.sleep')
+def test_send_with_retries_gives_up(mock_sleep):
+    send = Mock(return_value=make_response(500))
+    response = send_with_retries(send, RateLimiter(), retry={'max_retries': 2})
+    assert response.status_code == 500
+    assert send.call_count == 3
+
+@patch('hermes.utils.ratelimit.time.sleep')
+def test_send_with_retries_does_not_retry_client_errors(mock_sleep):
+    send = Mock(return_value=make_response(400))
+    assert send_with_retries(send, RateLimiter()).status_code == 400
+    send.assert_called_once()
+    mock_sleep.assert_not_called()
+
+@patch('hermes.utils.ratelimit.time.sleep')
+def test_send_with_retries_transport_errors(mock_sleep):
+    send = Mock(side_effect=[ConnectionError('reset'), make_response(200)])
+    assert send_with_retries(send, RateLimiter(), retry_exceptions=(ConnectionError,)).status_code == 200
+    with pytest.raises(ConnectionError):
+        send_with_retries(Mock(side_effect=ConnectionError('reset')), RateLimiter(), retry={'max_retries': 1}, retry_exceptions=(ConnectionError,))
+
+def test_asend_with_retries():
+    responses = iter([make_response(429, {'Retry-After': '0'}), make_response(200)])
+
+    async def send():
+        return next(responses)
+
+    assert asyncio.run(asend_with_retries(send, RateLimiter())).status_code == 200
+
+def test_configure_rate_limiter_is_shared():
+    limiter = configure_rate_limiter('test-provider', requests_per_minute=10)
+    assert get_rate_limiter('test-provider') is limiter
+
+def test_get_rate_limiter_uses_the_given_limits():
+    fast = get_rate_limiter('limits-provider', {'limits-provider': {'requests_per_minute': 600}})
+    slow = get_rate_limiter('limits-provider', {'limits-provider': {'requests_per_minute': 6}})
+    assert fast is not slow
+    assert get_rate_limiter('limits-provider', {'limits-provider': {'requests_per_minute': 6}}) is slow
+    assert slow.requests.rate == pytest.approx(0.1)
+
+@patch.dict('os.environ', {'GROQ_API_KEY': 'fake_api_key'})
+@patch('hermes.utils.ratelimit.time.sleep')
+@patch('requests.Session.post')
+def test_groq_provider_retries_throttled_requests(mock_post, mock_sleep):
+    from hermes.strategies.provider.groq import GroqProviderStrategy
+    ok = make_response(200)
+    ok.text = 'Transcription result'
+    mock_post.side_effect = [make_response(429, {'Retry-After': '2'}), ok]
+
+    assert GroqProviderStrategy().transcribe(b'audio data') == 'Transcription result'
+    assert mock_post.call_count == 2
+    mock_sleep.assert_called_once_with(2.0)
+
+@patch.dict('os.environ', {'GROQ_API_KEY': 'fake_api_key'})
+@patch('requests.Session.post')
+def test_groq_provider_charges_the_given_duration(mock_post):
+    from hermes.strategies.provider.groq import GroqProviderStrategy
+    mock_post.return_value = make_response(200)
+    strategy = GroqProviderStrategy({'rate_limits': {'groq': {'audio_seconds_per_hour': 3600}}})
+    # 1 KB of compressed audio would be estimated at a fraction of a second
+    strategy.transcribe(b'\x1aE\xdf\xa3' + b'\0' * 1024, duration=600.0)
+    assert strategy._rate_limiter().audio.tokens == pytest.approx(3000, abs=1)
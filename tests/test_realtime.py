@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+from unittest.mock import patch, Mock
+
+from hermes.utils.realtime import AudioCapture, RingBuffer, SpeechWindower, SyntheticCapture, MicrophoneCapture
+
+SAMPLE_RATE = 16000
+
+def tone(seconds, amplitude=8000):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (np.sin(2 * np.pi * 220 * t) * amplitude).astype(np.int16)
+
+def silence(seconds):
+    return np.random.default_rng(0).normal(0, 30, int(seconds * SAMPLE_RATE)).astype(np.int16)
+
+def test_ring_buffer_fifo():
+    buffer = RingBuffer(8)
+    buffer.write(np.arange(5))
+    assert buffer.read(3).tolist() == [0, 1, 2]
+    buffer.write(np.arange(5, 10))
+    assert buffer.read().tolist() == [3, 4, 5, 6, 7, 8, 9]
+    assert buffer.dropped == 0
+
+def test_ring_buffer_overwrites_oldest():
+    buffer = RingBuffer(4)
+    buffer.write(np.arange(6))
+    assert buffer.dropped == 2
+    assert buffer.read().tolist() == [2, 3, 4, 5]
+
+def test_ring_buffer_close():
+    buffer = RingBuffer(4)
+    buffer.write(np.arange(2))
+    buffer.close()
+    assert buffer.read().tolist() == [0, 1]
+    assert buffer.read() is None
+
+def test_ring_buffer_timeout():
+    assert RingBuffer(4).read(timeout=0.01).tolist() == []
+
+def test_synthetic_capture_yields_all_samples():
+    samples = np.arange(16000 * 3, dtype=np.int16)
+    capture = SyntheticCapture(samples, sample_rate=SAMPLE_RATE, buffer_seconds=0.5)
+    assert np.array_equal(np.concatenate(list(capture)), samples)
+
+def test_audio_capture_requires_start_and_stop():
+    class Incomplete(AudioCapture):
+        def _start(self):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+def test_windower_cuts_on_silence():
+    audio = np.concatenate([silence(1), tone(3), silence(1), tone(2.5), silence(2)])
+    windower = SpeechWindower(SAMPLE_RATE, min_silence_ms=500, padding_ms=200)
+    windows = []
+    for offset in range(0, len(audio), 1600):
+        windows += windower.feed(audio[offset:offset + 1600])
+    windows += windower.flush()
+
+    assert len(windows) == 2
+    (first_start, first), (second_start, second) = windows
+    assert first_start == pytest.approx(0.8, abs=0.05)
+    assert len(first) / SAMPLE_RATE == pytest.approx(3.7, abs=0.1)
+    assert second_start == pytest.approx(4.8, abs=0.05)
+
+def test_windower_bounds_window_length():
+    windower = SpeechWindower(SAMPLE_RATE, max_window=3.0)
+    windows = windower.feed(tone(7)) + windower.flush()
+    assert [len(samples) / SAMPLE_RATE for _, samples in windows] == pytest.approx([3.0, 3.0, 1.0], abs=0.05)
+    assert [start for start, _ in windows] == pytest.approx([0.0, 3.0, 6.0], abs=0.05)
+
+def test_windower_drops_silence():
+    windower = SpeechWindower(SAMPLE_RATE)
+    assert windower.feed(silence(5)) == []
+    assert windower.flush() == []
+
+def test_microphone_capture_uses_input_stream():
+    stream = Mock()
+    with patch('hermes.utils.realtime.sd') as mock_sd:
+        mock_sd.InputStream.return_value = stream
+        capture = MicrophoneCapture(sample_rate=SAMPLE_RATE)
+
+        def start():
+            capture._callback(np.arange(4, dtype=np.int16).reshape(-1, 1), 4, None, None)
+            capture.stop()
+        stream.start.side_effect = start
+
+        blocks = list(capture)
+
+    assert np.concatenate(blocks).tolist() == [0, 1, 2, 3]
+    kwargs = mock_sd.InputStream.call_args.kwargs
+    assert kwargs['samplerate'] == SAMPLE_RATE
+    assert kwargs['channels'] == 1
+    assert kwargs['dtype'] == 'int16'
+    stream.close.assert_called_once()
@@ -1,6 +1,17 @@
 import pytest
 from unittest.mock import patch, mock_open
 from hermes.strategies.source import SourceStrategy, AutoSourceStrategy
+from hermes.config import DEFAULT_CONFIG
+
+@pytest.fixture(autouse=True)
+def source_config(tmp_path):
+    # Keep the media cache out of the home directory; tests that need it enable it
+    config = {
+        'download': dict(DEFAULT_CONFIG['download']),
+        'media_cache': {'enabled': False, 'directory': str(tmp_path / 'media'), 'max_bytes': None},
+    }
+    with patch('hermes.strategies.source.base.CONFIG', config):
+        yield config
 
 def test_get_strategy():
     strategy = SourceStrategy.get_strategy('auto')
@@ -50,4 +61,83 @@ def test_auto_source_strategy_url_detection(mock_is_web, mock_is_youtube):
 
     mock_is_web.return_value = False
     assert not strategy.is_web_url('file:///path/to/audio.mp3')
-    assert not strategy.is_web_url('/path/to/audio.mp3')
\ No newline at end of file
+    assert not strategy.is_web_url('/path/to/audio.mp3')
+
+@patch('hermes.utils.audio.yt_dlp')
+def test_fetch_youtube_audio_keeps_native_stream(mock_yt_dlp, tmp_path):
+    from hermes.utils.audio import fetch_youtube_audio
+    ydl = mock_yt_dlp.YoutubeDL.return_value.__enter__.return_value
+    ydl.extract_info.return_value = {'id': 'abc', 'requested_downloads': [{'filepath': str(tmp_path / 'abc.webm')}]}
+
+    assert fetch_youtube_audio('https://youtu.be/abc', str(tmp_path)) == str(tmp_path / 'abc.webm')
+    options = mock_yt_dlp.YoutubeDL.call_args.args[0]
+    assert options['format'] == 'bestaudio/best'
+    assert 'postprocessors' not in options
+    assert options['outtmpl'].startswith(str(tmp_path))
+
+@patch('hermes.utils.audio.decode_to_wav', return_value=b'RIFF wav')
+@patch('hermes.utils.audio.fetch_youtube_audio', return_value='/tmp/x/abc.webm')
+def test_youtube_source_decodes_once(mock_fetch, mock_decode):
+    from hermes.strategies.source.youtube import YouTubeSourceStrategy
+    assert YouTubeSourceStrategy().get_audio('https://youtu.be/abc') == b'RIFF wav'
+    mock_decode.assert_called_once_with('/tmp/x/abc.webm', 16000)
+
+@patch('hermes.utils.download.download_and_decode', return_value=b'RIFF wav')
+def test_web_source_decodes_once(mock_download):
+    from hermes.strategies.source.web import WebSourceStrategy
+    assert WebSourceStrategy().get_audio('https://example.com/episode.m4a') == b'RIFF wav'
+    args, kwargs = mock_download.call_args
+    assert args == ('https://example.com/episode.m4a', 16000)
+    assert kwargs['segments'] == 1
+    assert kwargs['chunk_size'] > 0
+
+@patch('hermes.strategies.source.clipboard.get_clipboard_url')
+@patch('hermes.strategies.source.youtube.YouTubeSourceStrategy.get_audio', return_value=b'youtube wav')
+@patch('hermes.strategies.source.web.WebSourceStrategy.get_audio', return_value=b'web wav')
+def test_clipboard_source_routes_by_url(mock_web, mock_youtube, mock_url):
+    from hermes.strategies.source.clipboard import ClipboardSourceStrategy
+    mock_url.return_value = 'https://www.youtube.com/watch?v=abc'
+    assert ClipboardSourceStrategy().get_audio('clipboard') == b'youtube wav'
+    mock_url.return_value = 'https://example.com/a.mp3'
+    assert ClipboardSourceStrategy().get_audio('clipboard') == b'web wav'
+
+@patch('hermes.utils.audio.pyperclip')
+def test_get_clipboard_url(mock_pyperclip):
+    from hermes.utils.audio import get_clipboard_url
+    mock_pyperclip.paste.return_value = ' https://example.com/a.mp3\n'
+    assert get_clipboard_url() == 'https://example.com/a.mp3'
+    mock_pyperclip.paste.return_value = 'not a url'
+    with pytest.raises(ValueError):
+        get_clipboard_url()
+
+@patch('hermes.utils.audio.decode_to_wav', return_value=b'RIFF wav')
+@patch('hermes.utils.audio.fetch_youtube_audio', return_value='/tmp/x/abc.webm')
+def test_youtube_source_uses_media_cache(mock_fetch, mock_decode, source_config):
+    from hermes.strategies.source.youtube import YouTubeSourceStrategy
+    source_config['media_cache']['enabled'] = True
+    assert YouTubeSourceStrategy().get_audio('https://www.youtube.com/watch?v=abcdefghijk') == b'RIFF wav'
+    # Another URL form of the same video is served from the cache
+    assert YouTubeSourceStrategy().get_audio('https://youtu.be/abcdefghijk') == b'RIFF wav'
+    assert mock_fetch.call_count == 1
+    assert mock_decode.call_count == 1
+
+@patch('hermes.utils.download.fetch_validator')
+@patch('hermes.utils.download.download_and_decode', return_value=b'RIFF wav')
+def test_web_source_uses_media_cache_by_validator(mock_download, mock_validator, source_config):
+    from hermes.strategies.source.web import WebSourceStrategy
+    source_config['media_cache']['enabled'] = True
+    mock_validator.return_value = 'etag:"v1"'
+    for _ in range(2):
+        assert WebSourceStrategy().get_audio('https://example.com/a.mp3') == b'RIFF wav'
+    assert mock_download.call_count == 1
+
+    # A changed file has a new validator and is downloaded again
+    mock_validator.return_value = 'etag:"v2"'
+    WebSourceStrategy().get_audio('https://example.com/a.mp3')
+    assert mock_download.call_count == 2
+
+    # Without a validator the file is never served from the cache
+    mock_validator.return_value = None
+    WebSourceStrategy().get_audio('https://example.com/a.mp3')
+    WebSourceStrategy().get_audio('https://example.com/a.mp3')
+    assert mock_download.call_count == 4
@@ -0,0 +1,102 @@
+import json
+import pytest
+from hermes.utils.transcript import format_timestamp, parse_cues, segments_from_transcription, Segment, Transcript
+
+SRT_PART = """1
+00:00:00,000 --> 00:00:02,500
+Hello there
+
+2
+00:00:02,500 --> 00:00:04,000
+General Kenobi
+"""
+
+VTT_PART = """WEBVTT
+
+00:00:01.000 --> 00:00:03.000
+Second chunk
+"""
+
+def test_format_timestamp():
+    assert format_timestamp(3661.5) == '01:01:01,500'
+    assert format_timestamp(0.25, '.') == '00:00:00.250'
+
+def test_parse_cues_srt():
+    assert parse_cues(SRT_PART) == [(0.0, 2.5, 'Hello there'), (2.5, 4.0, 'General Kenobi')]
+
+def test_parse_cues_vtt():
+    assert parse_cues(VTT_PART) == [(1.0, 3.0, 'Second chunk')]
+
+def test_segment_slots():
+    segment = Segment('Hello', 1.0, 2.0, chunk_id=3)
+    assert segment.to_dict() == {'text': 'Hello', 'start': 1.0, 'end': 2.0, 'chunk_id': 3}
+    with pytest.raises(AttributeError):
+        segment.extra = True
+
+def test_segments_from_verbose_json():
+    transcription = json.dumps({'text': 'a b', 'segments': [
+        {'id': 0, 'start': 0.0, 'end': 1.0, 'text': ' a'},
+        {'id': 1, 'start': 1.0, 'end': 2.0, 'text': ' b', 'chunk_id': 4},
+    ]})
+    assert segments_from_transcription(transcription, offset=10.0, chunk_id=2) == [
+        Segment('a', 10.0, 11.0, 2),
+        Segment('b', 11.0, 12.0, 4),
+    ]
+
+def test_segments_from_text():
+    assert segments_from_transcription(' Hello there ', offset=5.0, chunk_id=1, duration=3.0) == [Segment('Hello there', 5.0, 8.0, 1)]
+    assert segments_from_transcription('') == []
+
+VERBOSE = {'text': ' a b', 'language': 'en', 'duration': 3.0, 'segments': [
+    {'id': 0, 'start': 0.0, 'end': 1.0, 'text': ' a', 'avg_logprob': -0.5},
+    {'id': 1, 'start': 1.0, 'end': 2.5, 'text': ' b'},
+]}
+
+def test_transcript_from_verbose_json():
+    transcript = Transcript.from_transcription(json.dumps(VERBOSE))
+    assert len(transcript) == 2
+    assert transcript.language == 'en' and transcript.duration == 3.0
+    assert transcript[0].confidence == pytest.approx(0.6065, abs=1e-4)
+    assert transcript[1].confidence is None
+    assert [segment.text for segment in transcript] == ['a', 'b']
+
+def test_transcript_from_srt_and_text():
+    assert [(s.text, s.start, s.end) for s in Transcript.from_transcription(SRT_PART)] == [
+        ('Hello there', 0.0, 2.5),
+        ('General Kenobi', 2.5, 4.0),
+    ]
+    transcript = Transcript.from_transcription(' Hello there ', duration=3.0)
+    assert list(transcript) == [Segment('Hello there', 0.0, 3.0)]
+    assert transcript.render('text') == 'Hello there'
+
+def test_transcript_renders_every_format():
+    transcript = Transcript.from_transcription(VERBOSE)
+    assert transcript.render('text') == 'a b'
+    assert json.loads(transcript.render('json')) == {'text': 'a b'}
+    assert parse_cues(transcript.render('srt')) == [(0.0, 1.0, 'a'), (1.0, 2.5, 'b')]
+    assert parse_cues(transcript.render('vtt')) == [(0.0, 1.0, 'a'), (1.0, 2.5, 'b')]
+    verbose = json.loads(transcript.render('verbose_json'))
+    assert verbose['duration'] == 3.0 and verbose['language'] == 'en'
+    assert [(s['start'], s['end'], s['text']) for s in verbose['segments']] == [(0.0, 1.0, 'a'), (1.0, 2.5, 'b')]
+    assert verbose['segments'][0]['avg_logprob'] == pytest.approx(-0.5, abs=1e-4)
+
+def test_transcript_dict_round_trip_is_columnar():
+    transcript = Transcript.from_transcription(VERBOSE)
+    data = json.loads(json.dumps(transcript.to_dict()))
+    assert data['segments']['start'] == [0.0, 1.0]
+    assert data['segments']['confidence'][1] is None
+    restored = Transcript.from_dict(data)
+    assert [(s.text, s.start, s.end, s.chunk_id) for s in restored] == [(s.text, s.start, s.end, s.chunk_id) for s in transcript]
+    assert restored[0].confidence == pytest.approx(transcript[0].confidence, abs=1e-4)
+    assert restored.render('srt') == transcript.render('srt')
+
+def test_transcript_concatenate_and_remap():
+    first = Transcript.from_transcription(VERBOSE)
+    second = Transcript.from_transcription({'text': 'c', 'duration': 2.0, 'segments': [{'start': 0.5, 'end': 1.5, 'text': 'c'}]})
+    merged = Transcript.concatenate([(3.0, second), (0.0, first)])
+    assert [(s.text, s.start, s.end, s.chunk_id) for s in merged] == [('a', 0.0, 1.0, 0), ('b', 1.0, 2.5, 0), ('c', 3.5, 4.5, 1)]
+    assert merged.render('text') == 'a b c'
+    assert merged.duration == 5.0
+    shifted = merged.remap(lambda t: t * 2)
+    assert [s.start for s in shifted] == [0.0, 2.0, 7.0]
+    assert [s.start for s in merged] == [0.0, 1.0, 3.5]